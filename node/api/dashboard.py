@@ -38,7 +38,11 @@ from core.constants import (
     TransactionContextMappingType,
     UserEntity,
 )
-from core.dependencies import EnsureAuthorized, get_database_instance
+from core.dependencies import (
+    EnsureAuthorized,
+    get_database_instance,
+    get_database_read_instance,
+)
 from databases import Database
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Query
 from fastapi import Path as PathParams
@@ -76,7 +80,7 @@ dashboard_router = APIRouter(
     description="An API endpoint that returns the data of the user based on their role.",
 )
 async def get_dashboard_data(
-    database_instance: Database = Depends(get_database_instance),
+    database_instance: Database = Depends(get_database_read_instance),
     entity_address_ref: AddressUUID
     | None = Depends(
         EnsureAuthorized(
@@ -286,7 +290,7 @@ async def get_dashboard_data(
     description="An API endpoint that returns generated students from the blockchain, solely from the association from where this institution user belongs.",
 )
 async def get_associated_students(
-    database_instance: Database = Depends(get_database_instance),
+    database_instance: Database = Depends(get_database_read_instance),
     org_user_address: AddressUUID
     | None = Depends(
         EnsureAuthorized(
@@ -358,7 +362,7 @@ async def get_user_profile(
             _as=UserEntity.STUDENT_DASHBOARD_USER, return_address_from_token=True
         )
     ),
-    database_instance: Database = Depends(get_database_instance),
+    database_instance: Database = Depends(get_database_read_instance),
 ) -> StudentEditableProperties:
     # - Get the information of this user.
     get_editable_info_query: Select = select(
@@ -472,7 +476,7 @@ async def save_user_profile(
 )
 async def get_portfolio(
     blockchain_instance: BlockchainMechanism | None = Depends(get_blockchain_instance),
-    database_instance: Database = Depends(get_database_instance),
+    database_instance: Database = Depends(get_database_read_instance),
     returned_address_ref: AddressUUID
     | None = Depends(
         EnsureAuthorized(
@@ -843,7 +847,7 @@ async def get_portfolio(
     description="An API endpoint that returns file resources with respect to the portfolio's setting regarding file resource accessibility.",
 )
 async def get_portfolio_file(
-    database_instance: Database = Depends(get_database_instance),
+    database_instance: Database = Depends(get_database_read_instance),
     address_ref: AddressUUID = PathParams(
         ..., title="The address reference from the portfolio."
     ),
@@ -973,7 +977,7 @@ async def get_portfolio_settings(
             _as=UserEntity.STUDENT_DASHBOARD_USER, return_address_from_token=True
         )
     ),
-    database_instance: Database = Depends(get_database_instance),
+    database_instance: Database = Depends(get_database_read_instance),
 ) -> PortfolioSettings:
 
     # - Ensure that this user has a transaction mapping `STUDENT_BASE`.
@@ -34,7 +34,7 @@ from sqlalchemy import func, select
 from sqlalchemy.sql.expression import Select
 
 from blueprint.schemas import EntityAddress
-from core.dependencies import get_database_instance
+from core.dependencies import get_database_read_instance
 from core.constants import UserEntity
 from blueprint.schemas import EntityAddressDetail
 
@@ -197,7 +197,7 @@ async def get_transaction(
     description="An API endpoint that returns all addresses that is recorded in blockchain.",
 )
 async def get_addresses(
-    database_instance: Database = Depends(get_database_instance),
+    database_instance: Database = Depends(get_database_read_instance),
 ) -> list[EntityAddress]:
     entity_addresses: list[EntityAddress] = []
 
@@ -260,7 +260,7 @@ async def get_addresses(
 async def get_address(
     uuid: AddressUUID,
     blockchain_instance: BlockchainMechanism | None = Depends(get_blockchain_instance),
-    database_instance: Database = Depends(get_database_instance),
+    database_instance: Database = Depends(get_database_read_instance),
 ) -> EntityAddressDetail:
 
     if not isinstance(blockchain_instance, BlockchainMechanism):
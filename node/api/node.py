@@ -42,6 +42,7 @@ from core.blockchain import BlockchainMechanism, get_blockchain_instance
 from core.constants import (
     ASYNC_TARGET_LOOP,
     BLOCKCHAIN_HASH_BLOCK_DIFFICULTY,
+    PROMETHEUS_TEXT_MEDIA_TYPE,
     AddressUUID,
     AssociatedNodeStatus,
     AuthAcceptanceCode,
@@ -56,9 +57,13 @@ from core.constants import (
     TransactionContextMappingType,
     UserEntity,
 )
+from core.miner import MiningEngine, compute_block_hash, get_mining_engine_instance
+from core.persistence import get_persistence_executor_instance
 from core.dependencies import (
     EnsureAuthorized,
+    ParseWirePayload,
     generate_consensus_sleep_time,
+    get_args_values,
     get_database_instance,
 )
 from cryptography.fernet import Fernet
@@ -70,10 +75,11 @@ from fastapi import (
     Form,
     Header,
     HTTPException,
+    Query,
     Response,
     UploadFile,
 )
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from pydantic import PydanticValueError
 from sqlalchemy import func, select
 from sqlalchemy.sql.expression import Insert, Select, Update
@@ -83,6 +89,7 @@ from core.constants import (
     CERTIFICATE_TOKEN_SECRET_KEY_MIDDLE_INDEX,
     CERTIFICATE_TOKEN_SECRET_KEY_START_INDEX,
 )
+from utils.http import get_http_client_instance
 from utils.processors import save_database_state_to_volume_storage
 from utils.processors import (
     validate_previous_consensus_negotiation,
@@ -131,6 +138,29 @@ async def get_node_info() -> NodeInformation:
     )
 
 
+@node_router.get(
+    "/metrics",
+    tags=[
+        NodeAPI.GENERAL_NODE_API.value,
+        NodeAPI.NODE_TO_NODE_API.value,
+    ],
+    response_class=PlainTextResponse,
+    summary="Fetch the metrics of this node.",
+    description="An API endpoint that returns the mining statistics, the HTTP client statistics and the persistence statistics of this node under the Prometheus text exposition format.",
+)
+async def get_node_metrics() -> PlainTextResponse:
+    mining_engine: MiningEngine | None = get_mining_engine_instance(
+        initialize=get_args_values().node_role is not NodeType.MASTER_NODE
+    )
+
+    return PlainTextResponse(
+        content=(mining_engine.get_metrics() if mining_engine is not None else "")
+        + get_http_client_instance().get_metrics()
+        + get_persistence_executor_instance().get_metrics(),
+        media_type=PROMETHEUS_TEXT_MEDIA_TYPE,
+    )
+
+
 """
 /consensus/echo | When received ensure its the master by fetching its info.
 /consensus/acknowledge | When acknowledging, give something, then it will return something.
@@ -162,7 +192,9 @@ async def get_node_info() -> NodeInformation:
     status_code=HTTPStatus.ACCEPTED,
 )
 async def receive_hashed_block(
-    context_from_archival_miner: ConsensusToMasterPayload,
+    context_from_archival_miner: ConsensusToMasterPayload = Depends(
+        ParseWirePayload(ConsensusToMasterPayload)
+    ),
     database_instance: Database = Depends(get_database_instance),
     blockchain_instance: BlockchainMechanism | None = Depends(get_blockchain_instance),
 ) -> ConsensusSuccessPayload:
@@ -187,6 +219,8 @@ async def receive_hashed_block(
                 and each_confirming_block.content_bytes_size
                 == context_from_archival_miner.hashed_block.content_bytes_size
                 and context_from_archival_miner.hashed_block.hash_block[:BLOCKCHAIN_HASH_BLOCK_DIFFICULTY] == "0" * BLOCKCHAIN_HASH_BLOCK_DIFFICULTY  # type: ignore # ! This should contain something.
+                and compute_block_hash(context_from_archival_miner.hashed_block)
+                == context_from_archival_miner.hashed_block.hash_block
                 and each_confirming_block.contents.timestamp
                 == context_from_archival_miner.hashed_block.contents.timestamp
             ):
@@ -254,12 +288,36 @@ async def receive_hashed_block(
             )
         )
 
-        await gather(
-            database_instance.execute(update_consensus_negotiation_query),
-            database_instance.execute(update_associate_state_query),
-            save_database_state_to_volume_storage(),
+        await database_instance.execute(update_consensus_negotiation_query)
+
+        # - The miner may have received a batch of blocks, wherein it is only available once every block from the batch has been returned.
+        remaining_consensus_negotiations_query: Select = (
+            select([func.count()])
+            .select_from(consensus_negotiation)
+            .where(
+                (
+                    consensus_negotiation.c.peer_address
+                    == context_from_archival_miner.miner_address
+                )
+                & (
+                    consensus_negotiation.c.status
+                    == ConsensusNegotiationStatus.ON_PROGRESS
+                )
+            )
         )
 
+        if not await database_instance.fetch_val(
+            remaining_consensus_negotiations_query
+        ):
+            await database_instance.execute(update_associate_state_query)
+
+        else:
+            logger.info(
+                f"Archival miner node {context_from_archival_miner.miner_address} remains as {AssociatedNodeStatus.CURRENTLY_HASHING.name}, as it has blocks that were not yet returned."
+            )
+
+        await save_database_state_to_volume_storage()
+
         # - Since we lost the identity value of the enums from the fields, we need to re-bind them so that the loaded block from memory has a referrable enum when called.
         for transaction_idx, transaction_context in enumerate(
             context_from_archival_miner.hashed_block.contents.transactions
@@ -364,7 +422,9 @@ async def receive_hashed_block(
     ],
 )
 async def receive_raw_block(
-    context_from_master: ConsensusFromMasterPayload,
+    context_from_master: ConsensusFromMasterPayload = Depends(
+        ParseWirePayload(ConsensusFromMasterPayload)
+    ),
     blockchain_instance: BlockchainMechanism | None = Depends(get_blockchain_instance),
     database_instance: Database = Depends(get_database_instance),
 ) -> Response:
@@ -803,7 +863,7 @@ async def certify_miner(
     "/pull_chain_upstream",
     tags=[NodeAPI.NODE_TO_NODE_API.value, NodeAPI.MASTER_NODE_API.value],
     summary=f"Requests the blockchain file as-is from the '{NodeType.MASTER_NODE.name}'.",
-    description=f"A special API endpoint that allows '{NodeType.ARCHIVAL_MINER_NODE.name}' to fetch the latest version of the blockchain file from the '{NodeType.MASTER_NODE.name}'. This is mandatory before allowing the node to hash or participate from the blockchain.",
+    description=f"A special API endpoint that allows '{NodeType.ARCHIVAL_MINER_NODE.name}' to fetch the latest version of the blockchain file from the '{NodeType.MASTER_NODE.name}'. This is mandatory before allowing the node to hash or participate from the blockchain. The blockchain file is streamed by chunks, where its hash and height is returned from the headers.",
     dependencies=[
         Depends(
             EnsureAuthorized(
@@ -814,7 +874,7 @@ async def certify_miner(
 )
 async def pull_chain_upstream(
     blockchain_instance: BlockchainMechanism | None = Depends(get_blockchain_instance),
-) -> JSONResponse:
+) -> StreamingResponse:
 
     if isinstance(blockchain_instance, BlockchainMechanism):
         await blockchain_instance.insert_internal_transaction(
@@ -828,11 +888,16 @@ async def pull_chain_upstream(
             ),
         )
 
-        return JSONResponse(
-            content={
-                "current_hash": await blockchain_instance.get_chain_hash(),
-                "content": await blockchain_instance.get_chain(),
+        # - Stream the blockchain file by chunks instead of loading it in memory, wherein the hash is returned from the headers.
+        chain_hash, chain_content = blockchain_instance.get_chain()
+
+        return StreamingResponse(
+            content=chain_content,
+            headers={
+                "x-hash": chain_hash,
+                "x-height": str(blockchain_instance.get_chain_height()),
             },
+            media_type="application/x-ndjson",
             status_code=HTTPStatus.OK,
         )
 
@@ -842,6 +907,67 @@ async def pull_chain_upstream(
     )
 
 
+@node_router.get(
+    "/pull_blocks",
+    tags=[NodeAPI.NODE_TO_NODE_API.value, NodeAPI.MASTER_NODE_API.value],
+    summary=f"Requests the blocks after the given block ID from the '{NodeType.MASTER_NODE.name}'.",
+    description=f"A special API endpoint that allows '{NodeType.ARCHIVAL_MINER_NODE.name}' to fetch the blocks that it lacks from the '{NodeType.MASTER_NODE.name}', instead of fetching the whole blockchain file. Blocks are streamed in a line-delimited JSON, where the hash and the height of the blockchain after the last block is returned from the headers.",
+    dependencies=[
+        Depends(
+            EnsureAuthorized(
+                _as=UserEntity.ARCHIVAL_MINER_NODE_USER, blockchain_related=True
+            )
+        )
+    ],
+)
+async def pull_blocks(
+    from_id: int = Query(
+        ...,
+        ge=0,
+        description="The ID of the last block that the requestor has verified, wherein blocks after this ID will be returned.",
+    ),
+    blockchain_instance: BlockchainMechanism | None = Depends(get_blockchain_instance),
+) -> StreamingResponse:
+
+    if isinstance(blockchain_instance, BlockchainMechanism):
+        # - Refer the height once, so that the headers refer to the same set of blocks even when the blockchain grows while streaming.
+        chain_height: int = blockchain_instance.get_chain_height()
+
+        if from_id > chain_height:
+            raise HTTPException(
+                detail=f"Block #{from_id} does not exist from the blockchain of the '{NodeType.MASTER_NODE.name}'.",
+                status_code=HTTPStatus.NOT_ACCEPTABLE,
+            )
+
+        await blockchain_instance.insert_internal_transaction(
+            action=TransactionActions.NODE_GENERAL_CONSENSUS_BLOCK_SYNC,
+            data=NodeTransaction(
+                action=NodeTransactionInternalActions.SYNC,
+                context=NodeSyncTransaction(
+                    requestor_address=AddressUUID(blockchain_instance.node_identity[0]),
+                    timestamp=datetime.now(),
+                ),
+            ),
+        )
+
+        return StreamingResponse(
+            content=blockchain_instance.get_block_lines(
+                from_height=from_id, to_height=chain_height
+            ),
+            headers={
+                "x-hash": await blockchain_instance.get_chain_hash(height=chain_height),  # type: ignore
+                "x-height": str(chain_height),
+            },
+            media_type="application/x-ndjson",
+            status_code=HTTPStatus.OK,
+        )
+
+    raise HTTPException(
+        detail="Cannot request for blocks when the blockchain instance has not bee initialized or is not yet ready.",
+        status_code=HTTPStatus.NOT_ACCEPTABLE,
+    )
+
+
 @node_router.post(
     "/verify_chain_hash",
     tags=[NodeAPI.NODE_TO_NODE_API.value, NodeAPI.MASTER_NODE_API.value],
@@ -860,14 +986,25 @@ async def verify_chain_hash(
         ...,
         description=f"The input hash that is going to be compared against the {NodeType.MASTER_NODE.name}.",
     ),
+    x_height: int
+    | None = Header(
+        None,
+        description="The height (number of blocks) of the blockchain where the input hash is going to be compared. Compares against the whole blockchain when not given.",
+    ),
     blockchain_instance: BlockchainMechanism | None = Depends(get_blockchain_instance),
 ) -> Response:
 
     is_hash_equal: bool = False
+    chain_height: int = 0
 
     if isinstance(blockchain_instance, BlockchainMechanism):
-        is_hash_equal = await blockchain_instance.get_chain_hash() == x_hash
+        chain_height = blockchain_instance.get_chain_height()
+        is_hash_equal = (
+            await blockchain_instance.get_chain_hash(height=x_height) == x_hash
+        )
 
+    # - Return the height of the blockchain so that the requestor can look for the block where it diverges.
     return Response(
-        status_code=HTTPStatus.OK if is_hash_equal else HTTPStatus.NOT_ACCEPTABLE
+        status_code=HTTPStatus.OK if is_hash_equal else HTTPStatus.NOT_ACCEPTABLE,
+        headers={"x-height": str(chain_height)},
     )
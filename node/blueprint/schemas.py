@@ -18,6 +18,7 @@ from core.constants import (
     CredentialContext,
     HashUUID,
     HTTPQueueMethods,
+    HTTPRequestCategory,
     JWTToken,
     NodeTransactionInternalActions,
     NodeType,
@@ -312,10 +313,10 @@ class Transaction(TransactionOverview, BaseModel):
 
 
 class HashableBlock(BaseModel):
-    nonce: int | None
     validator: AddressUUID
     timestamp: datetime
     transactions: list[Transaction]
+    nonce: int | None  # ! Keep this as the last field, see `core.miner.get_block_hash_template`.
 
 
 class BaseBlock(BaseModel):
@@ -329,6 +330,41 @@ class Block(BaseBlock):
     contents: HashableBlock
 
 
+class MiningWorkerStatistics(BaseModel):
+    worker_id: int
+    attempts: int
+    elapsed_seconds: float
+    hash_rate: float
+
+
+class MinedBlockStatistics(BaseModel):
+    block_id: int
+    attempts: int
+    elapsed_seconds: float
+    hash_rate: float
+
+
+class MiningStatistics(BaseModel):
+    workers: int
+    is_mining: bool
+    current_block_id: int | None
+    current_attempts: int
+    current_elapsed_seconds: float
+    current_hash_rate: float
+    blocks_mined: int
+    total_attempts: int
+    total_elapsed_seconds: float
+    history: list[MinedBlockStatistics]
+
+
+class BlockMiningResult(BaseModel):
+    nonce: int
+    hash_block: HashUUID
+    worker_id: int
+    elapsed_seconds: float
+    workers: list[MiningWorkerStatistics]
+
+
 # # Block Structure — END
 
 # # APIs
@@ -341,6 +377,13 @@ class ArchivalMinerNodeInformation(BaseModel):
     source_port: int
 
 
+class ArchivalMinerNodeHealth(BaseModel):
+    latency_seconds: float | None  # * Smoothed latency of the probes.
+    hash_rate: float | None  # * Hashes per second reported by the miner.
+    consecutive_failures: int = 0
+    backoff_until: datetime | None
+
+
 class ConsensusSuccessPayload(BaseModel):
     reiterate_master_address: AddressUUID
     addon_consensus_sleep_seconds: float
@@ -367,6 +410,7 @@ class NodeConsensusInformation(BaseModel):
     node_role: NodeType
     current_consensus_sleep_timer: timedelta
     last_mined_block: int
+    mining: MiningStatistics | None  # * `None` when the mining engine was not initialized, such as from the master node.
 
 
 class NodeMasterInformation(BaseModel):
@@ -599,6 +643,26 @@ class HTTPRequestPayload(BaseModel):
         ...,
         description="The name of this HTTP request, required whenever `await_result_immediate` is set to `True`.",
     )
+    category: HTTPRequestCategory = Field(
+        HTTPRequestCategory.DEFAULT,
+        description="The category of this HTTP request, wherein its timeouts were defaulted from.",
+    )
+    connect_timeout: float | None = Field(
+        None,
+        description="The seconds to wait for the connection to the host to be established.",
+    )
+    read_timeout: float | None = Field(
+        None,
+        description="The seconds to wait between each read of the response.",
+    )
+    total_timeout: float | None = Field(
+        None,
+        description="The seconds to wait for the whole request to finish.",
+    )
+    media_type: str | None = Field(
+        None,
+        description="The media type of which the `data` is encoded with, wherein `None` lets `aiohttp` encode it as JSON.",
+    )
 
 
 # # Uncategorized
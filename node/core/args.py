@@ -10,16 +10,26 @@ You should have received a copy of the GNU General Public License along with Fol
 """
 
 from argparse import ArgumentParser
+from os import cpu_count
 from re import Pattern, compile
 
 from core.constants import (
     AUTH_ENV_FILE_NAME,
+    BLOCKCHAIN_MAX_BLOCKS_IN_FLIGHT,
+    DATABASE_SNAPSHOT_INTERVAL_SECONDS,
     ENUM_NAME_PATTERN,
     FOLIOBLOCKS_EPILOG,
     FOLIOBLOCKS_HELP,
     FOLIOBLOCKS_NODE_DESCRIPTION,
     FOLIOBLOCKS_NODE_TITLE,
+    HTTP_COMPRESSION_MIN_SIZE_BYTES,
+    HTTP_GZIP_COMPRESSION_LEVEL,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_CONNECTIONS_PER_HOST,
+    HTTP_ZSTD_COMPRESSION_LEVEL,
     ArgumentParameter,
+    DatabaseProfile,
+    DatabaseSnapshotMode,
     LoggerLevelCoverage,
     NodeType,
 )
@@ -36,7 +46,7 @@ args_handler = ArgumentParser(
 compiled_pattern: Pattern[str] = compile(
     ENUM_NAME_PATTERN
 )  # * Prepare the RegExpression.
-for each_enum in [LoggerLevelCoverage, NodeType]:
+for each_enum in [DatabaseProfile, DatabaseSnapshotMode, LoggerLevelCoverage, NodeType]:
     temp_choice: list[str] = []
     re_matched: list[str] = compiled_pattern.findall(
         each_enum.__name__,
@@ -48,12 +58,55 @@ for each_enum in [LoggerLevelCoverage, NodeType]:
     eval_enum_name: str = "".join([letters for letters in re_matched])
     locals()[f"_injected_{eval_enum_name.lower()}_choices"] = temp_choice
 
+args_handler.add_argument(
+    "-ct",
+    "--compression-threshold",
+    action="store",
+    default=HTTP_COMPRESSION_MIN_SIZE_BYTES,
+    help=FOLIOBLOCKS_HELP[ArgumentParameter("COMPRESSION_THRESHOLD")],
+    type=int,
+    required=False,
+)
+args_handler.add_argument(
+    "-dp",
+    "--database-profile",
+    choices=locals()["_injected_dp_choices"],
+    default=DatabaseProfile.WAL.name,
+    help=FOLIOBLOCKS_HELP[ArgumentParameter("DATABASE_PROFILE")],
+)
+args_handler.add_argument(
+    "-dsi",
+    "--database-snapshot-interval",
+    action="store",
+    default=DATABASE_SNAPSHOT_INTERVAL_SECONDS,
+    help=FOLIOBLOCKS_HELP[ArgumentParameter("DATABASE_SNAPSHOT_INTERVAL")],
+    type=float,
+    required=False,
+)
+args_handler.add_argument(
+    "-dsm",
+    "--database-snapshot-mode",
+    choices=locals()["_injected_dsm_choices"],
+    default=DatabaseSnapshotMode.INCREMENTAL.name,
+    help=FOLIOBLOCKS_HELP[ArgumentParameter("DATABASE_SNAPSHOT_MODE")],
+)
 args_handler.add_argument(
     "-dm",
     "--deploy-mode",
     action="store_true",
     help=FOLIOBLOCKS_HELP[ArgumentParameter("DEPLOYED_DOCKER_MODE")],
 )
+args_handler.add_argument(
+    "-gl",
+    "--gzip-level",
+    action="store",
+    choices=range(1, 10),
+    default=HTTP_GZIP_COMPRESSION_LEVEL,
+    help=FOLIOBLOCKS_HELP[ArgumentParameter("GZIP_LEVEL")],
+    metavar="LEVEL",
+    type=int,
+    required=False,
+)
 args_handler.add_argument(
     "-kf",
     "--key-file",
@@ -68,6 +121,42 @@ args_handler.add_argument(
     help=FOLIOBLOCKS_HELP[ArgumentParameter("LOG_LEVEL")],
     default=LoggerLevelCoverage.INFO.value,
 )
+args_handler.add_argument(
+    "-mbf",
+    "--max-blocks-in-flight",
+    action="store",
+    default=BLOCKCHAIN_MAX_BLOCKS_IN_FLIGHT,
+    help=FOLIOBLOCKS_HELP[ArgumentParameter("MAX_BLOCKS_IN_FLIGHT")],
+    type=int,
+    required=False,
+)
+args_handler.add_argument(
+    "-mc",
+    "--max-connections",
+    action="store",
+    default=HTTP_MAX_CONNECTIONS,
+    help=FOLIOBLOCKS_HELP[ArgumentParameter("MAX_CONNECTIONS")],
+    type=int,
+    required=False,
+)
+args_handler.add_argument(
+    "-mch",
+    "--max-connections-per-host",
+    action="store",
+    default=HTTP_MAX_CONNECTIONS_PER_HOST,
+    help=FOLIOBLOCKS_HELP[ArgumentParameter("MAX_CONNECTIONS_PER_HOST")],
+    type=int,
+    required=False,
+)
+args_handler.add_argument(
+    "-mw",
+    "--mining-workers",
+    action="store",
+    default=cpu_count() or 1,
+    help=FOLIOBLOCKS_HELP[ArgumentParameter("MINING_WORKERS")],
+    type=int,
+    required=False,
+)
 args_handler.add_argument(
     "-nh",
     "--node-host",
@@ -110,3 +199,14 @@ args_handler.add_argument(
     type=int,
     required=False,
 )
+args_handler.add_argument(
+    "-zl",
+    "--zstd-level",
+    action="store",
+    choices=range(1, 23),
+    default=HTTP_ZSTD_COMPRESSION_LEVEL,
+    help=FOLIOBLOCKS_HELP[ArgumentParameter("ZSTD_LEVEL")],
+    metavar="LEVEL",
+    type=int,
+    required=False,
+)
@@ -1,18 +1,20 @@
 from argparse import Namespace
-from asyncio import create_task, gather, get_event_loop, sleep
+from asyncio import TimeoutError as AsyncTimeoutError
+from asyncio import Event, create_task, gather, sleep, wait_for
 from base64 import urlsafe_b64encode
 from copy import deepcopy
 from datetime import datetime, timedelta
 from hashlib import sha256
+from math import ceil
 from http import HTTPStatus
 from logging import Logger, getLogger
 from os import environ as env
+from os import replace as replace_file
 from pathlib import Path
 from secrets import token_hex, token_urlsafe
 from sqlite3 import IntegrityError
-from sys import maxsize as MAX_INT_PYTHON
-from time import time
-from typing import Any, Final, Mapping
+from time import perf_counter, time
+from typing import Any, AsyncIterator, Final, Mapping
 from uuid import uuid4
 
 from aiofiles import open as aopen
@@ -29,8 +31,10 @@ from blueprint.models import (
 from blueprint.schemas import (
     AdditionalContextTransaction,
     AgnosticCredentialValidator,
+    ArchivalMinerNodeHealth,
     ArchivalMinerNodeInformation,
     Block,
+    BlockMiningResult,
     BlockOverview,
     ConsensusSuccessPayload,
     GroupTransaction,
@@ -72,8 +76,15 @@ from sqlalchemy.sql.expression import Insert, Select, Update
 from starlette.datastructures import UploadFile as StarletteUploadFile
 from core.constants import BLOCKCHAIN_INDEX_COUNT_COVERAGE_TO_RECOVER_TXS
 from utils.email import EmailService, get_email_instance
-from utils.http import HTTPClient, get_http_client_instance
+from utils.http import (
+    HTTPClient,
+    HTTPClientTimeoutResponse,
+    HTTPRetryPolicy,
+    get_http_client_instance,
+    iterate_response_lines,
+)
 from utils.processors import (
+    compute_chain_rolling_digest,
     hash_context,
     save_database_state_to_volume_storage,
     unconventional_terminate,
@@ -88,22 +99,31 @@ from core.constants import (
     ADDRESS_UUID_KEY_PREFIX,
     ASYNC_TARGET_LOOP,
     BLOCK_HASH_LENGTH,
+    BLOCKCHAIN_BLOCK_MAX_SIZE_BYTES,
+    BLOCKCHAIN_BLOCK_MAX_TRANSACTIONS,
+    BLOCKCHAIN_BLOCK_MAX_TRANSACTION_AGE_SECONDS,
     BLOCKCHAIN_BLOCK_TIMER_IN_SECONDS,
     BLOCKCHAIN_FILENAME_RANDOM_CHAR_LENGTH,
     BLOCKCHAIN_GENESIS_MAX_CHAR_DATA,
     BLOCKCHAIN_GENESIS_MIN_CHAR_DATA,
     BLOCKCHAIN_HASH_BLOCK_DIFFICULTY,
+    BLOCKCHAIN_MINER_BACKOFF_BASE_SECONDS,
+    BLOCKCHAIN_MINER_BACKOFF_MAX_SECONDS,
+    BLOCKCHAIN_MINER_BLOCK_BATCH_SIZE,
+    BLOCKCHAIN_MINER_LATENCY_SMOOTHING_FACTOR,
     BLOCKCHAIN_MINIMUM_USER_TRANSACTIONS_TO_BLOCK,
     BLOCKCHAIN_NAME,
     BLOCKCHAIN_NEGOTIATION_ID_LENGTH,
     BLOCKCHAIN_NODE_JSON_TEMPLATE,
     BLOCKCHAIN_REQUIRED_GENESIS_BLOCKS,
+    BLOCKCHAIN_ROLLING_DIGEST_SEED,
     BLOCKCHAIN_SECONDS_TO_MINE_FROM_ARCHIVAL_MINER,
     BLOCKCHAIN_TIME_TRUNCATION_ON_TX_TO_BLOCK,
     FILE_PAYLOAD_TIMESTAMP_FORMAT_AS_KEY,
     FILE_PAYLOAD_TO_ADDRESS_CHAR_LIMIT_MAX,
     FILE_PAYLOAD_TO_ADDRESS_CHAR_LIMIT_MIN,
     FILE_PAYLOAD_TO_ADDRESS_START_TRUNCATION_INDEX,
+    HTTP_STREAM_CHUNK_SIZE_BYTES,
     INF,
     REF_MASTER_BLOCKCHAIN_ADDRESS,
     REF_MASTER_BLOCKCHAIN_PORT,
@@ -120,6 +140,7 @@ from core.constants import (
     ConsensusNegotiationStatus,
     HashUUID,
     HTTPQueueMethods,
+    HTTPRequestCategory,
     IdentityTokens,
     NodeTransactionInternalActions,
     NodeType,
@@ -141,6 +162,8 @@ from core.dependencies import (
     get_identity_tokens,
     get_master_node_properties,
 )
+from core.miner import MiningEngine, get_mining_engine_instance
+from core.persistence import get_persistence_executor_instance
 
 logger: Logger = getLogger(ASYNC_TARGET_LOOP)
 
@@ -150,6 +173,7 @@ class BlockchainMechanism(ConsensusMechanism):
         self,
         *,
         block_timer_seconds: int,
+        max_blocks_in_flight: int,
         auth_tokens: IdentityTokens,
         node_role: NodeType,
     ) -> None:
@@ -175,11 +199,32 @@ class BlockchainMechanism(ConsensusMechanism):
         ] = (
             []
         )  # * A container that contains geenrated blocks that were unsuccessfully sent to the archival miner node candidates. It is being used only when there's a connection disruption between each other.
+        self.__transaction_index: dict[
+            HashUUID, tuple[int, int]
+        ] = (
+            {}
+        )  # * A hash-keyed index that refers to the position (block index, transaction index) of every transaction from the in-memory chain. It is used to resolve a transaction without iterating the whole chain.
+        self.__address_transaction_index: dict[
+            AddressUUID, list[tuple[int, int]]
+        ] = (
+            {}
+        )  # * A posting list per address that contains the position (block index, transaction index) of every transaction in block order, wherein the address is either the sender or the receiver. It is used to resolve the transaction history of an address.
+        self.__miner_health: dict[
+            AddressUUID, ArchivalMinerNodeHealth
+        ] = (
+            {}
+        )  # * The health of every archival miner node that has been probed, which contains its latency, hash rate and its backoff from failing probes. This is exclusive for NodeType.MASTER_NODE.
 
         # # Counters
         self.main_block_id: int = 1  # * The ID of the block that allocatable and appendable from the blockchain.
         self.leading_block_id: int = 0  # * The current block ID that is available to assign from a block. It initially refers to the value of `self.main_block_id`, wherein this leads to ensure that while the master node waits for `self.main_block_id` to return, it will render other blocks to avoid congestion.
         self.__cached_total_transactions: int = 0
+        self.__transaction_container_size_bytes: int = 0  # * The size (in bytes) of the transactions from `self.__transaction_container`, wherein this was compared against `BLOCKCHAIN_BLOCK_MAX_SIZE_BYTES`.
+        self.__transaction_container_metadata: list[
+            tuple[int, float]
+        ] = (
+            []
+        )  # * The size (in bytes) and the time queued of every transaction from `self.__transaction_container`, in the same order. It is used to cut the transactions that a block can contain.
 
         # # Instances
         self.node_identity = auth_tokens  # - Equivalent to get_identity_tokens()
@@ -198,14 +243,27 @@ class BlockchainMechanism(ConsensusMechanism):
         self.block_timer_seconds: Final[
             int
         ] = block_timer_seconds  # * The timer from where the block should be generated.
+        self.max_blocks_in_flight: Final[
+            int
+        ] = max_blocks_in_flight  # * The number of blocks that can be created while the blocks before them were not yet appended to the blockchain.
+        self.__block_cut_event: Event = (
+            Event()
+        )  # * An event that wakes the block timer before it fires, whenever the transactions were sufficient to create a block.
         self.__hashing_duration: timedelta = timedelta(
             seconds=0
         )  # * The time it takes to hash the block, this is exclusive for NodeType.ARCHIVAL_MINER_NODE.
+        self.__pending_hashing_blocks: int = 0  # * The blocks received from the master node that were not yet hashed, this is exclusive for NodeType.ARCHIVAL_MINER_NODE.
 
         # # State and Variable References
         self.blockchain_ready: bool = False  # * This bool property is used for determining if the blockchain is ready to take its request from its master or side nodes.
         self.__new_master_instance: bool = False  # * This bool property will be used whenever when the context of the blockchain file is empty or not. Sets to true when its empty.
         self.__node_ready: bool = False  # * This bool property is used for determining if this node is ready in terms of participating from the master node, this is where the consensus will be used.
+        self.__chain_digests: list[
+            HashUUID
+        ] = (
+            []
+        )  # * The rolling digest of the blockchain file per height, wherein the digest of a block is chained from the digest of its previous block. The digest of the height `n` is located at index `n - 1`, while the height zero refers to `BLOCKCHAIN_ROLLING_DIGEST_SEED`.
+        self.__chain_file_size: int = 0  # * The size (in bytes) of the blockchain file that refers to the latest digest from `self.__chain_digests`. This is used to stream the blockchain file without including the block that is currently being written.
         self.__sleeping_from_consensus: bool = False  # * This bool property is used for determining if the node is under consensus sleep or not. This property is used as a dependency to state whether the node is ready or is the blockchain for other operations.
 
         super().__init__(
@@ -301,13 +359,23 @@ class BlockchainMechanism(ConsensusMechanism):
                             transaction_idx
                         ] = frozendict(transaction_data)
 
+                        # - [4] Refer the position of this transaction from the index, where the block index is the position of the block before it gets appended.
+                        self.__transaction_index[transaction_data["tx_hash"]] = (
+                            len(self.__chain["chain"]),
+                            transaction_idx,
+                        )
+                        self.__refer_transaction_to_address_index(
+                            transaction=transaction_data,
+                            location=(len(self.__chain["chain"]), transaction_idx),
+                        )
+
                         # @o Increment transaction by one as it was loaded in memory.
                         self.__cached_total_transactions += 1
 
-                    # - [4] Apply immutability on the contents, contaning a set of transaction/s.
+                    # - [5] Apply immutability on the contents, contaning a set of transaction/s.
                     block_context["contents"] = frozendict(block_context["contents"])
 
-                # - [5] Apply immutability from the whole block and then append it.
+                # - [6] Apply immutability from the whole block and then append it.
                 self.__chain["chain"].append(frozendict(block_context))
 
                 # ! Hit the next block for the allocation as we finished processing a block!
@@ -317,8 +385,15 @@ class BlockchainMechanism(ConsensusMechanism):
                 if self.leading_block_id < self.main_block_id:
                     self.leading_block_id = self.main_block_id
 
+                # - A block in-flight has been appended, wake the block timer when the transactions were already sufficient to create a block.
+                if (
+                    self.node_role is NodeType.MASTER_NODE
+                    and self.__is_block_cut_ready()
+                ):
+                    self.__block_cut_event.set()
+
                 await self.__process_blockchain_file_to_current_state(
-                    operation=BlockchainIOAction.TO_WRITE
+                    operation=BlockchainIOAction.TO_APPEND
                 )
 
                 if process_container:
@@ -404,34 +479,77 @@ class BlockchainMechanism(ConsensusMechanism):
     @ensure_blockchain_ready()
     def get_blockchain_private_state(self) -> NodeConsensusInformation:
         last_block: Block | None = self.__get_last_block()
+        mining_engine: MiningEngine | None = get_mining_engine_instance(
+            initialize=self.node_role is not NodeType.MASTER_NODE
+        )
 
         return NodeConsensusInformation(
             current_consensus_sleep_timer=self.__hashing_duration,
-            is_hashing=not self.blockchain_ready,
+            is_hashing=self.__pending_hashing_blocks > 0,
             is_sleeping=self.__node_ready and self.blockchain_ready,
             last_mined_block=last_block.id if last_block is not None else 0,
+            mining=mining_engine.get_statistics()
+            if mining_engine is not None
+            else None,
             node_role=self.node_role,
             owner=self.__auth_token[0],
         )
 
-    async def get_chain(self) -> str:
+    def get_chain(self) -> tuple[HashUUID, AsyncIterator[bytes]]:
+        """
+        Returns the digest of the blockchain file, along with an iterator that streams the blockchain file by chunks. The stream ends from the size of the file that refers to the returned digest, even if blocks were appended while streaming.
+        """
+        return (
+            self.__chain_digests[-1]
+            if len(self.__chain_digests)
+            else HashUUID(BLOCKCHAIN_ROLLING_DIGEST_SEED)
+        ), self.__read_chain_file(size=self.__chain_file_size)
+
+    async def __read_chain_file(self, *, size: int) -> AsyncIterator[bytes]:
         # ! These are late imports due to changes from the path as per the evaluation of the method `resolve_resources` at processors.py.
         from core.constants import BLOCKCHAIN_RAW_PATH
 
-        # Adjust function for forcing to save new data when fetched.
-        async with aopen(BLOCKCHAIN_RAW_PATH, "r") as chain_reader:
-            data: str = await chain_reader.read()
+        async with aopen(BLOCKCHAIN_RAW_PATH, "rb") as chain_reader:
+            while size > 0:
+                chain_chunk: bytes = await chain_reader.read(
+                    min(HTTP_STREAM_CHUNK_SIZE_BYTES, size)
+                )
+
+                if not chain_chunk:
+                    break
 
-        return data
+                size -= len(chain_chunk)
+                yield chain_chunk
 
-    async def get_chain_hash(self) -> HashUUID:
-        # ! These are late imports due to changes from the path as per the evaluation of the method `resolve_resources` at processors.py.
+    async def get_chain_hash(self, *, height: int | None = None) -> HashUUID | None:
+        """
+        Returns the rolling digest of the blockchain at the given `height` (number of blocks), or the digest of the whole blockchain when `height` is not given. Returns `None` when the height is beyond the blockchain.
+        """
+        if height is None:
+            height = len(self.__chain_digests)
+
+        if height < 0 or height > len(self.__chain_digests):
+            return None
 
-        get_chain_hash_query = select([file_signatures.c.hash_signature]).where(
-            file_signatures.c.filename == BLOCKCHAIN_NAME
+        return (
+            self.__chain_digests[height - 1]
+            if height
+            else HashUUID(BLOCKCHAIN_ROLLING_DIGEST_SEED)
         )
 
-        return HashUUID(await self.__database_instance.fetch_val(get_chain_hash_query))
+    def get_chain_height(self) -> int:
+        return len(self.__chain_digests)
+
+    async def get_block_lines(
+        self, *, from_height: int, to_height: int | None = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Yields the blocks after the given `from_height` up to `to_height` (inclusive), wherein each block is serialized as a line, equivalent to how it is written from the blockchain file.
+        """
+        for each_block in self.__chain["chain"][from_height:to_height]:
+            yield export_to_json(
+                each_block, default=self._process_block_serialization_to_file
+            ) + b"\n"
 
     @ensure_blockchain_ready()
     async def get_content_from_chain(
@@ -647,221 +765,212 @@ class BlockchainMechanism(ConsensusMechanism):
     @ensure_blockchain_ready()
     async def get_transaction(self, *, tx_hash: HashUUID) -> TransactionDetail | None:
 
-        # ! This some kind of quadratic iteration, yes o of time, not sure by means of complexity, but all I know is that it will take too long.
-
-        for block_idx, each_block in enumerate(self.__chain["chain"]):
-            for each_transaction in each_block["contents"]["transactions"]:
-                if each_transaction["tx_hash"] == tx_hash:
+        # - Resolve the position of the transaction from the hash-keyed index instead of iterating the whole chain.
+        transaction_location: tuple[int, int] | None = self.__transaction_index.get(
+            tx_hash, None
+        )
 
-                    # # Duplicated code snippet from the __process_block_serialization_to_file.
-                    # * That method contains various iteration to the point that I cannot adapt this transaction from imitating the chain payload until block payload.
-                    # ! Therefore, copy that code snippet from here.
+        if transaction_location is None:
+            return None
 
-                    each_transaction = dict(each_transaction)
+        block_idx, transaction_idx = transaction_location
+        each_transaction = self.__chain["chain"][block_idx]["contents"]["transactions"][
+            transaction_idx
+        ]
 
-                    # * Cast mutability of the transaction's payload.
-                    each_transaction["payload"] = dict(each_transaction["payload"])
+        # # Duplicated code snippet from the __process_block_serialization_to_file.
+        # * That method contains various iteration to the point that I cannot adapt this transaction from imitating the chain payload until block payload.
+        # ! Therefore, copy that code snippet from here.
 
-                    # * Cast mutability of the transaction's signatures.
-                    each_transaction["signatures"] = dict(
-                        each_transaction["signatures"]
-                    )
+        each_transaction = dict(each_transaction)
 
-                    # ! Assign appropriate types to return from certain fields.
-                    # * Note that we are handling or exposing the contents of transactions that is influenced by internal.
-                    # - This means, we are showing the proof that something happened.
+        # * Cast mutability of the transaction's payload.
+        each_transaction["payload"] = dict(each_transaction["payload"])
 
-                    # - [1] Identify the base payload.
-                    # * Identify if the transaction payload is a `GroupTransaction`, otherwise it's a `NodeTransaction`.
+        # * Cast mutability of the transaction's signatures.
+        each_transaction["signatures"] = dict(each_transaction["signatures"])
 
-                    was_external: bool = "content_type" in each_transaction["payload"]
-                    payload_model: str = (
-                        GroupTransaction.__name__
-                        if was_external
-                        else NodeTransaction.__name__
-                    )
+        # ! Assign appropriate types to return from certain fields.
+        # * Note that we are handling or exposing the contents of transactions that is influenced by internal.
+        # - This means, we are showing the proof that something happened.
 
-                    # - [2] Resolve all candidate fields from the `context` field.
-                    # @o For the case of `GroupTransaction` (where `was_external` was `True`), every context became `HashUUID` wherein they are in encrypted.
-                    payload_context = each_transaction["payload"]["context"]
+        # - [1] Identify the base payload.
+        # * Identify if the transaction payload is a `GroupTransaction`, otherwise it's a `NodeTransaction`.
 
-                    if was_external:
+        was_external: bool = "content_type" in each_transaction["payload"]
+        payload_model: str = (
+            GroupTransaction.__name__ if was_external else NodeTransaction.__name__
+        )
 
-                        return TransactionDetail(
-                            from_block=block_idx + 1,
-                            transaction=Transaction(
-                                tx_hash=HashUUID(each_transaction["tx_hash"]),
-                                action=TransactionActions(each_transaction["action"]),
-                                from_address=AddressUUID(
-                                    each_transaction["from_address"]
-                                ),
-                                to_address=AddressUUID(each_transaction["to_address"]),
-                                signatures=TransactionSignatures(
-                                    **each_transaction["signatures"]
-                                ),
-                                payload=GroupTransaction(
-                                    content_type=TransactionContextMappingType(
-                                        each_transaction["payload"]["content_type"]
-                                    ),
-                                    context=HashUUID(payload_context),
-                                ),
-                                timestamp=each_transaction["timestamp"],
-                            ),
-                        )
+        # - [2] Resolve all candidate fields from the `context` field.
+        # @o For the case of `GroupTransaction` (where `was_external` was `True`), every context became `HashUUID` wherein they are in encrypted.
+        payload_context = each_transaction["payload"]["context"]
+
+        if was_external:
+
+            return TransactionDetail(
+                from_block=block_idx + 1,
+                transaction=Transaction(
+                    tx_hash=HashUUID(each_transaction["tx_hash"]),
+                    action=TransactionActions(each_transaction["action"]),
+                    from_address=AddressUUID(each_transaction["from_address"]),
+                    to_address=AddressUUID(each_transaction["to_address"]),
+                    signatures=TransactionSignatures(**each_transaction["signatures"]),
+                    payload=GroupTransaction(
+                        content_type=TransactionContextMappingType(
+                            each_transaction["payload"]["content_type"]
+                        ),
+                        context=HashUUID(payload_context),
+                    ),
+                    timestamp=each_transaction["timestamp"],
+                ),
+            )
 
-                    else:  # * Resolves to `NodeTransaction` as resolution model.
+        else:  # * Resolves to `NodeTransaction` as resolution model.
 
-                        # - Parse the content of any of the internal transactions as a proof.
-                        # * By first setting up the decryption key,
-                        secret: str | None = env.get(SECRET_KEY, None)
+            # - Parse the content of any of the internal transactions as a proof.
+            # * By first setting up the decryption key,
+            secret: str | None = env.get(SECRET_KEY, None)
 
-                        if secret is None:
-                            raise HTTPException(
-                                detail="Failed to parse internal node information, please try again later",
-                                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
-                            )
-                        else:
-                            decrypter: Fernet = Fernet(
-                                urlsafe_b64encode(secret[: int(len(secret) / 2)].encode("utf-8"))  # type: ignore
-                            )
+            if secret is None:
+                raise HTTPException(
+                    detail="Failed to parse internal node information, please try again later",
+                    status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                )
+            else:
+                decrypter: Fernet = Fernet(
+                    urlsafe_b64encode(secret[: int(len(secret) / 2)].encode("utf-8"))  # type: ignore
+                )
 
-                            payload_context = import_raw_json_to_dict(
-                                decrypter.decrypt(payload_context.encode("utf-8"))
-                            )
+                payload_context = import_raw_json_to_dict(
+                    decrypter.decrypt(payload_context.encode("utf-8"))
+                )
 
-                        # - In `NodeTransactions`, we can determine the context by checking the outside action field (outer part of payload of the block).
+            # - In `NodeTransactions`, we can determine the context by checking the outside action field (outer part of payload of the block).
 
-                        # - Resolve enums of both actions of inner and outer part of the payload.
-                        each_transaction["action"] = TransactionActions(
-                            each_transaction["action"]
-                        )  # ! Outer
-                        each_transaction["payload"][
-                            "action"
-                        ] = NodeTransactionInternalActions(
-                            each_transaction["payload"]["action"]
-                        )  # ! Inner
+            # - Resolve enums of both actions of inner and outer part of the payload.
+            each_transaction["action"] = TransactionActions(
+                each_transaction["action"]
+            )  # ! Outer
+            each_transaction["payload"]["action"] = NodeTransactionInternalActions(
+                each_transaction["payload"]["action"]
+            )  # ! Inner
 
-                        # - [3] Resolve payloads based on their outer action `TransactionActions`. First, resolve their fields before encapsulating the whole payload.
+            # - [3] Resolve payloads based on their outer action `TransactionActions`. First, resolve their fields before encapsulating the whole payload.
 
-                        if (
-                            each_transaction["action"]
-                            is TransactionActions.NODE_GENERAL_CONSENSUS_INIT
-                        ):
-                            payload_context["requestor_address"] = HashUUID(
-                                payload_context["requestor_address"]
-                            )
+            if (
+                each_transaction["action"]
+                is TransactionActions.NODE_GENERAL_CONSENSUS_INIT
+            ):
+                payload_context["requestor_address"] = HashUUID(
+                    payload_context["requestor_address"]
+                )
 
-                            each_transaction["payload"][
-                                "context"
-                            ] = NodeCertificateTransaction(**payload_context)
+                each_transaction["payload"]["context"] = NodeCertificateTransaction(
+                    **payload_context
+                )
 
-                        elif (
-                            each_transaction["action"]
-                            is TransactionActions.NODE_GENERAL_REGISTER_INIT
-                        ):
-                            payload_context["acceptor_address"] = AddressUUID(
-                                payload_context["acceptor_address"]
-                            )
-                            payload_context["new_address"] = AddressUUID(
-                                payload_context["new_address"]
-                            )
-                            payload_context["role"] = UserEntity(
-                                payload_context["role"]
-                            )
+            elif (
+                each_transaction["action"]
+                is TransactionActions.NODE_GENERAL_REGISTER_INIT
+            ):
+                payload_context["acceptor_address"] = AddressUUID(
+                    payload_context["acceptor_address"]
+                )
+                payload_context["new_address"] = AddressUUID(
+                    payload_context["new_address"]
+                )
+                payload_context["role"] = UserEntity(payload_context["role"])
 
-                            each_transaction["payload"][
-                                "context"
-                            ] = NodeRegisterTransaction(**payload_context)
+                each_transaction["payload"]["context"] = NodeRegisterTransaction(
+                    **payload_context
+                )
 
-                        elif (
-                            each_transaction["action"]
-                            is TransactionActions.NODE_GENERAL_GENESIS_BLOCK_INIT
-                        ):
-                            payload_context["data"] = HashUUID(payload_context["data"])
-                            payload_context["generator_address"] = AddressUUID(
-                                payload_context["generator_address"]
-                            )
+            elif (
+                each_transaction["action"]
+                is TransactionActions.NODE_GENERAL_GENESIS_BLOCK_INIT
+            ):
+                payload_context["data"] = HashUUID(payload_context["data"])
+                payload_context["generator_address"] = AddressUUID(
+                    payload_context["generator_address"]
+                )
 
-                            each_transaction["payload"][
-                                "context"
-                            ] = NodeGenesisTransaction(**payload_context)
+                each_transaction["payload"]["context"] = NodeGenesisTransaction(
+                    **payload_context
+                )
 
-                        elif (
-                            each_transaction["action"]
-                            is TransactionActions.NODE_GENERAL_CONSENSUS_BLOCK_SYNC
-                        ):
-                            payload_context["requestor_address"] = AddressUUID(
-                                payload_context["requestor_address"]
-                            )
+            elif (
+                each_transaction["action"]
+                is TransactionActions.NODE_GENERAL_CONSENSUS_BLOCK_SYNC
+            ):
+                payload_context["requestor_address"] = AddressUUID(
+                    payload_context["requestor_address"]
+                )
 
-                            each_transaction["payload"][
-                                "context"
-                            ] = NodeSyncTransaction(**payload_context)
+                each_transaction["payload"]["context"] = NodeSyncTransaction(
+                    **payload_context
+                )
 
-                        elif (
-                            each_transaction["action"]
-                            is TransactionActions.NODE_GENERAL_CONSENSUS_CONFIRM_NEGOTIATION_START
-                        ):
-                            payload_context["consensus_negotiation_id"] = RandomUUID(
-                                payload_context["consensus_negotiation_id"]
-                            )
-                            payload_context["master_address"] = AddressUUID(
-                                payload_context["master_address"]
-                            )
-                            payload_context["miner_address"] = AddressUUID(
-                                payload_context["miner_address"]
-                            )
+            elif (
+                each_transaction["action"]
+                is TransactionActions.NODE_GENERAL_CONSENSUS_CONFIRM_NEGOTIATION_START
+            ):
+                payload_context["consensus_negotiation_id"] = RandomUUID(
+                    payload_context["consensus_negotiation_id"]
+                )
+                payload_context["master_address"] = AddressUUID(
+                    payload_context["master_address"]
+                )
+                payload_context["miner_address"] = AddressUUID(
+                    payload_context["miner_address"]
+                )
 
-                            each_transaction["payload"][
-                                "context"
-                            ] = NodeConfirmMineConsensusTransaction(**payload_context)
+                each_transaction["payload"][
+                    "context"
+                ] = NodeConfirmMineConsensusTransaction(**payload_context)
 
-                        else:  # * Resolves to `TransactionActions.NODE_GENERAL_CONSENSUS_CONCLUDE_NEGOTIATION_PROCESSING`.
-                            payload_context["miner_address"] = AddressUUID(
-                                payload_context["miner_address"]
-                            )
-                            payload_context["receiver_address"] = AddressUUID(
-                                payload_context["receiver_address"]
-                            )
-                            payload_context["consensus_negotiation_id"] = RandomUUID(
-                                payload_context["consensus_negotiation_id"]
-                            )
-                            payload_context["block_hash"] = HashUUID(
-                                payload_context["block_hash"]
-                            )
+            else:  # * Resolves to `TransactionActions.NODE_GENERAL_CONSENSUS_CONCLUDE_NEGOTIATION_PROCESSING`.
+                payload_context["miner_address"] = AddressUUID(
+                    payload_context["miner_address"]
+                )
+                payload_context["receiver_address"] = AddressUUID(
+                    payload_context["receiver_address"]
+                )
+                payload_context["consensus_negotiation_id"] = RandomUUID(
+                    payload_context["consensus_negotiation_id"]
+                )
+                payload_context["block_hash"] = HashUUID(payload_context["block_hash"])
 
-                            each_transaction["payload"][
-                                "context"
-                            ] = NodeMineConsensusSuccessProofTransaction(
-                                **payload_context
-                            )
+                each_transaction["payload"][
+                    "context"
+                ] = NodeMineConsensusSuccessProofTransaction(**payload_context)
 
-                        # - [4] Encapsulate the whole `payload`.
-                        each_transaction["payload"] = globals()[payload_model](
-                            **each_transaction["payload"]
-                        )
+            # - [4] Encapsulate the whole `payload`.
+            each_transaction["payload"] = globals()[payload_model](
+                **each_transaction["payload"]
+            )
 
-                        # - [5] Assign appropriate types on `TransactionSignatures`.
-                        each_transaction["signatures"]["raw"] = HashUUID(
-                            each_transaction["signatures"]["raw"]
-                        )
-                        each_transaction["signatures"]["encrypted"] = HashUUID(
-                            each_transaction["signatures"]["encrypted"]
-                        )
+            # - [5] Assign appropriate types on `TransactionSignatures`.
+            each_transaction["signatures"]["raw"] = HashUUID(
+                each_transaction["signatures"]["raw"]
+            )
+            each_transaction["signatures"]["encrypted"] = HashUUID(
+                each_transaction["signatures"]["encrypted"]
+            )
 
-                        each_transaction["signatures"] = TransactionSignatures(
-                            **each_transaction["signatures"]
-                        )
+            each_transaction["signatures"] = TransactionSignatures(
+                **each_transaction["signatures"]
+            )
 
-                        # - [6] Resolve other properties.
-                        each_transaction["from_address"] = AddressUUID(
-                            each_transaction["from_address"]
-                        )
+            # - [6] Resolve other properties.
+            each_transaction["from_address"] = AddressUUID(
+                each_transaction["from_address"]
+            )
 
-                        return TransactionDetail(
-                            from_block=block_idx + 1,
-                            transaction=Transaction(**each_transaction),
-                        )
+            return TransactionDetail(
+                from_block=block_idx + 1,
+                transaction=Transaction(**each_transaction),
+            )
 
         return None
 
@@ -874,6 +983,33 @@ class BlockchainMechanism(ConsensusMechanism):
             INF if limit_to is None or not limit_to else limit_to
         )
         fetched_transactions: list[TransactionOverview] = []
+
+        # - When an address was given, resolve the transactions from its posting list instead of iterating the whole chain.
+        if address is not None and isinstance(address, str):
+            address_transaction_locations: list[
+                tuple[int, int]
+            ] = self.__address_transaction_index.get(address, [])
+
+            # @o The posting list is in block order, therefore the latest transactions are at the end of the list.
+            for block_idx, transaction_idx in address_transaction_locations[
+                -remaining_transactions if remaining_transactions != INF else None :
+            ]:
+                each_accounted_tx: frozendict = self.__chain["chain"][block_idx][
+                    "contents"
+                ]["transactions"][transaction_idx]
+
+                fetched_transactions.append(
+                    TransactionOverview(
+                        tx_hash=each_accounted_tx["tx_hash"],
+                        action=each_accounted_tx["action"],
+                        from_address=each_accounted_tx["from_address"],
+                        to_address=each_accounted_tx["to_address"],
+                        timestamp=each_accounted_tx["timestamp"],
+                    )
+                )
+
+            return fetched_transactions
+
         block_index: int = self.main_block_id - 2
 
         # - Get the block from the last index and decrement if required transactions to is not sufficient to the requested number of transactions to render.
@@ -886,19 +1022,6 @@ class BlockchainMechanism(ConsensusMechanism):
                 ]["transactions"]
 
                 for each_accounted_tx in txs_on_block:
-                    if address is not None and isinstance(address, str):
-                        address_found: bool = False
-
-                        # @o Check the origin address first.
-                        if address != each_accounted_tx["from_address"]:
-
-                            # @o Then if none, check for this one.
-                            if (
-                                address != each_accounted_tx["to_address"]
-                                and not address_found
-                            ):
-                                continue  # ! Ignore this transaction only if address were not found from both fields.
-
                     fetched_transactions.append(
                         TransactionOverview(
                             tx_hash=each_accounted_tx["tx_hash"],
@@ -1643,14 +1766,26 @@ class BlockchainMechanism(ConsensusMechanism):
             )
             return None
 
-        logger.warning(
-            f"Waiting for {BLOCKCHAIN_SECONDS_TO_MINE_FROM_ARCHIVAL_MINER} seconds to properly consume requests from {NodeType.MASTER_NODE.name}'s API-side before soft-locking itself to hash the block."
-        )
-        await sleep(BLOCKCHAIN_SECONDS_TO_MINE_FROM_ARCHIVAL_MINER)
+        # - The master node may deliver a batch of blocks, wherein each block was hashed one at a time by the mining engine.
+        self.__pending_hashing_blocks += 1
 
-        mined_block: Block | None = await self.__hash_block_processor(
-            block=block, return_hashed=True
-        )
+        try:
+            logger.warning(
+                f"Waiting for {BLOCKCHAIN_SECONDS_TO_MINE_FROM_ARCHIVAL_MINER} seconds to properly consume requests from {NodeType.MASTER_NODE.name}'s API-side before soft-locking itself to hash the block."
+            )
+            await sleep(BLOCKCHAIN_SECONDS_TO_MINE_FROM_ARCHIVAL_MINER)
+
+            self.blockchain_ready = False
+            mined_block: Block | None = await self.__hash_block_processor(
+                block=block, return_hashed=True
+            )
+
+        finally:
+            self.__pending_hashing_blocks -= 1
+
+            # - Only release the soft-lock once every block from the batch has been hashed.
+            if not self.__pending_hashing_blocks:
+                self.blockchain_ready = True
 
         if not isinstance(mined_block, Block):
             logger.info(
@@ -1693,15 +1828,16 @@ class BlockchainMechanism(ConsensusMechanism):
                 data={
                     "consensus_negotiation_id": recorded_consensus_negotiation,
                     "miner_address": self.node_identity[0],
-                    "hashed_block": import_raw_json_to_dict(
-                        export_to_json(mined_block.dict())
-                    ),
+                    "hashed_block": mined_block.dict(),
                     "local_block_id": self.main_block_id,
-                    "hashing_duration_finished": (
-                        datetime.now() + self.__hashing_duration
-                    ).isoformat(),
+                    "hashing_duration_finished": datetime.now()
+                    + self.__hashing_duration,
                 },
-                retry_attempts=100,
+                use_binary_format=True,
+                retry_policy=HTTPRetryPolicy(
+                    max_attempts=100, retry_non_idempotent=True, use_host_health=False
+                ),  # * The master only accepts a hashed block once, from its confirming blocks.
+                category=HTTPRequestCategory.BLOCK_DELIVERY,
                 return_on_error=False,
                 await_result_immediate=True,
                 name=f"send_hashed_payload_at_{NodeType.MASTER_NODE.name.lower()}_block_{mined_block.id}",
@@ -1736,6 +1872,10 @@ class BlockchainMechanism(ConsensusMechanism):
 
                 logger.info(f"Consensus Negotiation ID `{recorded_consensus_negotiation}` with the peer (receiver) address `{master_address_ref}` has been labeled as {ConsensusNegotiationStatus.COMPLETED.name}!")  # type: ignore
 
+                # - Other blocks from the batch were still being hashed, sleep once the last of them has been returned.
+                if self.__pending_hashing_blocks or self.__sleeping_from_consensus:
+                    return None
+
                 # - Sum the mined_timer sleep phase + given random sleep timer.
                 self.__consensus_calculate_sleep_time(
                     hashing_duration=payload_master_response_ref.addon_consensus_sleep_seconds,
@@ -1764,7 +1904,7 @@ class BlockchainMechanism(ConsensusMechanism):
     @restrict_call(on=NodeType.MASTER_NODE)
     async def __block_timer_executor(self) -> None:
         logger.info(
-            f"Block timer has been executed. Refreshes at {self.block_timer_seconds} seconds."
+            f"Block timer has been executed. Refreshes at {self.block_timer_seconds} seconds, or as soon as there are {BLOCKCHAIN_BLOCK_MAX_TRANSACTIONS} transaction/s or {BLOCKCHAIN_BLOCK_MAX_SIZE_BYTES} bytes of transaction/s. ({self.max_blocks_in_flight} block/s can be in-flight at once)"
         )
 
         # @o Added for type-hints.
@@ -1774,6 +1914,28 @@ class BlockchainMechanism(ConsensusMechanism):
         generated_block: Block | None = None
 
         while True:
+            logger.warning(
+                f"Sleeping for up to {self.block_timer_seconds} seconds while gathering transaction/s. ({len(self.__transaction_container)} transaction/s, {self.__transaction_container_size_bytes} bytes) | Elapsed since last block generation: {str(time() - self.__time_elapsed_from_tx_collection)[:-BLOCKCHAIN_TIME_TRUNCATION_ON_TX_TO_BLOCK]} seconds/s."
+            )
+
+            # - Sleep due to block timer, wherein this wakes up early when the transactions were enough to create a block.
+            try:
+                await wait_for(
+                    self.__block_cut_event.wait(), timeout=self.block_timer_seconds
+                )
+            except AsyncTimeoutError:
+                pass
+
+            self.__block_cut_event.clear()
+
+            # - Dispatch the left-out blocks first, since they were created before the block that is about to be created.
+            if len(self.__unsent_block_container):
+                logger.info(
+                    f"{len(self.__unsent_block_container)} block/s has been left-out from hashing due to previous miner unable to respond in time or there was no available miner. Dispatching them in batches ..."
+                )
+
+                await self.__dispatch_unsent_blocks()
+
             # - Wait until a number of sufficient transactions were received.
             # @o To save some processing time, we need to have a sufficient transactions before we process them to a block.
             calculated_user_tx: int = 0
@@ -1782,12 +1944,15 @@ class BlockchainMechanism(ConsensusMechanism):
                 if isinstance(each_tx.payload, GroupTransaction):
                     calculated_user_tx += 1
 
-            logger.warning(
-                f"Sleeping for {self.block_timer_seconds} seconds while gathering transaction/s. ({calculated_user_tx}/{BLOCKCHAIN_MINIMUM_USER_TRANSACTIONS_TO_BLOCK} user transaction/s required) | Elapsed since last block generation: {str(time() - self.__time_elapsed_from_tx_collection)[:-BLOCKCHAIN_TIME_TRUNCATION_ON_TX_TO_BLOCK]} seconds/s."
-            )
+            # - Blocks that were created but were not yet appended, which includes blocks that were left-out.
+            blocks_in_flight: int = self.leading_block_id - self.main_block_id
 
-            # - Sleep first due to block timer.
-            await sleep(self.block_timer_seconds)
+            # - User transactions that were left queued for too long can create a block, even when they were insufficient.
+            oldest_transaction_age: float = (
+                time() - self.__transaction_container_metadata[0][1]
+                if len(self.__transaction_container_metadata)
+                else 0.0
+            )
 
             # - Since we already have a node, do not let this one go.
 
@@ -1795,186 +1960,235 @@ class BlockchainMechanism(ConsensusMechanism):
             # if (time() - self.__time_elapsed_from_tx_collection) > 300.0:
 
             # ! Use this condition when already deployed.
-            if (
-                calculated_user_tx >= BLOCKCHAIN_MINIMUM_USER_TRANSACTIONS_TO_BLOCK
-            ) and not len(self.__unsent_block_container):
-                logger.info("Number of required transactions were sufficient!")
-
-                # - Before proceeding, ensure that the generated.
+            if calculated_user_tx < BLOCKCHAIN_MINIMUM_USER_TRANSACTIONS_TO_BLOCK and (
+                not calculated_user_tx
+                or oldest_transaction_age < BLOCKCHAIN_BLOCK_MAX_TRANSACTION_AGE_SECONDS
+            ):
                 logger.info(
-                    "Updating other previously binded-transactions (to database) to see if block number reference mismatches the current leading block."
+                    f"Transactions were insufficient to create a block. ({calculated_user_tx}/{BLOCKCHAIN_MINIMUM_USER_TRANSACTIONS_TO_BLOCK} user transaction/s required)"
+                )
+                continue
+
+            if blocks_in_flight >= self.max_blocks_in_flight:
+                logger.warning(
+                    f"There are {blocks_in_flight} block/s in-flight, which is the limit ({self.max_blocks_in_flight}). The next block will be created once a block has been appended to the blockchain (when the transactions already fill a block) or on the next block timer."
                 )
+                continue
 
-                require_updates: bool = False
-                last_leading_block_id: int = self.leading_block_id
+            logger.info("Number of required transactions were sufficient!")
 
-                for each_tx in self.__transaction_container:
-                    if isinstance(each_tx, GroupTransaction):
-                        require_updates = True
+            # - Before proceeding, ensure that the generated.
+            logger.info(
+                "Updating other previously binded-transactions (to database) to see if block number reference mismatches the current leading block."
+            )
 
-                        update_tx_block_ref_query: Update = (
-                            tx_content_mappings.update()
-                            .where(tx_content_mappings.c.tx_ref == each_tx.tx_hash)
-                            .values(block_no_ref=last_leading_block_id)
-                        )
+            require_updates: bool = False
+            last_leading_block_id: int = self.leading_block_id
 
-                        await self.__database_instance.execute(
-                            update_tx_block_ref_query
-                        )
+            # - Only the transactions that the block can contain were referred to this block.
+            for each_tx in self.__transaction_container[
+                : self.__get_block_transaction_cut()
+            ]:
+                if isinstance(each_tx, GroupTransaction):
+                    require_updates = True
 
-                if require_updates:
-                    await save_database_state_to_volume_storage()
+                    update_tx_block_ref_query: Update = (
+                        tx_content_mappings.update()
+                        .where(tx_content_mappings.c.tx_ref == each_tx.tx_hash)
+                        .values(block_no_ref=last_leading_block_id)
+                    )
 
-                # - Create a block from all of the transactions.
-                generated_block = await self.__create_block()
+                    await self.__database_instance.execute(update_tx_block_ref_query)
 
-            elif len(self.__unsent_block_container):
-                logger.info(
-                    f"Block {self.__unsent_block_container[0]} has been left-out from hashing due to previous miner unable to respond in time or there was no available miner."
-                )
+            if require_updates:
+                await save_database_state_to_volume_storage()
 
-                generated_block = self.__unsent_block_container.pop(0)
+            # - Create a block from the transactions that it can contain.
+            generated_block = await self.__create_block()
 
-            else:
+            if generated_block is None:
+                logger.error(
+                    f"Cannot proceed when block generated returned {generated_block}!"
+                )
                 continue
 
             # - Queue for other (`ARCHIVAL_MINER_NODE`) nodes to see who can hash the block.
             # @o When there's a miner, do a closed-loop process.
-            available_node_info: ArchivalMinerNodeInformation | None = (
-                await self.__get_available_archival_miner_nodes()
-            )
+            available_miners: list[
+                ArchivalMinerNodeInformation
+            ] = await self.__get_available_archival_miner_nodes()
 
             # @o When there's no miner active, sleep for a while and requeue again.
-            if available_node_info is None and generated_block is not None:
-
-                # ! Logs regarding this code block was already outputted from the `self.__get_available_archival_miner_nodes()`.
+            # ! Logs regarding this condition was already outputted from the `self.__get_available_archival_miner_nodes()`.
+            if not len(available_miners) or not await self.__deliver_block(
+                block=generated_block, miner=available_miners[0]
+            ):
                 self.__unsent_block_container.append(generated_block)
-                continue
 
-            # - Create a Consensus Negotiation ID out of `urlsafe_b64encode`.
-            # @o Create a Consensus Negotiation ID for the nodes to remember that this happened.
-            # @o Even though we already have the certification token, we still need this one to track current negotiations between nodes.
+    async def __dispatch_unsent_blocks(self) -> None:
+        """
+        - Dispatches the blocks that were left-out from hashing to every idle archival miner node at once, instead of one block per block timer.
+        - Each miner receives a batch of consecutive blocks (up to `BLOCKCHAIN_MINER_BLOCK_BATCH_SIZE`), wherein the miners that are expected to return the hashed blocks the earliest receive the earliest blocks.
+        - Hashed blocks that were returned out of order were chained by `append_block` from the `hashed_block_container`.
+        """
+        unsent_blocks: list[Block] = sorted(
+            self.__unsent_block_container, key=lambda block_context: block_context.id
+        )
+        self.__unsent_block_container.clear()
 
-            if available_node_info is not None and generated_block is not None:
+        available_miners: list[
+            ArchivalMinerNodeInformation
+        ] = await self.__get_available_archival_miner_nodes(
+            limit=ceil(len(unsent_blocks) / BLOCKCHAIN_MINER_BLOCK_BATCH_SIZE)
+        )
 
-                # ! Modify the block's validator.
-                generated_block.contents.validator = available_node_info.miner_address
+        if not len(available_miners):
+            self.__unsent_block_container.extend(unsent_blocks)
+            return
 
-                generated_consensus_negotiation_id: str = token_urlsafe(
-                    BLOCKCHAIN_NEGOTIATION_ID_LENGTH
-                )
+        # - Spread the blocks evenly between the miners, wherein blocks beyond what the miners can take were left for the next block timer.
+        batch_size: int = min(
+            BLOCKCHAIN_MINER_BLOCK_BATCH_SIZE,
+            ceil(len(unsent_blocks) / len(available_miners)),
+        )
+        self.__unsent_block_container.extend(
+            unsent_blocks[batch_size * len(available_miners) :]
+        )
 
-                attempt_deliver_payload: ClientResponse = await self.__http_instance.enqueue_request(
-                    url=URLAddress(
-                        f"{available_node_info.source_host}:{available_node_info.source_port}/node/receive_raw_block"
-                    ),
-                    method=HTTPQueueMethods.POST,
-                    await_result_immediate=True,
-                    headers={
-                        "x-certificate-token": await self._get_consensus_certificate(
-                            address_ref=available_node_info.miner_address
-                        ),
-                        "x-hash": await self.get_chain_hash(),
-                        "x-token": self.node_identity[1],
-                    },
-                    data={
-                        # - Load the dictionary version and export it via `orjson` and import it again to get dictionary for the aiohttp to process on request.
-                        "block": import_raw_json_to_dict(
-                            export_to_json(generated_block.dict())
-                        ),
-                        "master_address": self.node_identity[0],
-                        "consensus_negotiation_id": generated_consensus_negotiation_id,
-                    },
-                    return_on_error=False,
-                    retry_attempts=100,
-                    name=f"send_raw_payload_at_{NodeType.ARCHIVAL_MINER_NODE.name.lower()}_{available_node_info.miner_address[-6:]}",
+        await gather(
+            *[
+                self.__deliver_block_batch(
+                    blocks=unsent_blocks[
+                        miner_idx * batch_size : (miner_idx + 1) * batch_size
+                    ],
+                    miner=each_miner,
                 )
+                for miner_idx, each_miner in enumerate(available_miners)
+            ]
+        )
 
-                if attempt_deliver_payload.ok:
-                    # - Increment the counter when the payload delivery is finished.
-                    self.leading_block_id += 1
+        # * Have to eliminate the potential of colliding with other blocks.
+        self.__unsent_block_container.sort(key=lambda block_context: block_context.id)
 
-                    # - Validate any previous consensus negotiation.
-                    await validate_previous_consensus_negotiation(
-                        database_instance_ref=self.__database_instance,
-                        block_reference=generated_block,
-                    )
+        logger.info(
+            f"Left-out block/s were dispatched to {len(available_miners)} archival miner node/s, with {len(self.__unsent_block_container)} block/s left-out."
+        )
 
-                    # - Save this consensus negotiation ID as well for the retrieval verification of the hashed/mined block.
-                    save_in_progress_negotiation_query: Insert = (
-                        consensus_negotiation.insert().values(
-                            block_no_ref=generated_block.id,
-                            consensus_negotiation_id=generated_consensus_negotiation_id,
-                            peer_address=available_node_info.miner_address,
-                            status=ConsensusNegotiationStatus.ON_PROGRESS,
-                        )
-                    )
+    async def __deliver_block_batch(
+        self, *, blocks: list[Block], miner: ArchivalMinerNodeInformation
+    ) -> None:
+        # - Deliver in order, so that the miner hashes the blocks consecutively.
+        for block_idx, each_block in enumerate(blocks):
+            if not await self.__deliver_block(block=each_block, miner=miner):
+                # - The miner may be unable to take the rest, leave them for other candidates.
+                self.__unsent_block_container.extend(blocks[block_idx:])
+                return
+
+    async def __deliver_block(
+        self, *, block: Block, miner: ArchivalMinerNodeInformation
+    ) -> bool:
+        """
+        Delivers the block for the archival miner node to hash, along with its consensus negotiation. Returns `True` when the miner has accepted the block.
+        """
+        # ! Modify the block's validator.
+        block.contents.validator = miner.miner_address
+
+        # - Create a Consensus Negotiation ID out of `urlsafe_b64encode`.
+        # @o Create a Consensus Negotiation ID for the nodes to remember that this happened.
+        # @o Even though we already have the certification token, we still need this one to track current negotiations between nodes.
+        generated_consensus_negotiation_id: str = token_urlsafe(
+            BLOCKCHAIN_NEGOTIATION_ID_LENGTH
+        )
 
-                    # - And remember that this node was in the state of `CURRENTLY_HASHING`.
-                    set_miner_state_as_hashing_query: Update = (
-                        associated_nodes.update()
-                        .where(
-                            associated_nodes.c.user_address
-                            == available_node_info.miner_address
-                        )
-                        .values(status=AssociatedNodeStatus.CURRENTLY_HASHING)
-                    )
+        attempt_deliver_payload: ClientResponse = await self.__http_instance.enqueue_request(
+            url=URLAddress(
+                f"{miner.source_host}:{miner.source_port}/node/receive_raw_block"
+            ),
+            method=HTTPQueueMethods.POST,
+            await_result_immediate=True,
+            headers={
+                "x-certificate-token": await self._get_consensus_certificate(
+                    address_ref=miner.miner_address
+                ),
+                "x-hash": await self.get_chain_hash(),
+                "x-token": self.node_identity[1],
+            },
+            data={
+                # - The block is encoded once, as `msgpack` or JSON (via `orjson`), by `use_binary_format`.
+                "block": block.dict(),
+                "master_address": self.node_identity[0],
+                "consensus_negotiation_id": generated_consensus_negotiation_id,
+            },
+            use_binary_format=True,
+            return_on_error=False,
+            retry_policy=HTTPRetryPolicy(
+                retry_non_idempotent=True
+            ),  # * Give up early, so that the block can be dispatched to other candidates.
+            category=HTTPRequestCategory.BLOCK_DELIVERY,
+            name=f"send_raw_payload_at_{NodeType.ARCHIVAL_MINER_NODE.name.lower()}_{miner.miner_address[-6:]}_block_{block.id}",
+        )
 
-                    await gather(
-                        self.__database_instance.execute(
-                            save_in_progress_negotiation_query
-                        ),
-                        self.__database_instance.execute(
-                            set_miner_state_as_hashing_query
-                        ),
-                        save_database_state_to_volume_storage(),
-                    )
+        if not attempt_deliver_payload.ok:
+            logger.warning(
+                f"After multiple retries, block #{block.id} will be stored and will find other candidates."
+            )
+            return False
 
-                    # - Store this for a while for the verification upon receiving a hashed/mined block.
-                    # @o We will be using this to refer from the hashed block that will be sent by a archival miner node.
-                    self.confirming_block_container.append(generated_block)
-
-                    # - And save the negotiation consensus where a block getting hashed has been confirmed.
-                    # - Basically this transaction shows who won from hashing a block.
-                    await self.insert_internal_transaction(
-                        action=TransactionActions.NODE_GENERAL_CONSENSUS_CONFIRM_NEGOTIATION_START,
-                        data=NodeTransaction(
-                            action=NodeTransactionInternalActions.CONSENSUS,
-                            context=NodeConfirmMineConsensusTransaction(
-                                consensus_negotiation_id=RandomUUID(
-                                    generated_consensus_negotiation_id
-                                ),
-                                master_address=self.node_identity[0],
-                                miner_address=available_node_info.miner_address,
-                            ),
-                        ),
-                    )
+        # - Validate any previous consensus negotiation.
+        await validate_previous_consensus_negotiation(
+            database_instance_ref=self.__database_instance,
+            block_reference=block,
+        )
 
-                    logger.info(
-                        f"Block {generated_block.id} has been sent and is in the process of hashing! (By: {available_node_info.miner_address})"
-                    )
+        # - Save this consensus negotiation ID as well for the retrieval verification of the hashed/mined block.
+        save_in_progress_negotiation_query: Insert = (
+            consensus_negotiation.insert().values(
+                block_no_ref=block.id,
+                consensus_negotiation_id=generated_consensus_negotiation_id,
+                peer_address=miner.miner_address,
+                status=ConsensusNegotiationStatus.ON_PROGRESS,
+            )
+        )
 
-                    self.__time_elapsed_from_tx_collection = (
-                        time()
-                    )  # * Reset the timer.
-                    continue
+        # - And remember that this node was in the state of `CURRENTLY_HASHING`.
+        set_miner_state_as_hashing_query: Update = (
+            associated_nodes.update()
+            .where(associated_nodes.c.user_address == miner.miner_address)
+            .values(status=AssociatedNodeStatus.CURRENTLY_HASHING)
+        )
 
-                else:
-                    logger.warning(
-                        "After multiple retries, the generated block will be stored and will find other candidates."
-                    )
-                    self.__unsent_block_container.append(generated_block)
+        await gather(
+            self.__database_instance.execute(save_in_progress_negotiation_query),
+            self.__database_instance.execute(set_miner_state_as_hashing_query),
+            save_database_state_to_volume_storage(),
+        )
 
-                    # * Have to eliminate the potential of colliding with other blocks.
-                    self.__unsent_block_container.sort(
-                        key=lambda block_context: block_context.id
-                    )
+        # - Store this for a while for the verification upon receiving a hashed/mined block.
+        # @o We will be using this to refer from the hashed block that will be sent by a archival miner node.
+        self.confirming_block_container.append(block)
 
-                    continue
+        # - And save the negotiation consensus where a block getting hashed has been confirmed.
+        # - Basically this transaction shows who won from hashing a block.
+        await self.insert_internal_transaction(
+            action=TransactionActions.NODE_GENERAL_CONSENSUS_CONFIRM_NEGOTIATION_START,
+            data=NodeTransaction(
+                action=NodeTransactionInternalActions.CONSENSUS,
+                context=NodeConfirmMineConsensusTransaction(
+                    consensus_negotiation_id=RandomUUID(
+                        generated_consensus_negotiation_id
+                    ),
+                    master_address=self.node_identity[0],
+                    miner_address=miner.miner_address,
+                ),
+            ),
+        )
 
-            logger.error(
-                f"Cannot proceed when block generated returned {generated_block}!"
-            )
+        logger.info(
+            f"Block {block.id} has been sent and is in the process of hashing! (By: {miner.miner_address})"
+        )
+
+        self.__time_elapsed_from_tx_collection = time()  # * Reset the timer.
+        return True
 
     def __consensus_calculate_sleep_time(
         self, *, hashing_duration: int | float, add_on: bool
@@ -2014,6 +2228,32 @@ class BlockchainMechanism(ConsensusMechanism):
             f"Consensus timer ignored due to condition (ie. new instance, blockchain state not ready or otherwise."
         )
 
+    def __get_block_transaction_cut(self) -> int:
+        """
+        Returns the number of queued transactions (from the oldest) that a block can contain, bounded by `BLOCKCHAIN_BLOCK_MAX_TRANSACTIONS` and `BLOCKCHAIN_BLOCK_MAX_SIZE_BYTES`. A transaction that exceeds the size on its own is contained by a block alone.
+        """
+        cut_size_bytes: int = 0
+
+        for tx_idx, (each_tx_size_bytes, _) in enumerate(
+            self.__transaction_container_metadata[:BLOCKCHAIN_BLOCK_MAX_TRANSACTIONS]
+        ):
+            cut_size_bytes += each_tx_size_bytes
+
+            if tx_idx and cut_size_bytes > BLOCKCHAIN_BLOCK_MAX_SIZE_BYTES:
+                return tx_idx
+
+        return min(
+            len(self.__transaction_container_metadata),
+            BLOCKCHAIN_BLOCK_MAX_TRANSACTIONS,
+        )
+
+    def __is_block_cut_ready(self) -> bool:
+        return (
+            len(self.__transaction_container) >= BLOCKCHAIN_BLOCK_MAX_TRANSACTIONS
+            or self.__transaction_container_size_bytes
+            >= BLOCKCHAIN_BLOCK_MAX_SIZE_BYTES
+        )
+
     async def __create_block(self) -> Block | None:
         # @o When building a block, we first have to consider that there are some properties were undefined. The nonce, content_bytes_size, and hash_block.
         # @o With this, we need to seperate the contents of the block, providing a way from the inside of the block to be hashable and identifiable for hash verification.
@@ -2032,12 +2272,33 @@ class BlockchainMechanism(ConsensusMechanism):
                 f"This new block will be the first block from this blockchain."
             )
 
-        shadow_transaction_container = deepcopy(self.__transaction_container)
-        self.__transaction_container.clear()
-
-        # # Explain this regarding compatibility issue of handling `prev_hash` when mined by the MASTER itself.
+        # - Transactions beyond what the block can contain were left queued for the next block.
+        block_transaction_cut: int = self.__get_block_transaction_cut()
 
-        if self.__new_master_instance and len(self.__chain["chain"]):
+        shadow_transaction_container = deepcopy(
+            self.__transaction_container[:block_transaction_cut]
+        )
+        self.__transaction_container_size_bytes -= sum(
+            each_tx_size_bytes
+            for each_tx_size_bytes, _ in self.__transaction_container_metadata[
+                :block_transaction_cut
+            ]
+        )
+        del self.__transaction_container[:block_transaction_cut]
+        del self.__transaction_container_metadata[:block_transaction_cut]
+
+        if len(self.__transaction_container):
+            logger.info(
+                f"{len(self.__transaction_container)} transaction/s were left queued for the next block."
+            )
+
+            # - Let the block timer create the next block immediately when the transactions left were enough.
+            if self.__is_block_cut_ready():
+                self.__block_cut_event.set()
+
+        # # Explain this regarding compatibility issue of handling `prev_hash` when mined by the MASTER itself.
+
+        if self.__new_master_instance and len(self.__chain["chain"]):
             block_index_ref: int = (
                 self.main_block_id
                 if not len(self.__chain["chain"])
@@ -2068,6 +2329,9 @@ class BlockchainMechanism(ConsensusMechanism):
 
         _block.content_bytes_size = asizeof(_block.contents.json())
 
+        # - Allocate the block ID on creation, so that the next block can be created while this block is still on its way to be hashed.
+        self.leading_block_id += 1
+
         logger.info(
             f"Block #{_block.id} with a size of ({_block.content_bytes_size} bytes) has been created."
         )
@@ -2113,8 +2377,11 @@ class BlockchainMechanism(ConsensusMechanism):
         return None
 
     async def __get_available_archival_miner_nodes(
-        self,
-    ) -> ArchivalMinerNodeInformation | None:
+        self, *, limit: int = 1
+    ) -> list[ArchivalMinerNodeInformation]:
+        """
+        Returns up to `limit` idle archival miner nodes, ordered by the time they are expected to return the hashed block.
+        """
 
         available_nodes_query = select(
             [
@@ -2131,63 +2398,195 @@ class BlockchainMechanism(ConsensusMechanism):
             available_nodes_query
         )
 
-        random_generator.shuffle(
-            available_nodes
-        )  # ! Note that this does not create a new copy of the referred object, but rather mutates the referred object!
+        # - Exclude candidates that are still under backoff from their previous failures.
+        current_datetime: datetime = datetime.now()
+        available_nodes = [
+            each_candidate
+            for each_candidate in available_nodes
+            if each_candidate["user_address"] not in self.__miner_health
+            or self.__miner_health[each_candidate["user_address"]].backoff_until is None
+            or self.__miner_health[each_candidate["user_address"]].backoff_until
+            <= current_datetime
+        ]
 
         if not len(available_nodes):
             logger.info(
                 f"There are no available nodes to hash the block. Retrying again the after interval of the block timer. ({self.block_timer_seconds} seconds)"
             )
-            return None
+            return []
 
         logger.info(f"{len(available_nodes)} archival miner node candidate/s found!")
 
-        for candidate_idx, each_candidate in enumerate(available_nodes):
-            try:
-                candidate_response: ClientResponse = await self.__http_instance.enqueue_request(
-                    url=URLAddress(
-                        f"{each_candidate['source_address']}:{each_candidate['source_port']}/node/info"
-                    ),
-                    method=HTTPQueueMethods.GET,
-                    await_result_immediate=True,
-                    do_not_retry=True,
-                    name=f"contact_archival_node_candidate_{each_candidate['user_address'][-6:]}",
-                )
+        # - Probe every candidate at once, so that a slow or dead candidate only costs a single probe timeout.
+        probed_candidates: list[bool] = await gather(
+            *[
+                self.__probe_archival_miner_node(candidate=each_candidate)
+                for each_candidate in available_nodes
+            ]
+        )
 
-                if candidate_response.ok:
-                    parsed_candidate_state_info = await candidate_response.json()
-                    resolved_candidate_state_info = parsed_candidate_state_info[
-                        "properties"
-                    ]
+        responsive_candidates: list[tuple[int, Mapping]] = [
+            (candidate_idx, each_candidate)
+            for candidate_idx, (each_candidate, is_idle) in enumerate(
+                zip(available_nodes, probed_candidates)
+            )
+            if is_idle
+        ]
 
-                    if (
-                        not resolved_candidate_state_info["is_hashing"]
-                        and NodeType(resolved_candidate_state_info["node_role"])
-                        is NodeType.ARCHIVAL_MINER_NODE
-                    ):
-                        logger.info(
-                            f"Archival miner candidate {resolved_candidate_state_info['owner']} has responded from the block hashing request!"
-                        )
-                        return ArchivalMinerNodeInformation(
-                            candidate_no=candidate_idx,
-                            miner_address=resolved_candidate_state_info["owner"],
-                            source_host=URLAddress(each_candidate["source_address"]),
-                            source_port=each_candidate["source_port"],
-                        )
+        if not len(responsive_candidates):
+            logger.warning(
+                f"All archival miner nodes seem to be busy. Attempting to find available nodes after the interval of the block timer. ({self.block_timer_seconds} seconds)"
+            )
+            return []
+
+        # - Select the candidate that is expected to return the hashed block the earliest, from its hash rate and its latency.
+        # @o Candidates that haven't mined a block yet were assumed to have the average hash rate of the candidates that did.
+        known_hash_rates: list[float] = [
+            self.__miner_health[each_candidate["user_address"]].hash_rate  # type: ignore # ! Filtered from the condition.
+            for _, each_candidate in responsive_candidates
+            if self.__miner_health[each_candidate["user_address"]].hash_rate
+        ]
+        assumed_hash_rate: float | None = (
+            sum(known_hash_rates) / len(known_hash_rates)
+            if len(known_hash_rates)
+            else None
+        )
+        expected_attempts: int = 16**BLOCKCHAIN_HASH_BLOCK_DIFFICULTY
 
-                    logger.warning(
-                        f"Archival Miner Candidate {resolved_candidate_state_info['owner']} may be sleeping from consensus."
-                    )
+        def estimate_block_return_seconds(candidate: tuple[int, Mapping]) -> float:
+            candidate_health: ArchivalMinerNodeHealth = self.__miner_health[
+                candidate[1]["user_address"]
+            ]
+            candidate_hash_rate: float | None = (
+                candidate_health.hash_rate or assumed_hash_rate
+            )
 
-            except AttributeError:
-                logger.error("An error occured in the middle of the process.")
-                continue
+            return (candidate_health.latency_seconds or 0.0) + (
+                expected_attempts / candidate_hash_rate if candidate_hash_rate else 0.0
+            )
+
+        random_generator.shuffle(
+            responsive_candidates
+        )  # * Break the ties between candidates that has the same estimate.
+        selected_candidates: list[tuple[int, Mapping]] = sorted(
+            responsive_candidates, key=estimate_block_return_seconds
+        )[:limit]
+
+        for candidate_idx, selected_candidate in selected_candidates:
+            logger.info(
+                f"Archival miner candidate {selected_candidate['user_address']} has been selected from {len(responsive_candidates)} idle candidate/s, with an estimate of {estimate_block_return_seconds((candidate_idx, selected_candidate))} second/s to return the hashed block!"
+            )
+
+        return [
+            ArchivalMinerNodeInformation(
+                candidate_no=candidate_idx,
+                miner_address=selected_candidate["user_address"],
+                source_host=URLAddress(selected_candidate["source_address"]),
+                source_port=selected_candidate["source_port"],
+            )
+            for candidate_idx, selected_candidate in selected_candidates
+        ]
+
+    async def __probe_archival_miner_node(self, *, candidate: Mapping) -> bool:
+        """
+        - Fetches the information of the archival miner node, and records its latency and hash rate from the health table.
+        - Failing probes puts the candidate under an exponential backoff, wherein it will be excluded from the candidates until the backoff expires.
+        - Returns `True` when the candidate is an idle `ARCHIVAL_MINER_NODE`.
+        """
+        candidate_health: ArchivalMinerNodeHealth = self.__miner_health.setdefault(
+            candidate["user_address"],
+            ArchivalMinerNodeHealth(
+                latency_seconds=None, hash_rate=None, backoff_until=None
+            ),
+        )
+        probe_started: float = perf_counter()
+
+        try:
+            candidate_response: ClientResponse | HTTPClientTimeoutResponse | None = await self.__http_instance.enqueue_request(
+                url=URLAddress(
+                    f"{candidate['source_address']}:{candidate['source_port']}/node/info"
+                ),
+                method=HTTPQueueMethods.GET,
+                await_result_immediate=True,
+                do_not_retry=True,
+                category=HTTPRequestCategory.PROBE,
+                name=f"contact_archival_node_candidate_{candidate['user_address'][-6:]}",
+            )
+
+            if candidate_response is None or not candidate_response.ok:
+                raise ConnectionError(
+                    f"Archival miner candidate {candidate['user_address']} responded with {candidate_response.status if candidate_response is not None else 'nothing'}."
+                )
+
+            resolved_candidate_state_info: dict[str, Any] = (
+                await candidate_response.json()
+            )["properties"]
+
+        except (AsyncTimeoutError, ConnectionError, AttributeError, KeyError) as e:
+            candidate_health.consecutive_failures += 1
+            candidate_health.backoff_until = datetime.now() + timedelta(
+                seconds=min(
+                    BLOCKCHAIN_MINER_BACKOFF_BASE_SECONDS
+                    * 2 ** (candidate_health.consecutive_failures - 1),
+                    BLOCKCHAIN_MINER_BACKOFF_MAX_SECONDS,
+                )
+            )
+            logger.warning(
+                f"Archival miner candidate {candidate['user_address']} failed to respond (#{candidate_health.consecutive_failures} in a row) and will be excluded until {candidate_health.backoff_until.isoformat()}. | Info: {e if str(e) else type(e).__name__}"
+            )
+            return False
+
+        probe_latency: float = perf_counter() - probe_started
+        candidate_health.latency_seconds = (
+            probe_latency
+            if candidate_health.latency_seconds is None
+            else BLOCKCHAIN_MINER_LATENCY_SMOOTHING_FACTOR * probe_latency
+            + (1 - BLOCKCHAIN_MINER_LATENCY_SMOOTHING_FACTOR)
+            * candidate_health.latency_seconds
+        )
+        candidate_health.consecutive_failures = 0
+        candidate_health.backoff_until = None
+
+        # - Refer to the hash rate from the blocks mined by the candidate, if there's any.
+        candidate_mining_state: dict[
+            str, Any
+        ] | None = resolved_candidate_state_info.get("mining", None)
+        if (
+            candidate_mining_state is not None
+            and candidate_mining_state["total_elapsed_seconds"]
+        ):
+            candidate_health.hash_rate = (
+                candidate_mining_state["total_attempts"]
+                / candidate_mining_state["total_elapsed_seconds"]
+            )
+
+        if (
+            not resolved_candidate_state_info["is_hashing"]
+            and NodeType(resolved_candidate_state_info["node_role"])
+            is NodeType.ARCHIVAL_MINER_NODE
+        ):
+            logger.info(
+                f"Archival miner candidate {resolved_candidate_state_info['owner']} has responded from the block hashing request in {probe_latency} second/s!"
+            )
+            return True
 
         logger.warning(
-            f"All archival miner nodes seem to be busy. Attempting to find available nodes after the interval of the block timer. ({self.block_timer_seconds} seconds)"
+            f"Archival Miner Candidate {resolved_candidate_state_info['owner']} may be sleeping from consensus."
         )
-        return None
+        return False
+
+    def __refer_transaction_to_address_index(
+        self, *, transaction: dict | frozendict, location: tuple[int, int]
+    ) -> None:
+        # - Refer the position of this transaction from the posting list of both the sender and the receiver.
+        # @o Both addresses may be the same, ensure that the transaction will only be referred once per address.
+        for each_address in {transaction["from_address"], transaction["to_address"]}:
+            if each_address is None:
+                continue
+
+            self.__address_transaction_index.setdefault(
+                AddressUUID(each_address), []
+            ).append(location)
 
     def __get_last_block(self) -> Block | None:
         # ! This return seems confusing but I have to sacrafice for my own sake of readability.
@@ -2207,48 +2606,45 @@ class BlockchainMechanism(ConsensusMechanism):
 
         logger.warning("There's no block inside blockchain.")
 
-    # # Cannot do keyword arguments here as per stated on excerpt: https://stackoverflow.com/questions/23946895/requests-in-asyncio-keyword-arguments
-    def __hash_block(self, block: Block) -> Block:
+    async def __hash_block(self, block: Block) -> Block | None:
         # If success, then return the hash of the block based from the difficulty.
-        self.blockchain_ready = False
-        prev: float = time()
-        nth: int = 1
+        mining_engine: MiningEngine | None = get_mining_engine_instance()
+
+        if mining_engine is None:
+            logger.error(
+                f"Block #{block.id} cannot be hashed as this node does not have a mining engine."
+            )
+            return None
 
         logger.info(f"Attempting to hash block #{block.id} ...")
 
-        while True:
-            # https://stackoverflow.com/questions/869229/why-is-looping-over-range-in-python-faster-than-using-a-while-loop, not sure if this works here as well.
+        mining_result: BlockMiningResult | None = await mining_engine.mine(block=block)
 
-            block.contents.nonce = random_generator.randint(0, MAX_INT_PYTHON)
-            block.hash_block = HashUUID(
-                sha256(block.json().encode("utf-8")).hexdigest()
-            )
+        if mining_result is None:
+            return None
 
-            if (
-                block.hash_block[:BLOCKCHAIN_HASH_BLOCK_DIFFICULTY]
-                == "0" * BLOCKCHAIN_HASH_BLOCK_DIFFICULTY
-            ):
-                logger.info(
-                    f"Block #{block.id} with a nonce value of {block.contents.nonce} has a resulting hash value of `{block.hash_block}`, which has been hashed for {time() - prev} second/s under {nth} iteration/s!"
-                )
+        block.contents.nonce = mining_result.nonce
+        block.hash_block = mining_result.hash_block
 
-                self.blockchain_ready = True
-                return block
+        logger.info(
+            f"Block #{block.id} with a nonce value of {block.contents.nonce} has a resulting hash value of `{block.hash_block}`, which has been hashed for {mining_result.elapsed_seconds} second/s by worker #{mining_result.worker_id} under {sum(worker.attempts for worker in mining_result.workers)} iteration/s!"
+        )
+
+        for worker in mining_result.workers:
+            logger.debug(
+                f"Block #{block.id} | Worker #{worker.worker_id}: {worker.attempts} attempt/s in {worker.elapsed_seconds} second/s ({worker.hash_rate:.2f} H/s)."
+            )
 
-            nth += 1
+        return block
 
     async def __hash_block_processor(
         self, *, block: Block, return_hashed: bool
     ) -> Block | None:
-        block_hashing_processor = await (
-            get_event_loop().run_in_executor(
-                None,
-                self.__hash_block,
-                block,
-            )
-        )
+        mined_block: Block | None = await self.__hash_block(block)
 
-        mined_block: Block = block_hashing_processor
+        if mined_block is None:
+            logger.error(f"Block #{block.id} was not mined.")
+            return None
 
         logger.info(f"Block #{block.id} has been mined.")
 
@@ -2273,54 +2669,170 @@ class BlockchainMechanism(ConsensusMechanism):
             )
             await sleep(INF)
 
-        async with aopen(
-            BLOCKCHAIN_RAW_PATH,
-            "w" if operation is BlockchainIOAction.TO_WRITE else "r",
-        ) as content_buffer:
+        if operation is BlockchainIOAction.TO_WRITE and bypass_from_update:
+            # - The blockchain file from the upstream was written in a temporary file, replace the blockchain file with it.
+            logger.warning("Bypass from the update method has been declared.")
 
-            if operation is BlockchainIOAction.TO_WRITE:
-                if not bypass_from_update and not len(context_from_update):
-                    byte_json_content: bytes = export_to_json(
-                        self.__chain,
-                        default=self._process_block_serialization_to_file,
-                    )
+            replace_file(context_from_update[1], BLOCKCHAIN_RAW_PATH)
+            self.__chain_file_size = Path(BLOCKCHAIN_RAW_PATH).stat().st_size
+            await self.__update_chain_hash(new_hash=context_from_update[0])
 
-                    logger.debug(
-                        f"Updating blockchain file's hash signature on database. | Targets: {BLOCKCHAIN_RAW_PATH}"
-                    )
-                    new_blockchain_hash: str = sha256(byte_json_content).hexdigest()
+            return self.__chain
 
-                    await self.__update_chain_hash(new_hash=new_blockchain_hash)
-                    await content_buffer.write(byte_json_content.decode("utf-8"))
+        if operation is BlockchainIOAction.TO_WRITE:
+            logger.debug(
+                f"Rewriting the blockchain file and its hash signature on database. | Targets: {BLOCKCHAIN_RAW_PATH}"
+            )
 
-                    logger.debug(
-                        f"Blockchain's file signature has been changed! | Current Hash: {new_blockchain_hash}"
-                    )
-                else:
-                    logger.warning("Bypass from the update method has been declared.")
-                    await self.__update_chain_hash(new_hash=context_from_update[0])
-                    await content_buffer.write(context_from_update[1])
+            # - Serializing and hashing every block is CPU-bound, do it from the persistence executor instead of the event loop.
+            (
+                self.__chain_digests,
+                self.__chain_file_size,
+            ) = await get_persistence_executor_instance().run(
+                "write_chain_file",
+                self.__write_block_lines,
+                blocks=list(self.__chain["chain"]),
+                filename=BLOCKCHAIN_RAW_PATH,
+            )
+            new_blockchain_hash: str = (
+                self.__chain_digests[-1]
+                if len(self.__chain_digests)
+                else BLOCKCHAIN_ROLLING_DIGEST_SEED
+            )
 
-                return self.__chain
+            await self.__update_chain_hash(new_hash=new_blockchain_hash)
+
+            logger.debug(
+                f"Blockchain's file signature has been changed! | Current Hash: {new_blockchain_hash}"
+            )
+
+            return self.__chain
+
+        # - The blockchain file is a line-delimited JSON document, where each line is a block. This allows the file to be appended per block instead of rewriting it.
+        if operation is BlockchainIOAction.TO_APPEND:
+            # - Serialize the latest block only, and then chain its digest from the digest of the file.
+            block_line: bytes = export_to_json(
+                self.__chain["chain"][-1],
+                default=self._process_block_serialization_to_file,
+            )
+
+            new_blockchain_hash = compute_chain_rolling_digest(
+                previous_digest=await self.get_chain_hash(), block_line=block_line
+            )
+
+            async with aopen(BLOCKCHAIN_RAW_PATH, "ab") as content_buffer:
+                await content_buffer.write(block_line + b"\n")
+
+            # - Only publish the digest and the size once the file has been closed (flushed), as they were used by the readers of the blockchain file.
+            self.__chain_digests.append(HashUUID(new_blockchain_hash))
+            self.__chain_file_size += len(block_line) + 1
+            await self.__update_chain_hash(new_hash=new_blockchain_hash)
+
+            logger.debug(
+                f"Blockchain's file signature has been changed! | Current Hash: {new_blockchain_hash}"
+            )
+
+            return self.__chain
+
+        async with aopen(BLOCKCHAIN_RAW_PATH, "rb") as content_buffer:
+            raw_data: bytes = await content_buffer.read()
+            self.__chain_file_size = len(raw_data)
+            (
+                partial_deserialized_data,
+                self.__chain_digests,
+            ) = await get_persistence_executor_instance().run(
+                "read_chain_file", self.__process_block_lines_to_payload, raw_data
+            )
+
+            deserialized_data = self.__process_block_deserialization_to_memory(
+                partial_deserialized_data
+            )
+
+            if deserialized_data is None:
+                unconventional_terminate(
+                    message="Houston, we have a problem! We cannot deserialize from the JSON file. This is most likely someone modified the blockchain file! Please report this to the administrators and ensure that the backup has been added."
+                )  # * Resolves to condition 'deserialized_data is None'.
+                await sleep(INF)
 
             else:
-                raw_data = await content_buffer.read()
-                partial_deserialized_data = import_raw_json_to_dict(raw_data)
-                deserialized_data = self.__process_block_deserialization_to_memory(
-                    partial_deserialized_data
+                logger.info(f"Chain has been loaded from the file to the in-memory!")
+                return deserialized_data
+
+    def __process_block_lines_to_payload(
+        self, context: bytes | str
+    ) -> tuple[RawBlockchainPayload, list[HashUUID]]:
+        """
+        A method that parses the line-delimited JSON document of the blockchain file into the payload that is consumable by `self.__process_block_deserialization_to_memory`.
+
+        Args:
+                context (bytes | str): The raw content of the blockchain file.
+
+        Returns:
+                tuple[RawBlockchainPayload, list[HashUUID]]: Returns the payload that contains the blocks and the rolling digest of the given content per height.
+        """
+        resolved_payload: RawBlockchainPayload = {"chain": []}
+        resolved_digests: list[HashUUID] = []
+
+        for each_line in (
+            context.encode("utf-8") if isinstance(context, str) else context
+        ).splitlines():
+            if each_line:
+                self.__process_block_line_to_payload(
+                    payload=resolved_payload, digests=resolved_digests, line=each_line
                 )
 
-                if deserialized_data is None:
-                    unconventional_terminate(
-                        message="Houston, we have a problem! We cannot deserialize from the JSON file. This is most likely someone modified the blockchain file! Please report this to the administrators and ensure that the backup has been added."
-                    )  # * Resolves to condition 'deserialized_data is None'.
-                    await sleep(INF)
+        return resolved_payload, resolved_digests
 
-                else:
-                    logger.info(
-                        f"Chain has been loaded from the file to the in-memory!"
-                    )
-                    return deserialized_data
+    def __write_block_lines(
+        self, *, blocks: list[frozendict], filename: str
+    ) -> tuple[list[HashUUID], int]:
+        """
+        A method that writes the `blocks` to the blockchain file, where each block is a line. This is run from the persistence executor.
+
+        Returns:
+                tuple[list[HashUUID], int]: Returns the rolling digest of the written file per height, and the size of the written file.
+        """
+        resolved_digest: str = BLOCKCHAIN_ROLLING_DIGEST_SEED
+        resolved_digests: list[HashUUID] = []
+        written_file_size: int = 0
+
+        with open(filename, "wb") as chain_writer:
+            for each_block in blocks:
+                block_line: bytes = export_to_json(
+                    each_block,
+                    default=self._process_block_serialization_to_file,
+                )
+
+                resolved_digest = compute_chain_rolling_digest(
+                    previous_digest=resolved_digest, block_line=block_line
+                )
+                chain_writer.write(block_line + b"\n")
+                resolved_digests.append(HashUUID(resolved_digest))
+                written_file_size += len(block_line) + 1
+
+        return resolved_digests, written_file_size
+
+    def __process_block_line_to_payload(
+        self,
+        *,
+        payload: RawBlockchainPayload,
+        digests: list[HashUUID],
+        line: bytes,
+    ) -> None:
+        """
+        A method that parses a line (block) of the blockchain file to the `payload`, and chains its digest to the `digests`. This allows the blockchain file to be consumed incrementally.
+        """
+        digests.append(
+            HashUUID(
+                compute_chain_rolling_digest(
+                    previous_digest=digests[-1]
+                    if len(digests)
+                    else BLOCKCHAIN_ROLLING_DIGEST_SEED,
+                    block_line=line,
+                )
+            )
+        )
+        payload["chain"].append(import_raw_json_to_dict(line))
 
     def __process_block_deserialization_to_memory(
         self, context: RawBlockchainPayload, update: bool = False
@@ -2352,6 +2864,8 @@ class BlockchainMechanism(ConsensusMechanism):
             if update:
                 self.__cached_total_transactions = 0  # ! This means that we are resetting count back to zero because we are loading a new blockchain file.
                 self.__chain = frozendict(BLOCKCHAIN_NODE_JSON_TEMPLATE)
+                self.__transaction_index = {}
+                self.__address_transaction_index = {}
                 self.__unsent_block_container = []
                 self.confirming_block_container = []
                 self.hashed_block_container = []
@@ -2401,6 +2915,16 @@ class BlockchainMechanism(ConsensusMechanism):
                             block_data["contents"]["transactions"][transaction_idx]
                         )
 
+                        # - Refer the position of this transaction from the index for the lookup of `get_transaction`.
+                        self.__transaction_index[each_transaction["tx_hash"]] = (
+                            block_idx,
+                            transaction_idx,
+                        )
+                        self.__refer_transaction_to_address_index(
+                            transaction=each_transaction,
+                            location=(block_idx, transaction_idx),
+                        )
+
                         self.__cached_total_transactions += 1
 
                 # - Add immutability to the `contents`, which encapsulates the whole set of `transactions`.
@@ -2498,48 +3022,39 @@ class BlockchainMechanism(ConsensusMechanism):
         A method that serializes the python objects to a much more universally-readable JSON format to the blockchain file.
 
         Args:
-                o (frozendict): The whole chain, wrapped in frozendict.
+                o (frozendict): The whole chain or a single block, wrapped in frozendict.
 
         Raises:
                 TypeError: Cast TypeError when the constraint from the `o` is not followed.
 
         Returns:
-                dict[str, Any]: Returns the JSON form of the blockchain that is in-memory.
-
-        Note:
-        TODO By this point, I still haven't consider for scalability and its impact from processing such data.
-        * Until there's an impact, I will implement in-memory caching to reduce processing time and insert only data that is missing from the data pool.
+                dict[str, Any]: Returns the JSON form of the blockchain (or the block) that is in-memory.
         """
 
-        if isinstance(o, frozendict):  # * Cast mutability on the whole chain.
-            _o = dict(deepcopy(o))
-            for block_idx, each_block in enumerate(_o["chain"]):
-
-                # * Then cast mutability from the whole block of the chain.
-                _o["chain"][block_idx] = dict(each_block)
-
-                # * Cast mutability to the content of the whole block of the chain.
-                _o["chain"][block_idx]["contents"] = dict(each_block["contents"])
-
-                if len(_o["chain"][block_idx]["contents"]["transactions"]):
-                    for transaction_idx, each_transactions in enumerate(
-                        _o["chain"][block_idx]["contents"]["transactions"]
-                    ):
-
-                        # * Cast mutability on the whole transaction.
-                        _o["chain"][block_idx]["contents"]["transactions"][
-                            transaction_idx
-                        ] = dict(each_transactions)
-
-                        # * Cast mutability of the transaction's payload.
-                        _o["chain"][block_idx]["contents"]["transactions"][
-                            transaction_idx
-                        ]["payload"] = dict(each_transactions["payload"])
-
-                        # * Cast mutability of the transaction's signatures.
-                        _o["chain"][block_idx]["contents"]["transactions"][
-                            transaction_idx
-                        ]["signatures"] = dict(each_transactions["signatures"])
+        if isinstance(o, frozendict):
+            # * Cast mutability on the whole chain, block by block.
+            if "chain" in o:
+                return {
+                    "chain": [
+                        self._process_block_serialization_to_file(each_block)
+                        for each_block in o["chain"]
+                    ]
+                }
+
+            # * Then cast mutability from the block, as well as its content.
+            # ! Transactions were referred from a new list to avoid mutating the in-memory chain.
+            _o = dict(o)
+            _o["contents"] = dict(o["contents"])
+            _o["contents"]["transactions"] = [
+                {
+                    **each_transaction,
+                    # * Cast mutability of the transaction's payload.
+                    "payload": dict(each_transaction["payload"]),
+                    # * Cast mutability of the transaction's signatures.
+                    "signatures": dict(each_transaction["signatures"]),
+                }
+                for each_transaction in o["contents"]["transactions"]
+            ]
 
             return _o
 
@@ -2698,9 +3213,8 @@ class BlockchainMechanism(ConsensusMechanism):
         del premature_transaction_copy["tx_hash"]
 
         # - Calculate the hash based on the content of the deepcopied `built_transaction`.
-        premature_calc_sha256: str = sha256(
-            export_to_json(premature_transaction_copy)
-        ).hexdigest()
+        premature_transaction_bytes: bytes = export_to_json(premature_transaction_copy)
+        premature_calc_sha256: str = sha256(premature_transaction_bytes).hexdigest()
 
         # @o After calculation, invoke this new hash from the `tx_hash` of the `built_transaction`.
         built_internal_transaction.tx_hash = HashUUID(premature_calc_sha256)
@@ -2715,6 +3229,14 @@ class BlockchainMechanism(ConsensusMechanism):
         # @o Append the new transaction.
         if not is_duplicate:
             self.__transaction_container.append(built_internal_transaction)
+            self.__transaction_container_metadata.append(
+                (len(premature_transaction_bytes), time())
+            )
+            self.__transaction_container_size_bytes += len(premature_transaction_bytes)
+
+            # - Wake the block timer when the transactions were enough to create a block.
+            if self.__is_block_cut_ready():
+                self.__block_cut_event.set()
 
             logger.info(
                 f"Transaction `{built_internal_transaction.tx_hash}` has been created and is on-queue for new blocks!"
@@ -2751,82 +3273,140 @@ class BlockchainMechanism(ConsensusMechanism):
                 @o On initilization of the instance.
 
         """
+        # ! These are late imports due to changes from the path as per the evaluation of the method `resolve_resources` at processors.py.
+        from core.constants import BLOCKCHAIN_RAW_PATH
+
         # Before attempting to do that, check for the hash first.
 
         master_node_props = get_master_node_properties()
+        upstream_chain_temp_file: Final[str] = f"{BLOCKCHAIN_RAW_PATH}.upstream"
 
         while True:
             # - Fetch from the master first by checking the hash, let the endpoint compare it.
-            master_hash_valid_response: ClientResponse = await self.__http_instance.enqueue_request(
-                url=URLAddress(
-                    f"{master_node_props[REF_MASTER_BLOCKCHAIN_ADDRESS]}:{master_node_props[REF_MASTER_BLOCKCHAIN_PORT]}/node/verify_chain_hash"  # type: ignore
-                ),
-                method=HTTPQueueMethods.POST,
-                await_result_immediate=True,
-                headers={
-                    "x-token": self.node_identity[1],
-                    "x-certificate-token": await self._get_consensus_certificate(),
-                    "x-hash": await self.get_chain_hash(),
-                },
-                do_not_retry=True,
-                name="verify_local_hash_with_master_node",
+            master_hash_valid_response: ClientResponse = (
+                await self.__verify_chain_hash_from_master()
             )
 
             if not master_hash_valid_response.ok:
-                # - If that's the case then fetch the blockchain file.
-                upstream_chain_content: ClientResponse = await self.__http_instance.enqueue_request(
-                    url=URLAddress(
-                        f"{master_node_props[REF_MASTER_BLOCKCHAIN_ADDRESS]}:{master_node_props[REF_MASTER_BLOCKCHAIN_PORT]}/node/pull_chain_upstream"  # type: ignore
-                    ),
-                    method=HTTPQueueMethods.POST,
-                    await_result_immediate=True,
-                    headers={
-                        "x-token": self.node_identity[1],
-                        "x-certificate-token": await self._get_consensus_certificate(),
-                    },
-                    name="get_upstream_from_master_node",
+                # - Look for the first block that diverges from the master's blockchain, given that the master returns its height.
+                master_chain_height: str | None = (
+                    master_hash_valid_response.headers.get("x-height", None)
                 )
 
-                # - For some reason, in my implementation, I also returned the hash with respect to the content.
-                if upstream_chain_content.ok:
-                    dict_blockchain_content = await upstream_chain_content.json()
+                synced_from_blocks: bool = False
 
-                    in_memory_chain: frozendict | None = (
-                        self.__process_block_deserialization_to_memory(
-                            import_raw_json_to_dict(dict_blockchain_content["content"]),
-                            update=True,
-                        )
+                if master_chain_height is not None:
+                    common_chain_height: int = await self.__find_common_chain_height(
+                        master_height=int(master_chain_height)
                     )
 
-                    if not isinstance(in_memory_chain, frozendict):
-                        logger.error(
-                            "There was an error loading the blockchain from file to in-memory."
-                        )
-                        await sleep(INF)
-
-                    else:
-                        self.__chain = in_memory_chain
+                    logger.warning(
+                        f"Local blockchain diverges from the {NodeType.MASTER_NODE.name} starting from block #{common_chain_height + 1}. | Local Height: {self.get_chain_height()}, {NodeType.MASTER_NODE.name} Height: {master_chain_height}"
+                    )
 
-                    # ! Once we inject the new payload after fetch, then write it from the file.
+                    # - Then pull the blocks after the last common block only.
+                    synced_from_blocks = await self.__sync_blocks_from_master(
+                        common_height=common_chain_height
+                    )
 
-                    await self.__process_blockchain_file_to_current_state(
-                        operation=BlockchainIOAction.TO_WRITE,
-                        context_from_update=(
-                            HashUUID(dict_blockchain_content["current_hash"]),
-                            BlockchainFileContext(dict_blockchain_content["content"]),
+                if not synced_from_blocks:
+                    # - If that's not possible, then fetch the whole blockchain file.
+                    upstream_chain_content: ClientResponse = await self.__http_instance.enqueue_request(
+                        url=URLAddress(
+                            f"{master_node_props[REF_MASTER_BLOCKCHAIN_ADDRESS]}:{master_node_props[REF_MASTER_BLOCKCHAIN_PORT]}/node/pull_chain_upstream"  # type: ignore
                         ),
-                        bypass_from_update=True,
+                        method=HTTPQueueMethods.POST,
+                        await_result_immediate=True,
+                        headers={
+                            "x-token": self.node_identity[1],
+                            "x-certificate-token": await self._get_consensus_certificate(),
+                        },
+                        category=HTTPRequestCategory.CHAIN_PULL,
+                        name="get_upstream_from_master_node",
                     )
 
-                    logger.info(
-                        f"Blockchain has been updated from upstream! Ready for blockchain operation from the {NodeType.MASTER_NODE.name}."
-                    )
-                else:
-                    logger.warning(
-                        f"Hash update or validation processing is not successful due to condition unmet from HTTP status. Re-attempting in 5 seconds ..."
-                    )
-                    await sleep(5)
-                    continue
+                    # - The blockchain file is streamed from the upstream, along with its hash from the headers.
+                    if upstream_chain_content.ok:
+                        upstream_chain_hash: str | None = (
+                            upstream_chain_content.headers.get("x-hash", None)
+                        )
+                        upstream_chain_payload: RawBlockchainPayload = {"chain": []}
+                        upstream_chain_digests: list[HashUUID] = []
+
+                        # - Consume the stream per line (block), while writing it to a temporary file that replaces the blockchain file once validated.
+                        try:
+                            async with aopen(
+                                upstream_chain_temp_file, "wb"
+                            ) as upstream_chain_writer:
+                                async for each_block_line in iterate_response_lines(
+                                    upstream_chain_content
+                                ):
+                                    self.__process_block_line_to_payload(
+                                        payload=upstream_chain_payload,
+                                        digests=upstream_chain_digests,
+                                        line=each_block_line,
+                                    )
+                                    await upstream_chain_writer.write(
+                                        each_block_line + b"\n"
+                                    )
+
+                        except AsyncTimeoutError:
+                            logger.error(
+                                "The stream of the blockchain from the upstream has timed out. Re-attempting in 5 seconds ..."
+                            )
+                            await sleep(5)
+                            continue
+
+                        upstream_chain_digest: HashUUID = (
+                            upstream_chain_digests[-1]
+                            if len(upstream_chain_digests)
+                            else HashUUID(BLOCKCHAIN_ROLLING_DIGEST_SEED)
+                        )
+
+                        if upstream_chain_digest != upstream_chain_hash:
+                            logger.error(
+                                f"The digest of the blockchain from the upstream does not match with its given hash! | Computed: {upstream_chain_digest}, Given: {upstream_chain_hash}. Re-attempting in 5 seconds ..."
+                            )
+                            await sleep(5)
+                            continue
+
+                        in_memory_chain: frozendict | None = (
+                            self.__process_block_deserialization_to_memory(
+                                upstream_chain_payload,
+                                update=True,
+                            )
+                        )
+
+                        if not isinstance(in_memory_chain, frozendict):
+                            logger.error(
+                                "There was an error loading the blockchain from file to in-memory."
+                            )
+                            await sleep(INF)
+
+                        else:
+                            self.__chain = in_memory_chain
+                            self.__chain_digests = upstream_chain_digests
+
+                        # ! Once we inject the new payload after fetch, then write it from the file.
+
+                        await self.__process_blockchain_file_to_current_state(
+                            operation=BlockchainIOAction.TO_WRITE,
+                            context_from_update=(
+                                upstream_chain_digest,
+                                BlockchainFileContext(upstream_chain_temp_file),
+                            ),
+                            bypass_from_update=True,
+                        )
+
+                        logger.info(
+                            f"Blockchain has been updated from upstream! Ready for blockchain operation from the {NodeType.MASTER_NODE.name}."
+                        )
+                    else:
+                        logger.warning(
+                            f"Hash update or validation processing is not successful due to condition unmet from HTTP status. Re-attempting in 5 seconds ..."
+                        )
+                        await sleep(5)
+                        continue
 
             else:
                 # - When the hash is fine, then standby and wait for the consensus timer.
@@ -2838,6 +3418,178 @@ class BlockchainMechanism(ConsensusMechanism):
             self.blockchain_ready = True
             return
 
+    @restrict_call(on=NodeType.ARCHIVAL_MINER_NODE)
+    async def __verify_chain_hash_from_master(
+        self, *, height: int | None = None
+    ) -> ClientResponse:
+        """
+        A private method that lets the master node compare the digest of this node's blockchain at the given `height`. Compares the digest of the whole blockchain when `height` is not given.
+        """
+        master_node_props = get_master_node_properties()
+
+        verify_hash_headers: dict[str, str] = {
+            "x-token": self.node_identity[1],
+            "x-certificate-token": await self._get_consensus_certificate(),
+            "x-hash": await self.get_chain_hash(height=height),  # type: ignore
+        }
+
+        if height is not None:
+            verify_hash_headers["x-height"] = str(height)
+
+        return await self.__http_instance.enqueue_request(
+            url=URLAddress(
+                f"{master_node_props[REF_MASTER_BLOCKCHAIN_ADDRESS]}:{master_node_props[REF_MASTER_BLOCKCHAIN_PORT]}/node/verify_chain_hash"  # type: ignore
+            ),
+            method=HTTPQueueMethods.POST,
+            await_result_immediate=True,
+            headers=verify_hash_headers,
+            do_not_retry=True,
+            name="verify_local_hash_with_master_node"
+            if height is None
+            else f"verify_local_hash_with_master_node_at_{height}",
+        )
+
+    @restrict_call(on=NodeType.ARCHIVAL_MINER_NODE)
+    async def __find_common_chain_height(self, *, master_height: int) -> int:
+        """
+        A private method that finds the height (number of blocks) that this node's blockchain and the master node's blockchain have in common, wherein the next block is the first block that diverges.
+
+        # Notes:
+        - Since every digest is chained from the digest of its previous block, once the digests were mismatched at a certain height, every height after it mismatches as well. This lets us find the first divergent block by binary search, which only takes O(log n) requests.
+        """
+
+        # - Height zero always matches, while the height beyond both blockchains cannot be compared.
+        matched_height: int = 0
+        unmatched_height: int = min(self.get_chain_height(), master_height)
+
+        # - Check the highest comparable height first, as this node is usually just behind from the master node.
+        verify_response: ClientResponse | None = (
+            await self.__verify_chain_hash_from_master(height=unmatched_height)
+        )
+
+        if verify_response is not None and verify_response.ok:
+            return unmatched_height
+
+        while unmatched_height - matched_height > 1:
+            middle_height: int = (matched_height + unmatched_height) // 2
+            verify_response = await self.__verify_chain_hash_from_master(
+                height=middle_height
+            )
+
+            if verify_response is not None and verify_response.ok:
+                matched_height = middle_height
+            else:
+                unmatched_height = middle_height
+
+        return matched_height
+
+    @restrict_call(on=NodeType.ARCHIVAL_MINER_NODE)
+    async def __sync_blocks_from_master(self, *, common_height: int) -> bool:
+        """
+        A private method that pulls the blocks after the `common_height` from the master node, wherein each block is appended through `self.append_block`.
+
+        Returns:
+                bool: Returns `True` when the blockchain matches with the master node's blockchain after appending the blocks, otherwise `False`, which requires the whole blockchain to be fetched.
+        """
+        master_node_props = get_master_node_properties()
+
+        pulled_blocks_response: ClientResponse | None = await self.__http_instance.enqueue_request(
+            url=URLAddress(
+                f"{master_node_props[REF_MASTER_BLOCKCHAIN_ADDRESS]}:{master_node_props[REF_MASTER_BLOCKCHAIN_PORT]}/node/pull_blocks?from_id={common_height}"  # type: ignore
+            ),
+            method=HTTPQueueMethods.GET,
+            await_result_immediate=True,
+            headers={
+                "x-token": self.node_identity[1],
+                "x-certificate-token": await self._get_consensus_certificate(),
+            },
+            do_not_retry=True,
+            category=HTTPRequestCategory.CHAIN_PULL,
+            name=f"pull_blocks_from_master_node_at_{common_height}",
+        )
+
+        if pulled_blocks_response is None or not pulled_blocks_response.ok:
+            logger.error(
+                f"Cannot pull the blocks after block #{common_height} from the {NodeType.MASTER_NODE.name}."
+            )
+            return False
+
+        # - Remove the blocks that diverge from the master node's blockchain before appending the pulled blocks.
+        if self.get_chain_height() > common_height:
+            await self.__truncate_chain(height=common_height)
+
+        try:
+            async for each_block_line in iterate_response_lines(pulled_blocks_response):
+                pulled_block: Block = Block.parse_obj(
+                    import_raw_json_to_dict(each_block_line)
+                )
+
+                # - Ensure that the pulled block chains from the last block before appending it.
+                if pulled_block.id != self.main_block_id or (
+                    len(self.__chain["chain"])
+                    and pulled_block.prev_hash_block
+                    != self.__chain["chain"][-1]["hash_block"]
+                ):
+                    logger.error(
+                        f"Pulled block #{pulled_block.id} does not chain from the local blockchain! | Expected Block ID: {self.main_block_id}"
+                    )
+                    return False
+
+                await self.append_block(context=pulled_block, process_container=True)
+
+        except AsyncTimeoutError:
+            logger.error(
+                f"The stream of the blocks after block #{common_height} from the {NodeType.MASTER_NODE.name} has timed out."
+            )
+            return False
+
+        if await self.get_chain_hash() != pulled_blocks_response.headers.get(
+            "x-hash", None
+        ):
+            logger.error(
+                f"The blockchain does not match with the {NodeType.MASTER_NODE.name}'s blockchain after appending the pulled blocks."
+            )
+            return False
+
+        logger.info(
+            f"Pulled {self.get_chain_height() - common_height} block/s after block #{common_height} from the {NodeType.MASTER_NODE.name}."
+        )
+        return True
+
+    async def __truncate_chain(self, *, height: int) -> None:
+        """
+        A private method that removes the blocks after the given `height` (number of blocks) from the blockchain, both in-memory and to the file.
+        """
+        for each_block in self.__chain["chain"][height:]:
+            for each_transaction in each_block["contents"]["transactions"]:
+                self.__transaction_index.pop(each_transaction["tx_hash"], None)
+                self.__cached_total_transactions -= 1
+
+                # - Postings are in block order, therefore positions from the removed blocks are at the end of the list.
+                for each_address in {
+                    each_transaction["from_address"],
+                    each_transaction["to_address"],
+                }:
+                    address_postings: list[
+                        tuple[int, int]
+                    ] = self.__address_transaction_index.get(each_address, [])
+
+                    while len(address_postings) and address_postings[-1][0] >= height:
+                        address_postings.pop()
+
+        del self.__chain["chain"][height:]
+
+        self.main_block_id = height + 1
+        self.leading_block_id = self.main_block_id
+
+        await self.__process_blockchain_file_to_current_state(
+            operation=BlockchainIOAction.TO_WRITE
+        )
+
+        logger.warning(
+            f"Blockchain has been truncated to block #{height}. Blocks after it were removed."
+        )
+
     async def __update_chain_hash(self, *, new_hash: str) -> None:
         blockchain_hash_update_query: Update = (
             file_signatures.update()
@@ -2870,6 +3622,7 @@ def get_blockchain_instance(
         # # Note that this will create an issue later when we tried ARCHIVAL_MINER_NODE node mode later on.
         blockchain_service = BlockchainMechanism(
             block_timer_seconds=BLOCKCHAIN_BLOCK_TIMER_IN_SECONDS,
+            max_blocks_in_flight=get_args_values().max_blocks_in_flight,
             auth_tokens=token_ref,
             node_role=role,
         )
@@ -16,7 +16,7 @@ from aiohttp import ClientResponse
 from blueprint.models import associated_nodes
 from databases import Database
 from utils.processors import save_database_state_to_volume_storage
-from utils.http import HTTPClient
+from utils.http import HTTPClient, HTTPRetryPolicy
 from sqlalchemy import select
 from sqlalchemy.sql.expression import Insert, Select
 from utils.processors import load_env
@@ -100,7 +100,9 @@ class ConsensusMechanism:
             await_result_immediate=True,
             name="get_echo_from_master",
             return_on_error=False,
-            retry_attempts=99,
+            retry_policy=HTTPRetryPolicy(
+                max_attempts=99, retry_non_idempotent=True, use_host_health=False
+            ),
         )
 
         # - Add the credentials to the associated nodes as self.
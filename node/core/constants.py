@@ -74,6 +74,19 @@ AUTH_KEY: Final[str] = "AUTH_KEY"
 SECRET_KEY: Final[str] = "SECRET_KEY"
 BLOCK_HASH_LENGTH: Final[int] = 64
 FERNET_KEY_LENGTH: Final[int] = 44
+CRYPT_FILE_SIGNATURE: Final[
+    bytes
+] = b"FBCRYPT\x01"  # * The header of the files encrypted by segments of AES-GCM, which ends with the version of the format. Files without this were encrypted by Fernet as a whole.
+CRYPT_FILE_CHUNK_SIZE_BYTES: Final[
+    int
+] = 1048576  # * The size of the plaintext per segment, which bounds the memory used on encrypting and decrypting a file.
+CRYPT_FILE_NONCE_PREFIX_LENGTH: Final[
+    int
+] = 7  # * The random part of the nonce per file, followed by the 4-byte segment counter and the 1-byte last segment flag.
+CRYPT_FILE_TAG_LENGTH: Final[int] = 16
+CRYPT_FILE_KEY_DERIVATION_INFO: Final[
+    bytes
+] = b"folioblocks-crypt-file-aes-gcm"  # * Derives the AES-GCM key from the Fernet key, so that both formats share the `AUTH_KEY`.
 SECRET_KEY_LENGTH: Final[int] = 32
 MAX_JWT_HOLD_TOKEN: Final[int] = 5
 
@@ -88,6 +101,15 @@ AUTH_CODE_ISSUER_NAME: Final[str] = "Registration Authority"
 
 # # Constants, Blockchain
 BLOCKCHAIN_HASH_BLOCK_DIFFICULTY: Final[int] = 4
+BLOCKCHAIN_MINING_STOP_CHECK_INTERVAL: Final[
+    int
+] = 1024  # * The number of nonce attempts of a mining worker before checking if other workers have found a hit.
+BLOCKCHAIN_MINING_HISTORY_LENGTH: Final[
+    int
+] = 32  # * The number of recently mined blocks to keep for the mining statistics.
+BLOCK_HASH_TEMPLATE_NONCE_SUFFIX: Final[
+    bytes
+] = b"}}"  # * The bytes after the nonce of a serialized block, which closes both `contents` and the block itself.
 BLOCKCHAIN_BLOCK_TIMER_IN_SECONDS: Final[int] = 5
 BLOCKCHAIN_GENESIS_MIN_CHAR_DATA: Final[int] = 16
 BLOCKCHAIN_INDEX_COUNT_COVERAGE_TO_RECOVER_TXS: Final[int] = 10
@@ -100,6 +122,32 @@ BLOCKCHAIN_REQUIRED_GENESIS_BLOCKS: Final[int] = 15
 BLOCKCHAIN_SECONDS_TO_MINE_FROM_ARCHIVAL_MINER: Final[int] = 2
 BLOCKCHAIN_CONSENSUS_SLEEP_BASE_VALUE: Final[int] = 2
 BLOCKCHAIN_TIME_TRUNCATION_ON_TX_TO_BLOCK: Final[int] = 13
+BLOCKCHAIN_ROLLING_DIGEST_SEED: Final[str] = (
+    "0" * BLOCK_HASH_LENGTH
+)  # * The initial value of the rolling digest of the blockchain file, which is also the digest of a blockchain file that has no blocks.
+BLOCKCHAIN_LEGACY_FILE_SIGNATURE: Final[
+    bytes
+] = b'{"chain"'  # * The leading bytes of the blockchain file that is written in a single JSON document, which has to be migrated into a line-delimited JSON document.
+BLOCKCHAIN_MINER_BACKOFF_BASE_SECONDS: Final[int] = 2
+BLOCKCHAIN_MINER_BACKOFF_MAX_SECONDS: Final[int] = 300
+BLOCKCHAIN_MINER_LATENCY_SMOOTHING_FACTOR: Final[
+    float
+] = 0.3  # * The weight of the latest probe against the previous latency of an archival miner node.
+BLOCKCHAIN_MINER_BLOCK_BATCH_SIZE: Final[
+    int
+] = 4  # * The consecutive blocks that can be dispatched to a single archival miner node at once, when blocks were left-out from hashing.
+BLOCKCHAIN_MAX_BLOCKS_IN_FLIGHT: Final[
+    int
+] = 4  # * The blocks that were created but were not yet appended to the blockchain, wherein the master node stops creating blocks when this was reached.
+BLOCKCHAIN_BLOCK_MAX_TRANSACTIONS: Final[
+    int
+] = 256  # * The transactions that a block can contain, wherein a block is created without waiting for the block timer when this was reached.
+BLOCKCHAIN_BLOCK_MAX_SIZE_BYTES: Final[
+    int
+] = 262144  # * The size (in bytes) of the transactions that a block can contain, wherein a block is created without waiting for the block timer when this was reached.
+BLOCKCHAIN_BLOCK_MAX_TRANSACTION_AGE_SECONDS: Final[
+    int
+] = 30  # * The time that the oldest transaction can be left queued, wherein a block is created even with insufficient user transactions when this was reached.
 REF_MASTER_BLOCKCHAIN_ADDRESS: Final[str] = "MASTER_NODE_ADDRESS"
 REF_MASTER_BLOCKCHAIN_PORT: Final[str] = "MASTER_NODE_PORT"
 
@@ -123,8 +171,62 @@ FILE_PAYLOAD_TO_ADDRESS_CHAR_LIMIT_MIN: Final[int] = 13
 FILE_PAYLOAD_TO_ADDRESS_CHAR_LIMIT_MAX: Final[int] = 14
 
 # # Constants, HTTP
-HTTP_MICRO_SLEEP_TO_FETCH_REQUEST: Final[float] = 0.2
+HTTP_MAX_CONNECTIONS: Final[int] = 100
+HTTP_MAX_CONNECTIONS_PER_HOST: Final[int] = 8
+HTTP_KEEPALIVE_TIMEOUT_SECONDS: Final[int] = 30
+HTTP_DNS_CACHE_TTL_SECONDS: Final[int] = 300
 HTTP_SLEEP_TO_RETRY_SECONDS: Final[int] = 3
+HTTP_RETRY_MAX_ATTEMPTS: Final[int] = 5
+HTTP_RETRY_BASE_DELAY_SECONDS: Final[float] = 0.5
+HTTP_RETRY_MAX_DELAY_SECONDS: Final[float] = 30.0
+HTTP_RETRY_ON_STATUS: Final[frozenset[int]] = frozenset(
+    {408, 425, 429, 500, 502, 503, 504}
+)
+HTTP_RETRY_BUDGET_RATIO: Final[
+    float
+] = 0.2  # * The retries earned per request to a host, wherein a retry spends one.
+HTTP_RETRY_BUDGET_MIN_TOKENS: Final[int] = 10
+HTTP_RETRY_BUDGET_MAX_TOKENS: Final[int] = 100
+HTTP_CIRCUIT_BREAKER_FAILURE_THRESHOLD: Final[
+    int
+] = 5  # * The consecutive failures of a host before its requests fail fast.
+HTTP_CIRCUIT_BREAKER_COOLDOWN_SECONDS: Final[
+    int
+] = 30  # * The time before a host that fails fast is given a single trial request.
+HTTP_STREAM_CHUNK_SIZE_BYTES: Final[int] = 65536
+NODE_WIRE_JSON_MEDIA_TYPE: Final[str] = "application/json"
+NODE_WIRE_MSGPACK_MEDIA_TYPE: Final[
+    str
+] = "application/msgpack"  # * Only used when `msgpack` is installed, otherwise payloads fall back to JSON.
+HTTP_CONTENT_ENCODING_GZIP: Final[str] = "gzip"
+HTTP_CONTENT_ENCODING_ZSTD: Final[
+    str
+] = "zstd"  # * Only used when `zstandard` is installed, otherwise payloads fall back to gzip.
+HTTP_COMPRESSION_MIN_SIZE_BYTES: Final[
+    int
+] = 1024  # * Payloads below this size were sent as-is, as compressing them saves little to nothing.
+HTTP_GZIP_COMPRESSION_LEVEL: Final[int] = 6
+HTTP_ZSTD_COMPRESSION_LEVEL: Final[int] = 3
+HTTP_ZSTD_FRAME_MAGIC_NUMBER: Final[bytes] = b"\x28\xb5\x2f\xfd"
+PROMETHEUS_TEXT_MEDIA_TYPE: Final[str] = "text/plain; version=0.0.4"
+HTTP_LATENCY_HISTOGRAM_BUCKETS_SECONDS: Final[tuple[float, ...]] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+HTTP_METRICS_DUMP_FILENAME_FORMAT: Final[
+    str
+] = "http_metrics_%Y%m%d_%H%M%S.prom"  # * Formatted with the datetime of the dump, saved under the logs folder.
 
 # # Constants, Auth: JWT
 JWT_DAY_EXPIRATION: Final[int] = 7
@@ -157,6 +259,34 @@ DEFAULT_SMTP_TIMEOUT_CONNECTION: Final[int] = 10
 AZURE_SHARED_FILE_FOLDER_NAME: Final[str] = "node-resources"
 DATABASE_NAME: str = "folioblocks-node.db"
 BLOCKCHAIN_NAME: str = "folioblocks-chain.json"
+DATABASE_BUSY_TIMEOUT_MS: Final[
+    int
+] = 15000  # * The time a connection waits for the database to be unlocked, which follows the timeout of the SQL engine.
+DATABASE_CACHE_SIZE_KIB: Final[
+    int
+] = 65536  # * The page cache per connection of the database under the `WAL` profile.
+DATABASE_MMAP_SIZE_BYTES: Final[
+    int
+] = 268435456  # * The size of the database that is read through memory-mapped I/O under the `WAL` profile.
+DATABASE_SNAPSHOT_INTERVAL_SECONDS: Final[
+    int
+] = 5  # * The minimum interval between the snapshots of the database to the volume-mounted storage, which is also the worst-case window of changes lost on a crash.
+DATABASE_SNAPSHOT_DELTAS_PER_BASE: Final[
+    int
+] = 32  # * The deltas (changed pages) saved to the volume-mounted storage before the whole database is saved as the base again, which bounds the deltas to replay on restore.
+DATABASE_DELTA_FILENAME_SUFFIX: Final[str] = ".delta"
+DATABASE_DELTA_SIGNATURE: Final[
+    bytes
+] = b"FBDELTA\x01"  # * The header of the deltas, followed by the sha256 of the base, the sequence, the page size and the page count of the database.
+DATABASE_PAGE_DIGEST_SIZE: Final[
+    int
+] = 16  # * The size of the digest per page of the database, which is compared to find the changed pages.
+PERSISTENCE_EXECUTOR_WORKERS: Final[
+    int
+] = 2  # * The threads that run the encryption, hashing and serialization of the database and the blockchain file.
+PERSISTENCE_EXECUTOR_QUEUE_SIZE: Final[
+    int
+] = 8  # * The operations that can wait for a thread of the persistence executor, wherein further operations wait to be submitted.
 
 # # Variable Constants.
 USER_FILES_FOLDER_NAME: str = "files"
@@ -228,6 +358,7 @@ class NodeAPI(Enum):
 class BlockchainIOAction(IntEnum):
     TO_WRITE = auto()
     TO_READ = auto()
+    TO_APPEND = auto()
 
 
 class BlockchainContentType(IntEnum):
@@ -235,6 +366,16 @@ class BlockchainContentType(IntEnum):
     TRANSACTION = auto()
 
 
+class DatabaseProfile(IntEnum):
+    DEFAULT = auto()
+    WAL = auto()
+
+
+class DatabaseSnapshotMode(IntEnum):
+    FULL = auto()
+    INCREMENTAL = auto()
+
+
 class SourceNodeOrigin(IntEnum):
     FROM_MASTER = auto()
     FROM_ARCHIVAL_MINER = auto()
@@ -330,6 +471,36 @@ class HTTPQueueMethods(IntEnum):
     DELETE = auto()
 
 
+class HTTPRequestCategory(IntEnum):
+    DEFAULT = auto()
+    PROBE = auto()
+    BLOCK_DELIVERY = auto()
+    CHAIN_PULL = auto()
+
+
+# - Timeouts (in seconds) of a request per category, which are ordered by connect, read, and total. A `None` disables the timeout.
+HTTP_TIMEOUTS_PER_CATEGORY: Final[
+    dict[HTTPRequestCategory, tuple[float | None, float | None, float | None]]
+] = {
+    HTTPRequestCategory.DEFAULT: (10, 60, 120),
+    HTTPRequestCategory.PROBE: (2, 3, 5),
+    HTTPRequestCategory.BLOCK_DELIVERY: (5, 30, 60),
+    HTTPRequestCategory.CHAIN_PULL: (
+        10,
+        60,
+        None,
+    ),  # * The chain is streamed, so only the gap between each chunk is bounded.
+}
+
+HTTP_IDEMPOTENT_METHODS: Final[frozenset[HTTPQueueMethods]] = frozenset(
+    {
+        HTTPQueueMethods.GET,
+        HTTPQueueMethods.PUT,
+        HTTPQueueMethods.DELETE,
+    }
+)  # * Requests that are safe to be sent more than once.
+
+
 class HTTPQueueResponseFormat(IntEnum):
     AS_OBJECT = auto()
     AS_JSON = auto()
@@ -405,15 +576,42 @@ FOLIOBLOCKS_EPILOG: Final[ProgramMetadata] = ProgramMetadata(
     "The use of arguments are intended for debugging purposes and development only. Please be careful and be vigilant about the requirements to make certain arguments functioning."
 )
 FOLIOBLOCKS_HELP: Final[dict[ArgumentParameter, ArgumentDescription]] = {
+    ArgumentParameter("COMPRESSION_THRESHOLD"): ArgumentDescription(
+        "The size (in bytes) of which the payloads between nodes are compressed, wherein payloads below this size were sent as-is."
+    ),
+    ArgumentParameter("DATABASE_PROFILE"): ArgumentDescription(
+        "The profile of the connections to the database. `DEFAULT` keeps the rollback journal of SQLite, while `WAL` enables the write-ahead log along with `synchronous=NORMAL`, memory-mapped I/O and a larger page cache, wherein the reads of the explorer and the dashboard no longer block the writes of the blockchain."
+    ),
+    ArgumentParameter("DATABASE_SNAPSHOT_INTERVAL"): ArgumentDescription(
+        "The minimum interval (in seconds) between the snapshots of the database to the volume-mounted storage when the node is deployed, wherein changes made within the interval were saved by a single snapshot. Changes within this interval may be lost when the node crashes."
+    ),
+    ArgumentParameter("DATABASE_SNAPSHOT_MODE"): ArgumentDescription(
+        "The mode of the snapshots of the database to the volume-mounted storage. `FULL` saves the whole database on every snapshot, while `INCREMENTAL` only saves the pages that were changed since the previous snapshot, along with the whole database periodically."
+    ),
     ArgumentParameter("DEPLOYED_DOCKER_MODE"): ArgumentDescription(
         "A switch that tells the backend to use the path of the files under the Azure file share system. This was implemented due to the nature of azure container instance being stateless, hence losing every changes when the container has been closed, crashed, or restarted."
     ),
+    ArgumentParameter("GZIP_LEVEL"): ArgumentDescription(
+        "The compression level (1 to 9) of the payloads between nodes that were compressed by gzip. Higher levels trade CPU time for smaller payloads."
+    ),
     ArgumentParameter("KEY_FILE"): ArgumentDescription(
         "A file that contains a set of keys for encrypting and decrypting information for all transaction-related actions. This argument is a file name and is not required, unless the file has a different name. Ensure that this file was located from the root folder of the node files."
     ),
     ArgumentParameter("LOG_LEVEL"): ArgumentDescription(
         "Specifies the level to log both console and to the file (if enabled). Refer to the Logging Levels of logging or uvicorn logs documentation for more information."
     ),
+    ArgumentParameter("MAX_BLOCKS_IN_FLIGHT"): ArgumentDescription(
+        f"The number of blocks that the {NodeType.MASTER_NODE.name} can have in the process of hashing at once, wherein they can be dispatched to different archival miner nodes. New blocks were held until a block has been appended to the blockchain."
+    ),
+    ArgumentParameter("MAX_CONNECTIONS"): ArgumentDescription(
+        "The number of requests to other nodes that can be in-flight at once, wherein further requests wait for a slot."
+    ),
+    ArgumentParameter("MAX_CONNECTIONS_PER_HOST"): ArgumentDescription(
+        "The number of requests to a single node that can be in-flight at once, wherein further requests to that node wait for a slot."
+    ),
+    ArgumentParameter("MINING_WORKERS"): ArgumentDescription(
+        "The number of processes that will be used to hash (mine) a block. Defaults to the number of CPUs available from the machine."
+    ),
     ArgumentParameter("NODE_HOST"): ArgumentDescription(
         "The IP address that this node instance is going to allocate from the machine."
     ),
@@ -432,4 +630,7 @@ FOLIOBLOCKS_HELP: Final[dict[ArgumentParameter, ArgumentDescription]] = {
     ArgumentParameter("TARGET_PORT"): ArgumentDescription(
         "The port to connect based on the target host address."
     ),
+    ArgumentParameter("ZSTD_LEVEL"): ArgumentDescription(
+        "The compression level (1 to 22) of the payloads between nodes that were compressed by zstd, which is preferred over gzip when `zstandard` is installed on both nodes. Higher levels trade CPU time for smaller payloads."
+    ),
 }
@@ -17,20 +17,24 @@ from logging import Logger, getLogger
 from os import environ as env
 from secrets import token_hex
 from sqlite3 import IntegrityError
-from typing import Any, Final, Mapping
+from typing import Any, Final, Mapping, Type
 from uuid import uuid4
 
 from aiohttp import ClientError, ClientResponse
 from blueprint.models import associated_nodes, auth_codes, tokens, users
 from blueprint.schemas import EntityLoginResult
 from databases import Database
-from fastapi import Depends, Header, HTTPException
-from pydantic import EmailStr
+from fastapi import Depends, Header, HTTPException, Request
+from pydantic import BaseModel, EmailStr, ValidationError
 from pyotp import TOTP
 from sqlalchemy import and_, false, func, select, true
 from sqlalchemy.sql.expression import Insert, Select, Update
 from core.constants import AUTH_CODE_APP_NAME, AUTH_CODE_ISSUER_NAME
-from utils.http import get_http_client_instance
+from utils.http import (
+    get_http_client_instance,
+    get_supported_wire_media_types,
+    import_wire_format,
+)
 
 from core.constants import (
     ADDRESS_UUID_KEY_PREFIX,
@@ -39,6 +43,7 @@ from core.constants import (
     AUTH_CODE_MIN_CONTEXT,
     AUTH_ENV_FILE_NAME,
     BLOCKCHAIN_CONSENSUS_SLEEP_BASE_VALUE,
+    NODE_WIRE_JSON_MEDIA_TYPE,
     TOTP_PASSCODE_REFRESH_INTERVAL,
     TOTP_VALID_WINDOW_SECONDS,
     AddressUUID,
@@ -58,6 +63,7 @@ from core.constants import (
 args_value: Namespace
 identity_tokens: IdentityTokens
 db_instance: Database
+db_read_instance: Database
 logger: Logger = getLogger(ASYNC_TARGET_LOOP)
 master_node_properties: dict[str, str] = {}
 
@@ -84,6 +90,22 @@ def get_database_instance() -> Database:
     return db_instance
 
 
+def store_db_read_instance(instance: Database) -> None:
+    logger.debug(
+        f"Database (read-only) instance has been stored. | Context: {instance}"
+    )
+    global db_read_instance
+    db_read_instance = instance
+
+
+def get_database_read_instance() -> Database:
+    """
+    Returns the database instance whose connections were read-only, which is used by the endpoints that only read from the database.
+    """
+    global db_read_instance
+    return db_read_instance
+
+
 def store_identity_tokens(_tokens: tuple[AddressUUID, JWTToken]) -> None:
     logger.debug(
         f"Identity tokens were stored. | Context: (Address: {_tokens[0]}, JWT Token: {_tokens[1]})"
@@ -636,6 +658,47 @@ class EnsureAuthorized:
         )
 
 
+class ParseWirePayload:
+    """
+    - Parses the body of the request as `model`, wherein the body was encoded as `msgpack` or JSON, based on its `Content-Type`.
+    - Bodies that this node cannot decode were responded with `415 Unsupported Media Type`, so that the sender can fall back to JSON.
+    """
+
+    def __init__(self, model: Type[BaseModel]) -> None:
+        self.__model: Type[BaseModel] = model
+
+    async def __call__(self, request: Request) -> BaseModel:
+        media_type: str = (
+            request.headers.get("content-type", NODE_WIRE_JSON_MEDIA_TYPE)
+            .split(";")[0]
+            .strip()
+        )
+
+        if media_type not in get_supported_wire_media_types():
+            raise HTTPException(
+                detail=f"The payload should be encoded as one of the following: {', '.join(get_supported_wire_media_types())}.",
+                headers={"Accept": ", ".join(get_supported_wire_media_types())},
+                status_code=HTTPStatus.UNSUPPORTED_MEDIA_TYPE,
+            )
+
+        try:
+            return self.__model.parse_obj(
+                import_wire_format(content=await request.body(), media_type=media_type)
+            )
+
+        # ! This should be caught first, as `ValidationError` is also a `ValueError`.
+        except ValidationError as e:
+            raise HTTPException(
+                detail=e.errors(), status_code=HTTPStatus.UNPROCESSABLE_ENTITY
+            )
+
+        except ValueError as e:
+            raise HTTPException(
+                detail=f"The payload cannot be decoded as {media_type}. | Info: {e}",
+                status_code=HTTPStatus.BAD_REQUEST,
+            )
+
+
 # # Passcode Generators — START
 
 
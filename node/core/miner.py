@@ -0,0 +1,400 @@
+"""
+Mining Engine (miner.py) | Contains a process-based proof-of-work engine that is used by the blockchain (blockchain.py) to hash blocks with every workers available from the machine.
+
+This file is part of FolioBlocks.
+
+FolioBlocks is free software: you can redistribute it and/or modify it under the terms of the GNU General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later version.
+FolioBlocks is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with FolioBlocks. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from asyncio import Lock, gather, get_event_loop
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from ctypes import Array, c_ulonglong
+from concurrent.futures.process import BrokenProcessPool
+from hashlib import sha256
+from logging import Logger, getLogger
+from multiprocessing import get_all_start_methods, get_context
+from multiprocessing.synchronize import Event as EventType
+from sys import maxsize as MAX_INT_PYTHON
+from time import perf_counter
+
+from blueprint.schemas import (
+    Block,
+    BlockMiningResult,
+    MinedBlockStatistics,
+    MiningStatistics,
+    MiningWorkerStatistics,
+)
+from utils.processors import format_prometheus_metric
+
+from core.constants import (
+    ASYNC_TARGET_LOOP,
+    BLOCK_HASH_TEMPLATE_NONCE_SUFFIX,
+    BLOCKCHAIN_HASH_BLOCK_DIFFICULTY,
+    BLOCKCHAIN_MINING_HISTORY_LENGTH,
+    BLOCKCHAIN_MINING_STOP_CHECK_INTERVAL,
+    HashUUID,
+    random_generator,
+)
+from core.dependencies import get_args_values
+
+logger: Logger = getLogger(ASYNC_TARGET_LOOP)
+
+# - The event and the attempt counters shared by the workers, assigned from the initializer of each worker process.
+mining_stop_event: EventType
+mining_attempt_counters: Array[c_ulonglong]
+
+
+def _initialize_mining_worker(
+    stop_event: EventType, attempt_counters: Array[c_ulonglong]
+) -> None:
+    global mining_attempt_counters, mining_stop_event
+    mining_stop_event = stop_event
+    mining_attempt_counters = attempt_counters
+
+
+def get_block_hash_template(block: Block) -> bytes:
+    """
+    - Serializes the block once, with its hash and nonce left out, and returns the bytes before the nonce.
+    - Since `nonce` is the last field of the last field (`contents`) of the block, the serialized block always ends with `<nonce>}}`.
+    - Therefore, the hash of the block for any nonce is `sha256(template + b"<nonce>}}")`, which is byte-identical to `compute_block_hash`.
+    """
+    serialized_block: bytes = (
+        block.copy(
+            update={
+                "hash_block": None,
+                "contents": block.contents.copy(update={"nonce": None}),
+            }
+        )
+        .json()
+        .encode("utf-8")
+    )
+
+    nonce_placeholder: bytes = b"null" + BLOCK_HASH_TEMPLATE_NONCE_SUFFIX
+
+    if not serialized_block.endswith(nonce_placeholder):
+        raise ValueError(
+            f"Block #{block.id} cannot be serialized into a template as its nonce is not the last field."
+        )
+
+    return serialized_block[: -len(nonce_placeholder)]
+
+
+def compute_block_hash(block: Block) -> HashUUID:
+    return HashUUID(
+        sha256(
+            block.copy(update={"hash_block": None}).json().encode("utf-8")
+        ).hexdigest()
+    )
+
+
+def _search_nonce_stripe(
+    block_template: bytes, worker_id: int, stripe_start: int, stripe_end: int
+) -> tuple[int, int | None, HashUUID | None, int, float]:
+    """
+    - Searches for a nonce within the given stripe `[stripe_start, stripe_end)` of the nonce space, starting from a random offset and wrapping around the stripe.
+    - The template is hashed once, and every attempt only hashes the nonce digits and the closing braces from a copy of it.
+    - The stop event is checked for every `BLOCKCHAIN_MINING_STOP_CHECK_INTERVAL` attempts, so that this worker stops as soon as any other worker has found a hit. The attempt counter of this worker is published on the same interval.
+    - Returns the worker id, the nonce and the hash (both `None` when cancelled), the number of attempts and the time elapsed.
+    """
+    template_hash = sha256(block_template)
+
+    difficulty_target: str = "0" * BLOCKCHAIN_HASH_BLOCK_DIFFICULTY
+    stripe_length: int = stripe_end - stripe_start
+    nonce_offset: int = random_generator.randrange(stripe_length)
+    attempts: int = 0
+    started: float = perf_counter()
+
+    mining_attempt_counters[worker_id] = 0
+
+    while not mining_stop_event.is_set() and attempts < stripe_length:
+        for _ in range(BLOCKCHAIN_MINING_STOP_CHECK_INTERVAL):
+            nonce: int = stripe_start + (nonce_offset + attempts) % stripe_length
+            attempt_hash = template_hash.copy()
+            attempt_hash.update(b"%d%s" % (nonce, BLOCK_HASH_TEMPLATE_NONCE_SUFFIX))
+            computed_hash: str = attempt_hash.hexdigest()
+            attempts += 1
+
+            if computed_hash[:BLOCKCHAIN_HASH_BLOCK_DIFFICULTY] == difficulty_target:
+                mining_stop_event.set()  # * Cancel other workers.
+                mining_attempt_counters[worker_id] = attempts
+                return (
+                    worker_id,
+                    nonce,
+                    HashUUID(computed_hash),
+                    attempts,
+                    perf_counter() - started,
+                )
+
+        mining_attempt_counters[worker_id] = attempts
+
+    return worker_id, None, None, attempts, perf_counter() - started
+
+
+class MiningEngine:
+    def __init__(self, *, workers: int) -> None:
+        self.workers: int = max(1, workers)  # * Processes to mine a block.
+
+        # - Prefer `fork` as `spawn` re-imports the entrypoint (main.py) on every worker, wherein `spawn` is only used when `fork` is not available (such as Windows).
+        self.__context = get_context(
+            "fork" if "fork" in get_all_start_methods() else "spawn"
+        )
+        self.__stop_event: EventType = self.__context.Event()  # * For all workers.
+        self.__attempt_counters: Array[c_ulonglong] = self.__context.Array(
+            c_ulonglong, self.workers, lock=False
+        )  # * Written by each worker on its own slot, read from the statistics.
+        self.__pool: ProcessPoolExecutor | None = None  # * Created on first use.
+        self.__lock: Lock = Lock()  # * Only one block can be mined at a time.
+
+        # # Statistics
+        self.__current_block_id: int | None = None  # * The block being mined.
+        self.__current_started: float = 0.0  # * When the current block was started.
+        self.__blocks_mined: int = 0  # * Blocks mined since startup.
+        self.__total_attempts: int = 0  # * Attempts of every mined block.
+        self.__total_elapsed_seconds: float = 0.0  # * Time spent of every mined block.
+        self.__history: deque[MinedBlockStatistics] = deque(
+            maxlen=BLOCKCHAIN_MINING_HISTORY_LENGTH
+        )  # * The statistics of the recently mined blocks.
+
+    def __get_pool(self) -> ProcessPoolExecutor:
+        if self.__pool is None:
+            self.__pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=self.__context,
+                initializer=_initialize_mining_worker,
+                initargs=(self.__stop_event, self.__attempt_counters),
+            )
+            logger.info(f"Mining engine has been started with {self.workers} worker/s.")
+
+        return self.__pool
+
+    async def mine(self, *, block: Block) -> BlockMiningResult | None:
+        """
+        - Splits the nonce space into stripes equal to the number of workers, and returns the first nonce that satisfies the difficulty, along with the statistics of each worker.
+        - Returns `None` when the mining was cancelled or when the pool was broken.
+        """
+        async with self.__lock:
+            self.__stop_event.clear()
+
+            block_template: bytes = get_block_hash_template(block)
+            stripe_length: int = (MAX_INT_PYTHON + 1) // self.workers
+
+            for worker_id in range(self.workers):
+                self.__attempt_counters[worker_id] = 0
+
+            self.__current_block_id = block.id
+            self.__current_started = started = perf_counter()
+
+            try:
+                worker_results: list[
+                    tuple[int, int | None, HashUUID | None, int, float]
+                ] = await gather(
+                    *[
+                        get_event_loop().run_in_executor(
+                            self.__get_pool(),
+                            _search_nonce_stripe,
+                            block_template,
+                            worker_id,
+                            worker_id * stripe_length,
+                            (worker_id + 1) * stripe_length,
+                        )
+                        for worker_id in range(self.workers)
+                    ]
+                )
+
+            except BrokenProcessPool as e:
+                logger.error(
+                    f"Mining engine's pool has been broken, the pool will be recreated on the next block. | Info: {e}"
+                )
+                self.__pool = None
+                return None
+
+            finally:
+                self.__current_block_id = None
+
+            mining_duration: float = perf_counter() - started
+            worker_stats: list[MiningWorkerStatistics] = [
+                MiningWorkerStatistics(
+                    worker_id=worker_id,
+                    attempts=attempts,
+                    elapsed_seconds=elapsed,
+                    hash_rate=attempts / elapsed if elapsed else 0.0,
+                )
+                for worker_id, _, _, attempts, elapsed in worker_results
+            ]
+
+            for worker_id, nonce, computed_hash, _, _ in worker_results:
+                if nonce is not None and computed_hash is not None:
+                    block_attempts: int = sum(
+                        worker.attempts for worker in worker_stats
+                    )
+
+                    self.__blocks_mined += 1
+                    self.__total_attempts += block_attempts
+                    self.__total_elapsed_seconds += mining_duration
+                    self.__history.append(
+                        MinedBlockStatistics(
+                            block_id=block.id,
+                            attempts=block_attempts,
+                            elapsed_seconds=mining_duration,
+                            hash_rate=block_attempts / mining_duration
+                            if mining_duration
+                            else 0.0,
+                        )
+                    )
+
+                    return BlockMiningResult(
+                        nonce=nonce,
+                        hash_block=computed_hash,
+                        worker_id=worker_id,
+                        elapsed_seconds=mining_duration,
+                        workers=worker_stats,
+                    )
+
+            logger.warning(f"Mining of block #{block.id} has been cancelled.")
+            return None
+
+    def get_statistics(self) -> MiningStatistics:
+        is_mining: bool = self.__current_block_id is not None
+        current_attempts: int = sum(self.__attempt_counters) if is_mining else 0
+        current_elapsed_seconds: float = (
+            perf_counter() - self.__current_started if is_mining else 0.0
+        )
+
+        return MiningStatistics(
+            workers=self.workers,
+            is_mining=is_mining,
+            current_block_id=self.__current_block_id,
+            current_attempts=current_attempts,
+            current_elapsed_seconds=current_elapsed_seconds,
+            current_hash_rate=current_attempts / current_elapsed_seconds
+            if current_elapsed_seconds
+            else 0.0,
+            blocks_mined=self.__blocks_mined,
+            total_attempts=self.__total_attempts,
+            total_elapsed_seconds=self.__total_elapsed_seconds,
+            history=list(self.__history),
+        )
+
+    def get_metrics(self) -> str:
+        """
+        Returns the mining statistics under the Prometheus text exposition format.
+        """
+        statistics: MiningStatistics = self.get_statistics()
+        last_mined_block: MinedBlockStatistics | None = (
+            statistics.history[-1] if statistics.history else None
+        )
+
+        return "".join(
+            [
+                format_prometheus_metric(
+                    name="folioblocks_mining_workers",
+                    kind="gauge",
+                    description="The number of processes used to mine a block.",
+                    samples=[({}, statistics.workers)],
+                ),
+                format_prometheus_metric(
+                    name="folioblocks_mining_in_progress",
+                    kind="gauge",
+                    description="Whether a block is being mined.",
+                    samples=[({}, int(statistics.is_mining))],
+                ),
+                format_prometheus_metric(
+                    name="folioblocks_mining_current_attempts",
+                    kind="gauge",
+                    description="The nonce attempts of the block being mined.",
+                    samples=[({}, statistics.current_attempts)],
+                ),
+                format_prometheus_metric(
+                    name="folioblocks_mining_current_elapsed_seconds",
+                    kind="gauge",
+                    description="The time spent on the block being mined.",
+                    samples=[({}, statistics.current_elapsed_seconds)],
+                ),
+                format_prometheus_metric(
+                    name="folioblocks_mining_current_hash_rate",
+                    kind="gauge",
+                    description="The hashes per second of the block being mined.",
+                    samples=[({}, statistics.current_hash_rate)],
+                ),
+                format_prometheus_metric(
+                    name="folioblocks_mining_worker_attempts",
+                    kind="gauge",
+                    description="The nonce attempts of each worker from the block being mined.",
+                    samples=[
+                        ({"worker": str(worker_id)}, worker_attempts)
+                        for worker_id, worker_attempts in enumerate(
+                            self.__attempt_counters
+                        )
+                    ]
+                    if statistics.is_mining
+                    else [],
+                ),
+                format_prometheus_metric(
+                    name="folioblocks_mining_blocks_total",
+                    kind="counter",
+                    description="The number of blocks mined.",
+                    samples=[({}, statistics.blocks_mined)],
+                ),
+                format_prometheus_metric(
+                    name="folioblocks_mining_attempts_total",
+                    kind="counter",
+                    description="The nonce attempts of every mined block.",
+                    samples=[({}, statistics.total_attempts)],
+                ),
+                format_prometheus_metric(
+                    name="folioblocks_mining_seconds_total",
+                    kind="counter",
+                    description="The time spent on every mined block.",
+                    samples=[({}, statistics.total_elapsed_seconds)],
+                ),
+                format_prometheus_metric(
+                    name="folioblocks_mining_last_block_seconds",
+                    kind="gauge",
+                    description="The time spent on the last mined block.",
+                    samples=[({}, last_mined_block.elapsed_seconds)]
+                    if last_mined_block is not None
+                    else [],
+                ),
+                format_prometheus_metric(
+                    name="folioblocks_mining_last_block_hash_rate",
+                    kind="gauge",
+                    description="The hashes per second of the last mined block.",
+                    samples=[({}, last_mined_block.hash_rate)]
+                    if last_mined_block is not None
+                    else [],
+                ),
+            ]
+        )
+
+    def cancel(self) -> None:
+        self.__stop_event.set()
+
+    def close(self) -> None:
+        self.cancel()
+
+        if self.__pool is not None:
+            self.__pool.shutdown(wait=False, cancel_futures=True)
+            self.__pool = None
+
+
+mining_engine: MiningEngine | None = None
+
+
+def get_mining_engine_instance(*, initialize: bool = True) -> MiningEngine | None:
+    """
+    Returns the mining engine, wherein `None` is returned when it was not yet initialized and `initialize` is unset.
+    - The `NodeType.MASTER_NODE` only mines the genesis blocks, therefore it should only read the mining engine without `initialize`.
+    """
+    global mining_engine
+
+    if mining_engine is None and not initialize:
+        return None
+
+    if mining_engine is None:
+        logger.debug("Initializing mining engine instance ...")
+        mining_engine = MiningEngine(workers=get_args_values().mining_workers)
+
+    return mining_engine
@@ -0,0 +1,195 @@
+"""
+Persistence Executor (persistence.py) | Contains a bounded thread pool that runs the CPU-bound steps of persistence (encryption, hashing and serialization of large files) outside of the event loop.
+
+This file is part of FolioBlocks.
+
+FolioBlocks is free software: you can redistribute it and/or modify it under the terms of the GNU General Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any later version.
+FolioBlocks is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+You should have received a copy of the GNU General Public License along with FolioBlocks. If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from asyncio import Semaphore, get_event_loop
+from concurrent.futures import ThreadPoolExecutor
+from logging import Logger, getLogger
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, TypeVar
+
+from core.constants import (
+    ASYNC_TARGET_LOOP,
+    PERSISTENCE_EXECUTOR_QUEUE_SIZE,
+    PERSISTENCE_EXECUTOR_WORKERS,
+)
+
+logger: Logger = getLogger(ASYNC_TARGET_LOOP)
+
+T = TypeVar("T")
+
+
+class PersistenceOperationStatistics:
+    def __init__(self) -> None:
+        self.completed: int = 0  # * Operations that were finished, including failures.
+        self.failed: int = 0
+        self.running_seconds: float = 0.0  # * Time spent by the workers.
+        self.queue_wait_seconds: float = 0.0  # * Time spent waiting for a worker.
+
+
+class PersistenceExecutor:
+    def __init__(self, *, workers: int, queue_size: int) -> None:
+        self.workers: int = max(1, workers)  # * Threads to run the operations.
+        self.queue_size: int = max(
+            0, queue_size
+        )  # * Operations that can wait for a worker, wherein the callers wait beyond it.
+
+        self.__pool: ThreadPoolExecutor | None = None  # * Created on first use.
+        self.__slots: Semaphore = Semaphore(
+            self.workers + self.queue_size
+        )  # * Bounds the operations that were submitted to the pool.
+
+        # # Statistics
+        self.__statistics_lock: Lock = (
+            Lock()
+        )  # * The statistics were updated from the workers as well.
+        self.__running: int = 0
+        self.__queued: int = 0
+        self.__statistics: dict[str, PersistenceOperationStatistics] = {}
+
+    def __get_pool(self) -> ThreadPoolExecutor:
+        if self.__pool is None:
+            self.__pool = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="folioblocks_persistence"
+            )
+            logger.info(
+                f"Persistence executor has been started with {self.workers} worker/s."
+            )
+
+        return self.__pool
+
+    async def run(
+        self, operation: str, fn: Callable[..., T], /, *args: Any, **kwargs: Any
+    ) -> T:
+        """
+        - Runs `fn` from a worker and returns its result, wherein `operation` labels its statistics.
+        - When the pool has `queue_size` operations waiting for a worker, this waits until one of them has been taken by a worker.
+        """
+        statistics: PersistenceOperationStatistics = self.__statistics.setdefault(
+            operation, PersistenceOperationStatistics()
+        )
+        enqueued_at: float = perf_counter()
+
+        def run_operation() -> T:
+            started: float = perf_counter()
+
+            with self.__statistics_lock:
+                self.__queued -= 1
+                self.__running += 1
+                statistics.queue_wait_seconds += started - enqueued_at
+
+            try:
+                return fn(*args, **kwargs)
+
+            except Exception:
+                with self.__statistics_lock:
+                    statistics.failed += 1
+                raise
+
+            finally:
+                with self.__statistics_lock:
+                    self.__running -= 1
+                    statistics.completed += 1
+                    statistics.running_seconds += perf_counter() - started
+
+        async with self.__slots:
+            with self.__statistics_lock:
+                self.__queued += 1
+
+            return await get_event_loop().run_in_executor(
+                self.__get_pool(), run_operation
+            )
+
+    def get_metrics(self) -> str:
+        """
+        Returns the statistics of the persistence operations under the Prometheus text exposition format.
+        """
+        # ! This is a late import due to `utils.processors` importing this module.
+        from utils.processors import format_prometheus_metric
+
+        return "".join(
+            [
+                format_prometheus_metric(
+                    name="folioblocks_persistence_workers",
+                    kind="gauge",
+                    description="The number of threads used to run the persistence operations.",
+                    samples=[({}, self.workers)],
+                ),
+                format_prometheus_metric(
+                    name="folioblocks_persistence_running",
+                    kind="gauge",
+                    description="The persistence operations being run.",
+                    samples=[({}, self.__running)],
+                ),
+                format_prometheus_metric(
+                    name="folioblocks_persistence_queued",
+                    kind="gauge",
+                    description="The persistence operations waiting for a worker.",
+                    samples=[({}, self.__queued)],
+                ),
+                format_prometheus_metric(
+                    name="folioblocks_persistence_operations_total",
+                    kind="counter",
+                    description="The persistence operations that were finished, including failures.",
+                    samples=[
+                        ({"operation": operation}, statistics.completed)
+                        for operation, statistics in self.__statistics.items()
+                    ],
+                ),
+                format_prometheus_metric(
+                    name="folioblocks_persistence_failures_total",
+                    kind="counter",
+                    description="The persistence operations that have failed.",
+                    samples=[
+                        ({"operation": operation}, statistics.failed)
+                        for operation, statistics in self.__statistics.items()
+                    ],
+                ),
+                format_prometheus_metric(
+                    name="folioblocks_persistence_seconds_total",
+                    kind="counter",
+                    description="The time spent by the workers on the persistence operations.",
+                    samples=[
+                        ({"operation": operation}, statistics.running_seconds)
+                        for operation, statistics in self.__statistics.items()
+                    ],
+                ),
+                format_prometheus_metric(
+                    name="folioblocks_persistence_queue_wait_seconds_total",
+                    kind="counter",
+                    description="The time spent by the persistence operations waiting for a worker.",
+                    samples=[
+                        ({"operation": operation}, statistics.queue_wait_seconds)
+                        for operation, statistics in self.__statistics.items()
+                    ],
+                ),
+            ]
+        )
+
+    def close(self) -> None:
+        if self.__pool is not None:
+            self.__pool.shutdown(wait=True)
+            self.__pool = None
+
+
+persistence_executor: PersistenceExecutor | None = None
+
+
+def get_persistence_executor_instance() -> PersistenceExecutor:
+    global persistence_executor
+
+    if persistence_executor is None:
+        logger.debug("Initializing persistence executor instance ...")
+        persistence_executor = PersistenceExecutor(
+            workers=PERSISTENCE_EXECUTOR_WORKERS,
+            queue_size=PERSISTENCE_EXECUTOR_QUEUE_SIZE,
+        )
+
+    return persistence_executor
@@ -51,16 +51,22 @@ from core.constants import (
     URLAddress,
     UserActivityState,
 )
+from core.miner import MiningEngine, get_mining_engine_instance
 from core.dependencies import (
     authenticate_node_client,
     get_args_values,
     get_database_instance,
+    get_database_read_instance,
     get_identity_tokens,
     get_master_node_properties,
 )
 from utils.processors import save_database_state_to_volume_storage
 from utils.email import EmailService, get_email_instance
-from utils.http import HTTPClient, get_http_client_instance
+from utils.http import (
+    HTTPClient,
+    HTTPCompressionMiddleware,
+    get_http_client_instance,
+)
 from utils.logger import LoggerHandler
 from utils.processors import (
     close_resources,
@@ -73,287 +79,311 @@ from utils.processors import (
     validate_file_keys,
 )
 
-"""
-# # Startup Dependencies
-- A set of initialized objects that runs before the uvicorn async context. These are out-of-scope due to the nature of FastAPI uninstantiable by nature under class context.
-
-"""
-parsed_args: Namespace = ArgsHandler.parse_args()
-
-# * Resolve some literal parameters to Enum object.
-parsed_args.node_role = (
-    NodeType.MASTER_NODE
-    if parsed_args.node_role == NodeType.MASTER_NODE.name
-    else NodeType.ARCHIVAL_MINER_NODE
-)
-parsed_args.log_level = LoggerLevelCoverage(parsed_args.log_level)
-
-# # Handle folders and resources before processing them.
-# ! Note that this method saves the instance of the `parsed_args`.
-resolve_resources(evaluated_args=parsed_args)
-
-# ! Renew `parsed_args` instance.
-parsed_args = get_args_values()
-
-# # Load environment variable on initialization with coverage on `parsed_args` for better control.
-# ! Note that, we are basically doing what is being offered by argparse.type parameter.
-# ! We need to seperate it to ensure that files are being processed first before resolving its contents.
-env_key_file: str = parsed_args.key_file  # * Save it for later.
-parsed_args.key_file = validate_file_keys(context=parsed_args.key_file)
-"""
-# About these late import of routers.
-@o Since these API endpoints require evaluation from the `parsed_args`, import them after storing `parsed_args` for them to access later.
-@o They need to access these so that certain endpoints will be excluded based on the `parsed_args.node_role`.
-! Note that their contents will change, so better understand the condition and its output as it may contain a router or just a set of functions to call for request to the `MASTER` node.
-"""
-
-from api.node import node_router
-
-# # Run the logger configuration.
-logger_config: dict[str, Any] = LoggerHandler.init(
-    base_config=uvicorn.config.LOGGING_CONFIG,  # type: ignore # ???
-    disable_file_logging=parsed_args.no_log_file,
-    logger_level=LoggerLevelCoverage(parsed_args.log_level),
-)
-
-dictConfig(logger_config)
-logger: Logger = getLogger(
-    ASYNC_TARGET_LOOP
-)  # # Note that, uvicorn will override this in the main thread.
+# ! The workers of the mining engine re-import this module as `__mp_main__` when they were spawned (where `fork` is not available, such as Windows), which should not start the node again.
+if __name__ != "__mp_main__":
+    """
+    # # Startup Dependencies
+    - A set of initialized objects that runs before the uvicorn async context. These are out-of-scope due to the nature of FastAPI uninstantiable by nature under class context.
 
+    """
+    parsed_args: Namespace = ArgsHandler.parse_args()
 
-"""
-# # API Router Setup and Initialization
+    # * Resolve some literal parameters to Enum object.
+    parsed_args.node_role = (
+        NodeType.MASTER_NODE
+        if parsed_args.node_role == NodeType.MASTER_NODE.name
+        else NodeType.ARCHIVAL_MINER_NODE
+    )
+    parsed_args.log_level = LoggerLevelCoverage(parsed_args.log_level)
 
-- Several roles prohibits the use of other functionalities that is designed for the master nodes.
+    # # Handle folders and resources before processing them.
+    # ! Note that this method saves the instance of the `parsed_args`.
+    resolve_resources(evaluated_args=parsed_args)
 
-* About design:
-- FastAPI doesn't seem to support class-based views by nature. Even when fastapi-utils provides that capability, I dont trust its functionality anymore due to the nature of FastAPI being too far than fastapi-utils can keep up.
-- Meaning, that tool may be outdated.` Hacking it like what I did in `CodexLink/discord-activity-badge` would take
-my time more than making other features, which I still haven't done.
+    # ! Renew `parsed_args` instance.
+    parsed_args = get_args_values()
 
-"""
-api_handler: FastAPI = FastAPI()
+    # # Load environment variable on initialization with coverage on `parsed_args` for better control.
+    # ! Note that, we are basically doing what is being offered by argparse.type parameter.
+    # ! We need to seperate it to ensure that files are being processed first before resolving its contents.
+    env_key_file: str = parsed_args.key_file  # * Save it for later.
+    parsed_args.key_file = validate_file_keys(context=parsed_args.key_file)
+    """
+    # About these late import of routers.
+    @o Since these API endpoints require evaluation from the `parsed_args`, import them after storing `parsed_args` for them to access later.
+    @o They need to access these so that certain endpoints will be excluded based on the `parsed_args.node_role`.
+    ! Note that their contents will change, so better understand the condition and its output as it may contain a router or just a set of functions to call for request to the `MASTER` node.
+    """
 
-api_handler.include_router(node_router)
+    from api.node import node_router
 
-if parsed_args.node_role is NodeType.MASTER_NODE:
-    from api.entity import entity_router
+    # # Run the logger configuration.
+    logger_config: dict[str, Any] = LoggerHandler.init(
+        base_config=uvicorn.config.LOGGING_CONFIG,  # type: ignore # ???
+        disable_file_logging=parsed_args.no_log_file,
+        logger_level=LoggerLevelCoverage(parsed_args.log_level),
+    )
 
-    api_handler.include_router(admin_router)
-    api_handler.include_router(entity_router)
-    api_handler.include_router(dashboard_router)
-    api_handler.include_router(explorer_router)
+    dictConfig(logger_config)
+    logger: Logger = getLogger(
+        ASYNC_TARGET_LOOP
+    )  # # Note that, uvicorn will override this in the main thread.
 
-api_handler.add_middleware(
-    CORSMiddleware,
-    allow_credentials=CORS_ALLOW_CREDENTIALS,
-    allow_headers=CORS_ALLOWED_HEADERS,
-    allow_methods=CORS_ALLOWED_METHODS,
-    allow_origins=CORS_ALLOWED_ORIGINS,
-)
+    """
+    # # API Router Setup and Initialization
 
+    - Several roles prohibits the use of other functionalities that is designed for the master nodes.
 
-@api_handler.on_event("startup")
-async def pre_initialize() -> None:
-    logger.info(f"Role detected as {parsed_args.node_role.name}.")
+    * About design:
+    - FastAPI doesn't seem to support class-based views by nature. Even when fastapi-utils provides that capability, I dont trust its functionality anymore due to the nature of FastAPI being too far than fastapi-utils can keep up.
+    - Meaning, that tool may be outdated.` Hacking it like what I did in `CodexLink/discord-activity-badge` would take
+    my time more than making other features, which I still haven't done.
 
-    # - Validate by checking if the email service would run.
-    if (
-        env.get("EMAIL_SERVER_ADDRESS", None) is not None
-        and env.get("EMAIL_SERVER_PWD", None) is not None
-        and parsed_args.node_role is NodeType.MASTER_NODE
-    ):
-        await get_email_instance().connect()
-        get_email_instance().close()
+    """
+    api_handler: FastAPI = FastAPI()
 
-    await get_http_client_instance().initialize()  # * Initialize the HTTP client for such requests.
+    api_handler.include_router(node_router)
 
-    await process_resources_and_return_db_context(
-        runtime=RuntimeLoopContext(__name__),
-        role=NodeType(parsed_args.node_role),
-        auth_key=parsed_args.key_file[0] if parsed_args.key_file is not None else None,
-        env_file=env_key_file,
+    if parsed_args.node_role is NodeType.MASTER_NODE:
+        from api.entity import entity_router
+
+        api_handler.include_router(admin_router)
+        api_handler.include_router(entity_router)
+        api_handler.include_router(dashboard_router)
+        api_handler.include_router(explorer_router)
+
+    api_handler.add_middleware(
+        CORSMiddleware,
+        allow_credentials=CORS_ALLOW_CREDENTIALS,
+        allow_headers=CORS_ALLOWED_HEADERS,
+        allow_methods=CORS_ALLOWED_METHODS,
+        allow_origins=CORS_ALLOWED_ORIGINS,
     )
+    api_handler.add_middleware(
+        HTTPCompressionMiddleware,
+        path_prefix=node_router.prefix,
+        minimum_size=parsed_args.compression_threshold,
+        gzip_level=parsed_args.gzip_level,
+        zstd_level=parsed_args.zstd_level,
+    )  # * Compress the payloads between nodes.
 
-    if parsed_args.node_role is NodeType.ARCHIVAL_MINER_NODE:
-        if parsed_args.target_host is None or parsed_args.target_port is None:
-            unconventional_terminate(
-                message=f"Your instance (as a {parsed_args.node_role}) requires a `TARGET_HOST` as well as `TARGET_PORT` to contact the master node blockchain. Please try again with those parameters supplied.",
-            )
-
-    await get_database_instance().connect()  # * Initialize the database.
-    create_task(
-        post_initialize(),
-        name=f"{parsed_args.node_role.name.lower()}_run_{post_initialize.__name__}",
-    )  # * Create this task instead of scoping out so that the server can instantiate.
+    @api_handler.on_event("startup")
+    async def pre_initialize() -> None:
+        logger.info(f"Role detected as {parsed_args.node_role.name}.")
 
+        # - Validate by checking if the email service would run.
+        if (
+            env.get("EMAIL_SERVER_ADDRESS", None) is not None
+            and env.get("EMAIL_SERVER_PWD", None) is not None
+            and parsed_args.node_role is NodeType.MASTER_NODE
+        ):
+            await get_email_instance().connect()
+            get_email_instance().close()
+
+        await get_http_client_instance().initialize()  # * Initialize the HTTP client for such requests.
+
+        await process_resources_and_return_db_context(
+            runtime=RuntimeLoopContext(__name__),
+            role=NodeType(parsed_args.node_role),
+            auth_key=parsed_args.key_file[0]
+            if parsed_args.key_file is not None
+            else None,
+            env_file=env_key_file,
+        )
 
-async def post_initialize() -> None:
-    """
-    - An extension of the initialize() startup function without blocking the instance of uvicorn.
-    - By continously awaiting tasks from the initialize() function, we can't do anything unless we left out of it or do asyncio.create_task() to get out-of-scope with initialize().
-    - Tasks moved from the initialize() function may adjust to concurrently run the instance while doing other several checks.
-    """
+        if parsed_args.node_role is NodeType.ARCHIVAL_MINER_NODE:
+            if parsed_args.target_host is None or parsed_args.target_port is None:
+                unconventional_terminate(
+                    message=f"Your instance (as a {parsed_args.node_role}) requires a `TARGET_HOST` as well as `TARGET_PORT` to contact the master node blockchain. Please try again with those parameters supplied.",
+                )
 
-    await authenticate_node_client(
-        role=NodeType(parsed_args.node_role),
-        instances=(parsed_args, get_database_instance()),
-    )
+        await get_database_instance().connect()  # * Initialize the database.
+        await get_database_read_instance().connect()  # * Initialize the (read-only) database for the explorer and dashboard.
+        create_task(
+            post_initialize(),
+            name=f"{parsed_args.node_role.name.lower()}_run_{post_initialize.__name__}",
+        )  # * Create this task instead of scoping out so that the server can instantiate.
+
+    async def post_initialize() -> None:
+        """
+        - An extension of the initialize() startup function without blocking the instance of uvicorn.
+        - By continously awaiting tasks from the initialize() function, we can't do anything unless we left out of it or do asyncio.create_task() to get out-of-scope with initialize().
+        - Tasks moved from the initialize() function may adjust to concurrently run the instance while doing other several checks.
+        """
+
+        await authenticate_node_client(
+            role=NodeType(parsed_args.node_role),
+            instances=(parsed_args, get_database_instance()),
+        )
 
-    # * I don't know, I don't like to complicate this with another complex conditional checking here. Try to visualize what will happen here on some certain extreme-isolated case condition.
+        # * I don't know, I don't like to complicate this with another complex conditional checking here. Try to visualize what will happen here on some certain extreme-isolated case condition.
+
+        if parsed_args.node_role is NodeType.ARCHIVAL_MINER_NODE:
+            # @o As an `ARCHIVAL_MINER_NODE`, store the target host address and port, which will be accessed later.
+            if (
+                env.get("NODE_USERNAME", None) is not None
+                and env.get("NODE_PWD", None) is not None
+            ):
+                await contact_master_node(
+                    master_host=parsed_args.target_host,
+                    master_port=parsed_args.target_port,
+                )
 
-    if parsed_args.node_role is NodeType.ARCHIVAL_MINER_NODE:
-        # @o As an `ARCHIVAL_MINER_NODE`, store the target host address and port, which will be accessed later.
-        if (
-            env.get("NODE_USERNAME", None) is not None
-            and env.get("NODE_PWD", None) is not None
-        ):
-            await contact_master_node(
-                master_host=parsed_args.target_host,
-                master_port=parsed_args.target_port,
+            (
+                parsed_args.target_host,
+                parsed_args.target_port,
+            ) = get_master_node_properties(
+                key=REF_MASTER_BLOCKCHAIN_ADDRESS
+            ), get_master_node_properties(
+                key=REF_MASTER_BLOCKCHAIN_PORT
             )
 
-        parsed_args.target_host, parsed_args.target_port = get_master_node_properties(
-            key=REF_MASTER_BLOCKCHAIN_ADDRESS
-        ), get_master_node_properties(key=REF_MASTER_BLOCKCHAIN_PORT)
+        else:  # * Resolved to NodeType.MASTER_NODE.
+            await look_for_archival_nodes()
 
-    else:  # * Resolved to NodeType.MASTER_NODE.
-        await look_for_archival_nodes()
-
-    # * In the end, both NodeType.MASTER_NODE and NodeType.ARCHIVAL_MINER_NODE will initialize their local or universal (depending on the role) blockchain file.
-    create_task(
-        get_blockchain_instance(
-            role=parsed_args.node_role
-        ).initialize(),  # type: ignore
-        name=f"initialize_blockchain_as_{parsed_args.node_role.name.lower()}",
-    )
+        # * In the end, both NodeType.MASTER_NODE and NodeType.ARCHIVAL_MINER_NODE will initialize their local or universal (depending on the role) blockchain file.
+        create_task(
+            get_blockchain_instance(
+                role=parsed_args.node_role
+            ).initialize(),  # type: ignore
+            name=f"initialize_blockchain_as_{parsed_args.node_role.name.lower()}",
+        )
 
+    @api_handler.on_event("shutdown")
+    async def terminate() -> None:
+        # - Supress exceptions and warnings.
+        # @o Why? Because there are some sessions and asyncio-related exceptions and warnings are technically polluting the console even though everything is resolved.
+        # @o With that, it is expected that this is unethical as ignoring messages and other stuff is indeed ignorant from the errors.
+        # @o But trust me, this is needed in the context of some errors that can't be handled because they are in internal and is not directly affecting components who uses it.
+        supress_exceptions_and_warnings()
 
-@api_handler.on_event("shutdown")
-async def terminate() -> None:
-    # - Supress exceptions and warnings.
-    # @o Why? Because there are some sessions and asyncio-related exceptions and warnings are technically polluting the console even though everything is resolved.
-    # @o With that, it is expected that this is unethical as ignoring messages and other stuff is indeed ignorant from the errors.
-    # @o But trust me, this is needed in the context of some errors that can't be handled because they are in internal and is not directly affecting components who uses it.
-    supress_exceptions_and_warnings()
+        identity_tokens: IdentityTokens | None = get_identity_tokens()
+        http_instance: HTTPClient = get_http_client_instance()
+        database_instance: Database = get_database_instance()
 
-    identity_tokens: IdentityTokens | None = get_identity_tokens()
-    http_instance: HTTPClient = get_http_client_instance()
-    database_instance: Database = get_database_instance()
+        if parsed_args.node_role is NodeType.MASTER_NODE:
+            email_instance: EmailService | None = get_email_instance()
 
-    if parsed_args.node_role is NodeType.MASTER_NODE:
-        email_instance: EmailService | None = get_email_instance()
-
-        if email_instance is not None and email_instance.is_connected:
-            email_instance.close()  # * Shutdown email service instance.
-
-        # * Remove the token related to this master, as well as, change the state of this master account to Offline.
-        if identity_tokens is not None:
-            # - Update state to `Offline`.
-            master_state_to_down_query: Update = (
-                users.update()
-                .where(users.c.unique_address == identity_tokens[0])
-                .values(activity=UserActivityState.OFFLINE)
-            )
+            if email_instance is not None and email_instance.is_connected:
+                email_instance.close()  # * Shutdown email service instance.
 
-            # - Invalidate its own token.
-            # @o We cannot use our own endpoint when the server is shutting down, meaning we cannot communicate with its own API any longer.
-            master_token_to_expired_query: Update = (
-                tokens.update()
-                .where(tokens.c.token == identity_tokens[1])
-                .values(state=TokenStatus.LOGGED_OUT)
-            )
+            # * Remove the token related to this master, as well as, change the state of this master account to Offline.
+            if identity_tokens is not None:
+                # - Update state to `Offline`.
+                master_state_to_down_query: Update = (
+                    users.update()
+                    .where(users.c.unique_address == identity_tokens[0])
+                    .values(activity=UserActivityState.OFFLINE)
+                )
 
-            await gather(
-                database_instance.execute(master_token_to_expired_query),
-                database_instance.execute(master_state_to_down_query),
-                save_database_state_to_volume_storage(),
-            )
+                # - Invalidate its own token.
+                # @o We cannot use our own endpoint when the server is shutting down, meaning we cannot communicate with its own API any longer.
+                master_token_to_expired_query: Update = (
+                    tokens.update()
+                    .where(tokens.c.token == identity_tokens[1])
+                    .values(state=TokenStatus.LOGGED_OUT)
+                )
 
-            logger.info(
-                f"Master node's token has been invalidated due to logout session."
-            )
+                await gather(
+                    database_instance.execute(master_token_to_expired_query),
+                    database_instance.execute(master_state_to_down_query),
+                    save_database_state_to_volume_storage(),
+                )
 
-    else:
-        # - Ignore this if this node wasn't logged on.
-        if identity_tokens is not None:
-            await http_instance.enqueue_request(
-                url=URLAddress(
-                    f"{parsed_args.target_host}:{parsed_args.target_port}/entity/logout"
-                ),
-                method=HTTPQueueMethods.POST,
-                do_not_retry=True,
-                await_result_immediate=True,
-                headers={"X-Token": JWTToken(identity_tokens[1])},
-                name=f"request_logout_node_as_{parsed_args.node_role.name.lower()}",
-            )
+                logger.info(
+                    f"Master node's token has been invalidated due to logout session."
+                )
 
-    if http_instance is not None:
-        await http_instance.close(
-            should_destroy=True
-        )  # * Shutdown the HTTP client module.
+        else:
+            # - Ignore this if this node wasn't logged on.
+            if identity_tokens is not None:
+                await http_instance.enqueue_request(
+                    url=URLAddress(
+                        f"{parsed_args.target_host}:{parsed_args.target_port}/entity/logout"
+                    ),
+                    method=HTTPQueueMethods.POST,
+                    do_not_retry=True,
+                    await_result_immediate=True,
+                    headers={"X-Token": JWTToken(identity_tokens[1])},
+                    name=f"request_logout_node_as_{parsed_args.node_role.name.lower()}",
+                )
 
-    await close_resources(
-        key=parsed_args.key_file[0]
-    )  # * When necessary services finished, close the resource, as well as the database to go back from their malformed structure.
+        mining_engine: MiningEngine | None = get_mining_engine_instance(
+            initialize=False
+        )
 
-    logger.info("Wait for 3 seconds to ensure that all processes closed down ...")
-    await sleep(3)
+        if mining_engine is not None:
+            mining_engine.close()  # * Cancel the block being mined and shutdown its workers.
 
+        if http_instance is not None:
+            await http_instance.close(
+                should_destroy=True
+            )  # * Shutdown the HTTP client module.
+            await http_instance.dump_metrics()  # * Keep the metrics of this session.
 
-"""
-# Repeated Tasks
--These are the tasks that needs to be executed at certain amount of time to evaluate the blockchain consensus mechanism. Sooner or later,
+        await close_resources(
+            key=parsed_args.key_file[0]
+        )  # * When necessary services finished, close the resource, as well as the database to go back from their malformed structure.
 
-"""
+        logger.info("Wait for 3 seconds to ensure that all processes closed down ...")
+        await sleep(3)
 
-if parsed_args.node_role is NodeType.MASTER_NODE:
-    logger.warning(
-        f"Several functions for the `{NodeType.MASTER_NODE.name} `were imported due to invocation of the role."
-    )
+    """
+    # Repeated Tasks
+    -These are the tasks that needs to be executed at certain amount of time to evaluate the blockchain consensus mechanism. Sooner or later,
 
-    @api_handler.on_event("startup")
-    @repeat_every(seconds=120, wait_first=True)
-    async def jwt_session_invalidator() -> None:
-        database_instance: Database = get_database_instance()
+    """
 
-        ## Query available tokens.
-        token_query: Select = tokens.select().where(
-            (tokens.c.state != TokenStatus.EXPIRED)
-            & (tokens.c.expiration.isnot(None))  # type: ignore
+    if parsed_args.node_role is NodeType.MASTER_NODE:
+        logger.warning(
+            f"Several functions for the `{NodeType.MASTER_NODE.name} `were imported due to invocation of the role."
         )
 
-        tokens_available: list[Mapping] = await database_instance.fetch_all(token_query)
+        @api_handler.on_event("startup")
+        @repeat_every(seconds=120, wait_first=True)
+        async def jwt_session_invalidator() -> None:
+            database_instance: Database = get_database_instance()
 
-        if not tokens_available:
-            logger.warning("There are no tokens available to iterate as of the moment.")
-
-        current_datetime: datetime = datetime.now()
+            ## Query available tokens.
+            token_query: Select = tokens.select().where(
+                (tokens.c.state != TokenStatus.EXPIRED)
+                & (tokens.c.expiration.isnot(None))  # type: ignore
+            )
 
-        for each_tokens in tokens_available:
-            token = Tokens.parse_obj(each_tokens)
+            tokens_available: list[Mapping] = await database_instance.fetch_all(
+                token_query
+            )
 
-            if token.expiration is not None:
-                logger.debug(
-                    f"@ Token {token.id} | JWT Invalidation Condition (of {current_datetime.isoformat()} vs. {token.expiration.isoformat()}) | '(Should be) >' {current_datetime > token.expiration} | '(Should be) ==' {current_datetime == token.expiration} | `<' {current_datetime < token.expiration}"
+            if not tokens_available:
+                logger.warning(
+                    "There are no tokens available to iterate as of the moment."
                 )
 
-                if current_datetime >= token.expiration:
-                    token_to_del: Update = (
-                        tokens.update()
-                        .where(tokens.c.expiration == token.expiration)
-                        .values(state=TokenStatus.EXPIRED)
-                    )  # - Change the state of the token when past through expiration.
+            current_datetime: datetime = datetime.now()
+
+            for each_tokens in tokens_available:
+                token = Tokens.parse_obj(each_tokens)
 
-                    await gather(
-                        database_instance.execute(token_to_del),
-                        save_database_state_to_volume_storage(),
+                if token.expiration is not None:
+                    logger.debug(
+                        f"@ Token {token.id} | JWT Invalidation Condition (of {current_datetime.isoformat()} vs. {token.expiration.isoformat()}) | '(Should be) >' {current_datetime > token.expiration} | '(Should be) ==' {current_datetime == token.expiration} | `<' {current_datetime < token.expiration}"
                     )
 
-                    logger.info(
-                        f"Token {token.token[:25]}(...) was set to {TokenStatus.EXPIRED.name} due to its expiration date {token.expiration}."
-                    )  # - Character beyond 25th will be truncated. This is just a pure random though.
+                    if current_datetime >= token.expiration:
+                        token_to_del: Update = (
+                            tokens.update()
+                            .where(tokens.c.expiration == token.expiration)
+                            .values(state=TokenStatus.EXPIRED)
+                        )  # - Change the state of the token when past through expiration.
+
+                        await gather(
+                            database_instance.execute(token_to_del),
+                            save_database_state_to_volume_storage(),
+                        )
+
+                        logger.info(
+                            f"Token {token.token[:25]}(...) was set to {TokenStatus.EXPIRED.name} due to its expiration date {token.expiration}."
+                        )  # - Character beyond 25th will be truncated. This is just a pure random though.
 
 
 # * We cannot encapsulate the whole (main.py) module as there's a subprocess instantiated wherein there's a custom `__main__` that will run this script. Avoiding this technique will cause recursion.
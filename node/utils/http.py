@@ -1,53 +1,726 @@
-from asyncio import Task, create_task, sleep
+from argparse import Namespace
+from asyncio import TimeoutError as AsyncTimeoutError
+from asyncio import (
+    CancelledError,
+    Future,
+    Queue,
+    Task,
+    Semaphore,
+    create_task,
+    current_task,
+    gather,
+    get_running_loop,
+    sleep,
+)
+from bisect import bisect_left
+from datetime import datetime
+from enum import Enum
+from http import HTTPStatus
 from logging import Logger, getLogger
 from secrets import token_urlsafe
-from typing import Any
+from time import monotonic, perf_counter
+from typing import Any, AsyncIterator
+from urllib.parse import urlsplit
+from zlib import DEFLATED, MAX_WBITS, compressobj, decompressobj
 
+from aiofiles import open as aopen
 from aiohttp import (
     ClientConnectionError,
     ClientConnectorError,
     ClientResponse,
     ClientSession,
+    ClientTimeout,
     ContentTypeError,
+    TCPConnector,
 )
 from blueprint.schemas import HTTPRequestPayload
+from orjson import dumps as export_to_json
+from orjson import loads as import_raw_json_to_dict
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from core.constants import (
     ASYNC_TARGET_LOOP,
     HTTPQueueMethods,
     HTTPQueueResponseFormat,
+    HTTPRequestCategory,
     RequestPayloadContext,
     URLAddress,
 )
 from core.constants import AddressUUID
 from core.constants import (
-    HTTP_MICRO_SLEEP_TO_FETCH_REQUEST,
+    HTTP_CIRCUIT_BREAKER_COOLDOWN_SECONDS,
+    HTTP_CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    HTTP_COMPRESSION_MIN_SIZE_BYTES,
+    HTTP_CONTENT_ENCODING_GZIP,
+    HTTP_CONTENT_ENCODING_ZSTD,
+    HTTP_DNS_CACHE_TTL_SECONDS,
+    HTTP_GZIP_COMPRESSION_LEVEL,
+    HTTP_IDEMPOTENT_METHODS,
+    HTTP_KEEPALIVE_TIMEOUT_SECONDS,
+    HTTP_LATENCY_HISTOGRAM_BUCKETS_SECONDS,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_CONNECTIONS_PER_HOST,
+    HTTP_METRICS_DUMP_FILENAME_FORMAT,
+    HTTP_RETRY_BASE_DELAY_SECONDS,
+    HTTP_RETRY_BUDGET_MAX_TOKENS,
+    HTTP_RETRY_BUDGET_MIN_TOKENS,
+    HTTP_RETRY_BUDGET_RATIO,
+    HTTP_RETRY_MAX_ATTEMPTS,
+    HTTP_RETRY_MAX_DELAY_SECONDS,
+    HTTP_RETRY_ON_STATUS,
     HTTP_SLEEP_TO_RETRY_SECONDS,
+    HTTP_STREAM_CHUNK_SIZE_BYTES,
+    HTTP_TIMEOUTS_PER_CATEGORY,
+    HTTP_ZSTD_COMPRESSION_LEVEL,
+    HTTP_ZSTD_FRAME_MAGIC_NUMBER,
+    NODE_WIRE_JSON_MEDIA_TYPE,
+    NODE_WIRE_MSGPACK_MEDIA_TYPE,
+    random_generator,
 )
 
+# ! `msgpack` is a dependency of the node, wherein the payloads that were sent with `use_binary_format` fall back to JSON (via `orjson`) only on development installs without it.
+try:
+    from msgpack import packb as export_to_msgpack
+    from msgpack import unpackb as import_raw_msgpack_to_dict
+except ImportError:
+    export_to_msgpack = import_raw_msgpack_to_dict = None  # type: ignore
+
+# ! `zstandard` is a dependency of the node, wherein the payloads were compressed by gzip only on development installs without it.
+try:
+    from zstandard import ZstdCompressor, ZstdDecompressor
+except ImportError:
+    ZstdCompressor = ZstdDecompressor = None  # type: ignore
+
 logger: Logger = getLogger(ASYNC_TARGET_LOOP)
 
 
+class HTTPClientLocalResponse:
+    """
+    - A response that was resolved by the client itself, without a response from the host.
+    - It mimics the attributes of `ClientResponse` that were used across the codebase, so that the callers can handle it the same as an error response.
+    """
+
+    def __init__(self, *, url: URLAddress, status: HTTPStatus, reason: str) -> None:
+        self.url: URLAddress = url
+        self.status: int = status.value
+        self.reason: str = reason
+        self.ok: bool = False
+        self.headers: dict[str, str] = {}
+
+    async def json(self, **_: Any) -> dict[str, str]:
+        return {"detail": self.reason}
+
+    async def text(self, **_: Any) -> str:
+        return self.reason
+
+    def release(self) -> None:
+        return None
+
+    def __repr__(self) -> str:
+        return f"<{HTTPClientLocalResponse.__name__}({self.url}) [{self.status} {self.reason}]>"
+
+
+class HTTPClientTimeoutResponse(HTTPClientLocalResponse):
+    """
+    A response of a request that has been cancelled from exceeding one of its timeouts, which is distinct from a host that cannot be reached.
+    """
+
+    def __init__(self, *, url: URLAddress, reason: str) -> None:
+        super().__init__(url=url, status=HTTPStatus.GATEWAY_TIMEOUT, reason=reason)
+        self.timed_out: bool = True
+
+
+class HTTPRetryPolicy:
+    """
+    - A policy that decides whether a failed request should be retried, and how long it should wait before doing so.
+    - The delay grows exponentially from `base_delay_seconds` up to `max_delay_seconds`, wherein a random delay below it is taken (full jitter) so that nodes retrying at once won't hit the host at once.
+    - Requests under `HTTPQueueMethods` that are not idempotent were not retried, unless `retry_non_idempotent` is set, which is for the endpoints that can handle a duplicate request.
+    - Requests were bounded by the retry budget and the circuit breaker of the host (see `HTTPHostHealth`), unless `use_host_health` is unset, which is for the requests that should keep retrying until `max_attempts`.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = HTTP_RETRY_MAX_ATTEMPTS,
+        base_delay_seconds: float = HTTP_RETRY_BASE_DELAY_SECONDS,
+        max_delay_seconds: float = HTTP_RETRY_MAX_DELAY_SECONDS,
+        retry_non_idempotent: bool = False,
+        retry_on_status: frozenset[int] = HTTP_RETRY_ON_STATUS,
+        use_host_health: bool = True,
+    ) -> None:
+        self.max_attempts: int = max_attempts
+        self.base_delay_seconds: float = base_delay_seconds
+        self.max_delay_seconds: float = max_delay_seconds
+        self.retry_non_idempotent: bool = retry_non_idempotent
+        self.retry_on_status: frozenset[int] = retry_on_status
+        self.use_host_health: bool = use_host_health
+
+    def is_retryable(
+        self,
+        *,
+        method: HTTPQueueMethods,
+        response: ClientResponse | HTTPClientLocalResponse | None,
+    ) -> bool:
+        if method not in HTTP_IDEMPOTENT_METHODS and not self.retry_non_idempotent:
+            return False
+
+        # - Requests without a response failed from the connection itself.
+        return response is None or response.status in self.retry_on_status
+
+    def get_delay(self, *, attempt: int) -> float:
+        return random_generator.uniform(
+            0,
+            min(self.max_delay_seconds, self.base_delay_seconds * 2 ** (attempt - 1)),
+        )
+
+
+class HTTPHostHealth:
+    """
+    - Contains the state of a host, which is shared by every request to that host.
+    - Retry Budget: Every request earns a fraction of a retry, and every retry spends one. This keeps the retries as a fraction of the requests when the host goes down.
+    - Circuit Breaker: Once the host fails consecutively, requests with a `HTTPRetryPolicy` (that uses the health of the host) fail fast. After the cooldown, a single request is let through to test the host, wherein its result either closes or re-opens the circuit.
+    """
+
+    def __init__(self) -> None:
+        self.consecutive_failures: int = 0
+        self.circuit_opened_at: float | None = None  # * Opened when not `None`.
+        self.retry_tokens: float = HTTP_RETRY_BUDGET_MIN_TOKENS
+
+    def record_request(self) -> None:
+        self.retry_tokens = min(
+            self.retry_tokens + HTTP_RETRY_BUDGET_RATIO, HTTP_RETRY_BUDGET_MAX_TOKENS
+        )
+
+    def record_success(self) -> None:
+        self.consecutive_failures = 0
+        self.circuit_opened_at = None
+
+    def record_failure(self) -> None:
+        self.consecutive_failures += 1
+
+        if self.consecutive_failures >= HTTP_CIRCUIT_BREAKER_FAILURE_THRESHOLD:
+            self.circuit_opened_at = monotonic()
+
+    def allows_request(self) -> bool:
+        if self.circuit_opened_at is None:
+            return True
+
+        if (
+            monotonic() - self.circuit_opened_at
+            >= HTTP_CIRCUIT_BREAKER_COOLDOWN_SECONDS
+        ):
+            # - Let this request through, while the others fail fast until it has a result.
+            self.circuit_opened_at = monotonic()
+            return True
+
+        return False
+
+    def withdraw_retry(self) -> bool:
+        if self.retry_tokens < 1:
+            return False
+
+        self.retry_tokens -= 1
+        return True
+
+
+class HTTPLatencyHistogram:
+    """
+    - A histogram of the observed latencies (in seconds), wherein each bucket counts the observations that were less than or equal to its upper bound.
+    """
+
+    def __init__(
+        self, *, buckets: tuple[float, ...] = HTTP_LATENCY_HISTOGRAM_BUCKETS_SECONDS
+    ) -> None:
+        self.buckets: tuple[float, ...] = buckets
+        self.bucket_counts: list[int] = [0] * len(buckets)  # * Not cumulative.
+        self.sum: float = 0.0
+        self.count: int = 0
+
+    def observe(self, seconds: float) -> None:
+        bucket_index: int = bisect_left(self.buckets, seconds)
+
+        if bucket_index < len(self.buckets):
+            self.bucket_counts[bucket_index] += 1
+
+        self.sum += seconds
+        self.count += 1
+
+    def get_cumulative_counts(self) -> list[int]:
+        cumulative_counts: list[int] = []
+        current_count: int = 0
+
+        for bucket_count in self.bucket_counts:
+            current_count += bucket_count
+            cumulative_counts.append(current_count)
+
+        return cumulative_counts
+
+
+class HTTPClientMetrics:
+    """
+    - Contains the instrumentation of the requests, labelled by their endpoint (the path of the URL, without its query) and their peer (`host:port`).
+    - Latency is measured from the dispatch of the request until its response, timeout or error. Queue wait is measured from the time the request was enqueued until it was dispatched, which includes the wait for a connection slot.
+    """
+
+    def __init__(self) -> None:
+        self.latency: dict[
+            tuple[str, str], HTTPLatencyHistogram
+        ] = {}  # * Keyed by (endpoint, peer).
+        self.queue_wait: dict[str, HTTPLatencyHistogram] = {}  # * Keyed by peer.
+        self.responses_total: dict[
+            tuple[str, str, str], int
+        ] = (
+            {}
+        )  # * Keyed by (endpoint, peer, outcome), wherein the outcome is either the status code, `timeout` or `error`.
+        self.retries_total: dict[
+            tuple[str, str], int
+        ] = {}  # * Keyed by (endpoint, peer).
+
+    @staticmethod
+    def get_labels(*, url: str) -> tuple[str, str]:
+        split_url = urlsplit(url)
+        return split_url.path or "/", split_url.netloc
+
+    def observe_queue_wait(self, *, url: str, seconds: float) -> None:
+        _, peer = self.get_labels(url=url)
+        self.queue_wait.setdefault(peer, HTTPLatencyHistogram()).observe(seconds)
+
+    def observe_response(self, *, url: str, outcome: str, seconds: float) -> None:
+        endpoint, peer = self.get_labels(url=url)
+
+        self.latency.setdefault((endpoint, peer), HTTPLatencyHistogram()).observe(
+            seconds
+        )
+        self.responses_total[(endpoint, peer, outcome)] = (
+            self.responses_total.get((endpoint, peer, outcome), 0) + 1
+        )
+
+    def record_retry(self, *, url: str) -> None:
+        labels: tuple[str, str] = self.get_labels(url=url)
+        self.retries_total[labels] = self.retries_total.get(labels, 0) + 1
+
+    def get_metrics(self) -> str:
+        """
+        Returns the instrumentation of the requests under the Prometheus text exposition format.
+        """
+        # ! This is a late import due to `utils.processors` importing this module.
+        from utils.processors import (
+            format_prometheus_histogram,
+            format_prometheus_metric,
+        )
+
+        return "".join(
+            [
+                format_prometheus_histogram(
+                    name="folioblocks_http_request_duration_seconds",
+                    description="The time from the dispatch of a request until its response, timeout or error.",
+                    buckets=HTTP_LATENCY_HISTOGRAM_BUCKETS_SECONDS,
+                    histograms=[
+                        (
+                            {"endpoint": endpoint, "peer": peer},
+                            histogram.get_cumulative_counts(),
+                            histogram.sum,
+                            histogram.count,
+                        )
+                        for (endpoint, peer), histogram in self.latency.items()
+                    ],
+                ),
+                format_prometheus_histogram(
+                    name="folioblocks_http_queue_wait_seconds",
+                    description="The time from the enqueue of a request until its dispatch.",
+                    buckets=HTTP_LATENCY_HISTOGRAM_BUCKETS_SECONDS,
+                    histograms=[
+                        (
+                            {"peer": peer},
+                            histogram.get_cumulative_counts(),
+                            histogram.sum,
+                            histogram.count,
+                        )
+                        for peer, histogram in self.queue_wait.items()
+                    ],
+                ),
+                format_prometheus_metric(
+                    name="folioblocks_http_responses_total",
+                    kind="counter",
+                    description="The number of requests that were resolved, by their status code, `timeout` or `error`.",
+                    samples=[
+                        (
+                            {"endpoint": endpoint, "peer": peer, "outcome": outcome},
+                            total,
+                        )
+                        for (
+                            endpoint,
+                            peer,
+                            outcome,
+                        ), total in self.responses_total.items()
+                    ],
+                ),
+                format_prometheus_metric(
+                    name="folioblocks_http_retries_total",
+                    kind="counter",
+                    description="The number of requests that were re-enqueued after they have failed.",
+                    samples=[
+                        ({"endpoint": endpoint, "peer": peer}, total)
+                        for (endpoint, peer), total in self.retries_total.items()
+                    ],
+                ),
+            ]
+        )
+
+
+def _resolve_msgpack_type(value: Any) -> Any:
+    # - Resolve the types that `msgpack` cannot pack, the same way as `orjson` does.
+    if isinstance(value, datetime):
+        return value.isoformat()
+
+    if isinstance(value, Enum):
+        return value.value
+
+    raise TypeError(f"Type {type(value)} cannot be serialized to msgpack.")
+
+
+def get_supported_wire_media_types() -> list[str]:
+    return (
+        [NODE_WIRE_MSGPACK_MEDIA_TYPE, NODE_WIRE_JSON_MEDIA_TYPE]
+        if export_to_msgpack is not None
+        else [NODE_WIRE_JSON_MEDIA_TYPE]
+    )
+
+
+def export_to_wire_format(*, data: Any, media_type: str) -> bytes:
+    """
+    Encodes the `data` under `media_type`, which is either `msgpack` or JSON (via `orjson`).
+    """
+    if media_type == NODE_WIRE_MSGPACK_MEDIA_TYPE and export_to_msgpack is not None:
+        return export_to_msgpack(data, default=_resolve_msgpack_type)
+
+    return export_to_json(data)
+
+
+def import_wire_format(*, content: bytes, media_type: str) -> Any:
+    """
+    Decodes the `content` that was encoded under `media_type`. Raises `ValueError` when the content cannot be decoded.
+    """
+    if media_type == NODE_WIRE_MSGPACK_MEDIA_TYPE:
+        if import_raw_msgpack_to_dict is None:
+            raise ValueError("This node cannot decode msgpack payloads.")
+
+        return import_raw_msgpack_to_dict(content)
+
+    return import_raw_json_to_dict(content)
+
+
+def get_supported_content_encodings() -> list[str]:
+    return (
+        [HTTP_CONTENT_ENCODING_ZSTD, HTTP_CONTENT_ENCODING_GZIP]
+        if ZstdCompressor is not None
+        else [HTTP_CONTENT_ENCODING_GZIP]
+    )
+
+
+def create_compressor(*, encoding: str, level: int) -> Any:
+    """
+    Returns an incremental compressor of `encoding`, wherein both `compress()` and `flush()` return the compressed bytes so far.
+    """
+    if encoding == HTTP_CONTENT_ENCODING_ZSTD and ZstdCompressor is not None:
+        return ZstdCompressor(level=level).compressobj()
+
+    return compressobj(level, DEFLATED, MAX_WBITS | 16)  # * With the gzip header.
+
+
+def create_decompressor(*, encoding: str) -> Any:
+    """
+    Returns an incremental decompressor of `encoding`. Raises `ValueError` when this node cannot decompress `encoding`.
+    """
+    if encoding == HTTP_CONTENT_ENCODING_ZSTD:
+        if ZstdDecompressor is None:
+            raise ValueError("This node cannot decompress zstd payloads.")
+
+        return ZstdDecompressor().decompressobj()
+
+    if encoding == HTTP_CONTENT_ENCODING_GZIP:
+        return decompressobj(MAX_WBITS | 16)
+
+    raise ValueError(f"This node cannot decompress {encoding} payloads.")
+
+
+def compress_payload(*, content: bytes, encoding: str, level: int) -> bytes:
+    compressor: Any = create_compressor(encoding=encoding, level=level)
+    return compressor.compress(content) + compressor.flush()
+
+
+def get_accepted_content_encoding(*, accept_encoding: str) -> str | None:
+    """
+    Returns the preferred encoding of this node from the `Accept-Encoding` of the request, or `None` when it accepts none of them.
+    """
+    accepted_encodings: set[str] = set()
+
+    for each_encoding in accept_encoding.split(","):
+        encoding, *parameters = [
+            parameter.strip().lower() for parameter in each_encoding.split(";")
+        ]
+
+        if "q=0" not in parameters:
+            accepted_encodings.add(encoding)
+
+    for each_supported_encoding in get_supported_content_encodings():
+        if each_supported_encoding in accepted_encodings:
+            return each_supported_encoding
+
+    return None
+
+
+class HTTPCompressionResponder:
+    """
+    - Compresses the body of a response under `encoding`, as it was sent by the application.
+    - The response is held until its first body, wherein a response that is below `minimum_size` or is already encoded is sent as-is.
+    """
+
+    def __init__(
+        self, *, send: Send, encoding: str, level: int, minimum_size: int
+    ) -> None:
+        self.send: Send = send
+        self.encoding: str = encoding
+        self.level: int = level
+        self.minimum_size: int = minimum_size
+        self.start_message: Message | None = None
+        self.compressor: Any = None  # * Resolved on the first body.
+        self.is_passthrough: bool = False
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            return
+
+        if message["type"] != "http.response.body" or self.is_passthrough:
+            await self.send(message)
+            return
+
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+
+        if self.start_message is not None:
+            start_message: Message = self.start_message
+            self.start_message = None
+            headers: MutableHeaders = MutableHeaders(raw=start_message["headers"])
+
+            if "content-encoding" in headers or (
+                not more_body and len(body) < self.minimum_size
+            ):
+                self.is_passthrough = True
+                await self.send(start_message)
+                await self.send(message)
+                return
+
+            self.compressor = create_compressor(
+                encoding=self.encoding, level=self.level
+            )
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+
+            if "content-length" in headers:
+                del headers["content-length"]
+
+            await self.send(start_message)
+
+        compressed_body: bytes = self.compressor.compress(body)
+
+        if not more_body:
+            compressed_body += self.compressor.flush()
+
+        await self.send(
+            {
+                "type": "http.response.body",
+                "body": compressed_body,
+                "more_body": more_body,
+            }
+        )
+
+
+class HTTPCompressionMiddleware:
+    """
+    - Compresses the responses and decompresses the requests (by their `Content-Encoding`) of the endpoints under `path_prefix`, wherein zstd is preferred over gzip when `zstandard` is installed.
+    - Requests that this node cannot decompress were responded with `415 Unsupported Media Type`, along with the encodings that it accepts, so that the sender can fall back to gzip.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        path_prefix: str,
+        minimum_size: int = HTTP_COMPRESSION_MIN_SIZE_BYTES,
+        gzip_level: int = HTTP_GZIP_COMPRESSION_LEVEL,
+        zstd_level: int = HTTP_ZSTD_COMPRESSION_LEVEL,
+    ) -> None:
+        self.app: ASGIApp = app
+        self.path_prefix: str = path_prefix
+        self.minimum_size: int = minimum_size
+        self.compression_levels: dict[str, int] = {
+            HTTP_CONTENT_ENCODING_GZIP: gzip_level,
+            HTTP_CONTENT_ENCODING_ZSTD: zstd_level,
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        headers: Headers = Headers(scope=scope)
+        request_encoding: str = headers.get("content-encoding", "identity").lower()
+
+        if request_encoding != "identity":
+            if request_encoding not in get_supported_content_encodings():
+                await PlainTextResponse(
+                    content=f"The payload should be encoded as one of the following: {', '.join(get_supported_content_encodings())}.",
+                    headers={
+                        "Accept-Encoding": ", ".join(get_supported_content_encodings())
+                    },
+                    status_code=HTTPStatus.UNSUPPORTED_MEDIA_TYPE,
+                )(scope, receive, send)
+                return
+
+            receive = self.__decompress_receive(
+                receive=receive, encoding=request_encoding
+            )
+
+        response_encoding: str | None = get_accepted_content_encoding(
+            accept_encoding=headers.get("accept-encoding", "")
+        )
+
+        if response_encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        await self.app(
+            scope,
+            receive,
+            HTTPCompressionResponder(
+                send=send,
+                encoding=response_encoding,
+                level=self.compression_levels[response_encoding],
+                minimum_size=self.minimum_size,
+            ),
+        )
+
+    def __decompress_receive(self, *, receive: Receive, encoding: str) -> Receive:
+        decompressor: Any = create_decompressor(encoding=encoding)
+
+        async def decompressed_receive() -> Message:
+            message: Message = await receive()
+
+            if message["type"] == "http.request":
+                body: bytes = decompressor.decompress(message.get("body", b""))
+
+                if not message.get("more_body", False):
+                    body += decompressor.flush()
+
+                message = {**message, "body": body}
+
+            return message
+
+        return decompressed_receive
+
+
 class HTTPClient:
     """
     - This class is just a mini-handler that can be called across the codebase to ensure that there's only one session to be instanted, and only one reference to create and receive requests.
 
     - The only additional features of this implementation is the storage for the requests that is sent off via `create_task()`. It can also await from the create_task via list.
 
+    - Requests were enqueued under an `asyncio.Queue`, wherein the dispatcher only wakes up when there's a request to dispatch. Each request has its own `Future`, which is resolved as soon as its response arrives, waking up the one who awaits it.
+
     ! POST-FEATURE: Database implementation.
     - As of now, my time is too short to implement security features that are specifically side-features.
     """
 
-    def __init__(self) -> None:
-        self._queue: list[Any] = []
-        self._response: RequestPayloadContext = {}
+    def __init__(
+        self,
+        *,
+        max_connections: int = HTTP_MAX_CONNECTIONS,
+        max_connections_per_host: int = HTTP_MAX_CONNECTIONS_PER_HOST,
+        compression_min_size_bytes: int = HTTP_COMPRESSION_MIN_SIZE_BYTES,
+        gzip_compression_level: int = HTTP_GZIP_COMPRESSION_LEVEL,
+        zstd_compression_level: int = HTTP_ZSTD_COMPRESSION_LEVEL,
+    ) -> None:
+        self._queue: Queue[HTTPRequestPayload] = Queue()
+        self._pending: dict[
+            str, HTTPRequestPayload
+        ] = (
+            {}
+        )  # * Requests that are enqueued but not yet dispatched, keyed by their name.
+        self._response: dict[str, Future[ClientResponse]] = {}
         self._is_ready: bool = False
-        self._queue_running: bool = False
+        self._queue_dispatcher: Task | None = None
+
+        # # Concurrency Limits
+        self.max_connections: int = max_connections  # * Requests in-flight at once.
+        self.max_connections_per_host: int = (
+            max_connections_per_host  # * Requests in-flight at once, per host.
+        )
+        self._request_slots: Semaphore = Semaphore(max_connections)
+        self._host_request_slots: dict[str, Semaphore] = {}
+
+        # # Saturation Counters
+        self._requests_in_flight: int = 0
+        self._peak_requests_in_flight: int = 0
+        self._saturated_total: int = (
+            0  # * Requests that waited for a slot from `max_connections`.
+        )
+        self._host_saturated_total: dict[
+            str, int
+        ] = (
+            {}
+        )  # * Requests that waited for a slot from `max_connections_per_host`, per host.
+        self._slot_wait_seconds_total: float = 0.0
+
+        # # Host States
+        self._host_health: dict[
+            str, HTTPHostHealth
+        ] = (
+            {}
+        )  # * The retry budget and the circuit breaker of every host, keyed by its address (`host:port`).
+
+        # # Wire Formats
+        self.compression_min_size_bytes: int = compression_min_size_bytes
+        self.compression_levels: dict[str, int] = {
+            HTTP_CONTENT_ENCODING_GZIP: gzip_compression_level,
+            HTTP_CONTENT_ENCODING_ZSTD: zstd_compression_level,
+        }
+        self._json_only_hosts: set[
+            str
+        ] = (
+            set()
+        )  # * Hosts that responded with `415 Unsupported Media Type` on `msgpack` payloads.
+        self._gzip_only_hosts: set[
+            str
+        ] = (
+            set()
+        )  # * Hosts that responded with `415 Unsupported Media Type` on zstd payloads.
+
+        # # Instrumentation
+        self.metrics: HTTPClientMetrics = HTTPClientMetrics()
+        self._enqueued_at: dict[
+            str, float
+        ] = (
+            {}
+        )  # * The time (`perf_counter`) when each request was enqueued, keyed by their name.
 
     async def initialize(self) -> None:
-        self._session = ClientSession()
-        logger.debug("HTTP client 'ClientSession' were initialized.")
+        # - Reuse the connections per host, the limits of the connector were aligned with the slots of `__run_request`.
+        self._session = ClientSession(
+            connector=TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections_per_host,
+                keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT_SECONDS,
+                ttl_dns_cache=HTTP_DNS_CACHE_TTL_SECONDS,
+            )
+        )
+        logger.debug(
+            f"HTTP client 'ClientSession' were initialized, with {self.max_connections} connection/s at most and {self.max_connections_per_host} connection/s per host."
+        )
 
-        create_task(
+        self._queue_dispatcher = create_task(
             name=f"{HTTPClient.__name__.lower()}_queue_iterator",
             coro=self.__queue_iterator_runtime(),
         )
@@ -65,17 +738,26 @@ class HTTPClient:
         do_not_retry: bool = False,
         name: str | None = None,
         retry_attempts: int = 5,
+        retry_policy: HTTPRetryPolicy | None = None,
         return_on_error: bool = True,
         use_secure_protocol: bool = False,
+        use_binary_format: bool = False,
+        category: HTTPRequestCategory = HTTPRequestCategory.DEFAULT,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        total_timeout: float | None = None,
     ) -> Any:
         """
-        A method that enqueues request payload to the LIFO list container to execute in burst or for the latter.
+        A method that enqueues request payload to the FIFO queue to execute in burst or for the latter.
         ! Docs OUTDATED.
         Args:
                                         - request (URLAddress): The `str` that represents the whole structure of the URL including the protocol, host and port.
                                         - method (HTTPQueueMethods): An enum that contains HTTP methods to classify the request.
-                                        - await_result_immediate (bool, optional): Should this request run under asyncio.create_task() or await them? By doing `await_result_immediate`, it blocks other requests at the LIFO list container as it was prioritized to run first. But you get to have a data to return. Defaults to False.
+                                        - await_result_immediate (bool, optional): Should this request run under asyncio.create_task() or await them? By doing `await_result_immediate`, the response of the request is awaited and returned from this method. Defaults to True.
                                         - name (str, optional): The name of the request. This is required whenever the request is not `await_result_immediate`. Use get_finished_request` to fetch the request.
+                                        - retry_policy (HTTPRetryPolicy, optional): Opts in the request to retry with backoff and jitter under the retry budget and the circuit breaker of its host, instead of retrying `retry_attempts` times for every `HTTP_SLEEP_TO_RETRY_SECONDS`. A request that cannot reach its host returns a `HTTPClientLocalResponse`. Only applies to `await_result_immediate` requests.
+                                        - use_binary_format (bool, optional): Encodes the `data` as `msgpack` when its host accepts it, otherwise as JSON via `orjson`. This lets the `data` contain types such as `datetime` and `Enum` without converting them beforehand. Defaults to False.
+                                        - category (HTTPRequestCategory, optional): The category of the request, wherein the `connect_timeout`, `read_timeout` and `total_timeout` (in seconds) were defaulted from `HTTP_TIMEOUTS_PER_CATEGORY` when not given. A request that exceeds its timeouts is cancelled and returns a `HTTPClientTimeoutResponse`.
 
         Note:
                                         * Despite complexity, I wanted to implement this so that we can query something while needing it later. Aside from stacking request, it is best to have a managing queue to ensure that we get back to them as is.
@@ -130,6 +812,9 @@ class HTTPClient:
             )
 
             if await_result_immediate:
+                logger.critical(
+                    f"This instance is not yet initialized (from: {self.enqueue_request.__name__}). Please execute initialize() first before attempting to enqueue requests that requires to have its data to be returned immediately."
+                )
                 return
 
         if self._response.get(name, None) is not None:
@@ -138,6 +823,12 @@ class HTTPClient:
             )
             return
 
+        (
+            default_connect_timeout,
+            default_read_timeout,
+            default_total_timeout,
+        ) = HTTP_TIMEOUTS_PER_CATEGORY[category]
+
         wrapped_request = HTTPRequestPayload(
             url=url,
             data=data,
@@ -145,78 +836,233 @@ class HTTPClient:
             method=method,
             await_result_immediate=await_result_immediate,
             name=name,
+            category=category,
+            connect_timeout=connect_timeout
+            if connect_timeout is not None
+            else default_connect_timeout,
+            read_timeout=read_timeout
+            if read_timeout is not None
+            else default_read_timeout,
+            total_timeout=total_timeout
+            if total_timeout is not None
+            else default_total_timeout,
+            media_type=self.__get_wire_media_type(url=url)
+            if use_binary_format
+            else None,
         )
 
-        logger.info(
-            f"The following request '{wrapped_request.name}' (requesting to {url}) has been appended from the queue."
-        )
-        self._queue.append(wrapped_request)
+        host_health: HTTPHostHealth = self.__get_host_health(url=url)
+
+        if (
+            retry_policy is not None
+            and retry_policy.use_host_health
+            and await_result_immediate
+            and not host_health.allows_request()
+        ):
+            logger.warning(
+                f"Request '{name}' failed fast, as {urlsplit(url).netloc} has failed for {host_health.consecutive_failures} time/s in a row."
+            )
+            return HTTPClientLocalResponse(
+                url=url,
+                status=HTTPStatus.SERVICE_UNAVAILABLE,
+                reason="The host is unhealthy, the request was not sent.",
+            )
+
+        host_health.record_request()
+        self.__put_request(wrapped_request)
+
+        if not await_result_immediate:
+            return
+
+        logger.debug(f"Await-immediate enabled on the following request '{name}' ...")
+
+        if retry_policy is not None:
+            return await self.__await_request_with_policy(
+                request=wrapped_request,
+                policy=retry_policy,
+                host_health=host_health,
+                return_on_error=return_on_error,
+            )
+
+        request_iterator: int = retry_attempts - 1
+        current_iterator: int = 1
 
-        if await_result_immediate and self._is_ready:
+        while True:
             logger.debug(
-                f"Await-immediate enabled on the following request '{name}' ..."
+                f"Attempt #{current_iterator} | Awaiting response named as `{name}` ..."
             )
 
-            request_iterator: int = (
-                retry_attempts - 1
-            )  # @o Declare here so that, we can break from the inner-while loop (request re-attempt) after executing the outer-while loop (request fetching).
-            current_iterator: int = 1
-            while True:
+            returned_response: ClientResponse | HTTPClientTimeoutResponse | None = (
+                await self.get_finished_request(request_name=name)
+            )
 
-                # - Wait for a millisecond to process the request.
-                await sleep(
-                    HTTP_MICRO_SLEEP_TO_FETCH_REQUEST
-                )  # @o Note that this is not a precise since CPU performance differs from every device.
+            if isinstance(returned_response, ClientResponse) and (
+                returned_response.ok or not returned_response.ok and return_on_error
+            ):
+                return returned_response
 
-                res_req_equiv = self.get_remaining_responses.get(name, None)
+            # - Retrying the request that timed out will only take the same time again, return it so that the caller can move on.
+            if isinstance(returned_response, HTTPClientTimeoutResponse):
+                return returned_response
 
-                logger.debug(
-                    f"Attempt #{current_iterator} | Fetching response named as `{name}` ..."
+            if do_not_retry:
+                logger.warning("Do not retry has been enabled.")
+                break
+
+            if not request_iterator:
+                logger.error(
+                    "The request attempt has been exceeded. There's something wrong with the request. Please try again later."
                 )
+                break
 
-                if res_req_equiv is not None and request_iterator:
-                    returned_response: ClientResponse | None = (
-                        await self.get_finished_request(request_name=name)
-                    )
+            logger.warning(
+                f"Attempt #{current_iterator} | Seems like the following request {wrapped_request.name} has failed or contains nothing. Retrying ... "
+            )
 
-                    if isinstance(returned_response, ClientResponse) and (
-                        returned_response.ok
-                        or not returned_response.ok
-                        and return_on_error
-                    ):
-                        return returned_response
+            request_iterator -= 1
+            current_iterator += 1
+            await sleep(HTTP_SLEEP_TO_RETRY_SECONDS)
 
-                    if not do_not_retry:
-                        logger.warning(
-                            f"Attempt #{current_iterator} | Seems like the following request {wrapped_request.name} has failed or contains nothing. Retrying ... "
-                        )
+            self.metrics.record_retry(url=url)
+            self.__put_request(wrapped_request)
 
-                        self._queue.append(wrapped_request)
-                        request_iterator -= 1
-                        current_iterator += 1
-                        await sleep(HTTP_SLEEP_TO_RETRY_SECONDS)
-                        continue
+    async def __await_request_with_policy(
+        self,
+        *,
+        request: HTTPRequestPayload,
+        policy: HTTPRetryPolicy,
+        host_health: HTTPHostHealth,
+        return_on_error: bool,
+    ) -> ClientResponse | HTTPClientLocalResponse:
+        current_iterator: int = 1
 
-                if request_iterator and not do_not_retry:
-                    logger.error(
-                        f"Attempt #{current_iterator} | Response {name} doesn't exist, for now. Retrying..."
-                    )
-                    continue
+        while True:
+            logger.debug(
+                f"Attempt #{current_iterator} | Awaiting response named as `{request.name}` ..."
+            )
 
-                elif not request_iterator and not do_not_retry:
-                    logger.error(
-                        "The request attempt has been exceeded. There's something wrong with the request. Please try again later."
-                    )
-                else:
-                    logger.warning("Do not retry has been enabled.")
+            returned_response: ClientResponse | HTTPClientTimeoutResponse | None = await self.get_finished_request(
+                request_name=request.name  # type: ignore # ! Name was resolved from `enqueue_request`.
+            )
+
+            if returned_response is not None and (
+                returned_response.ok or return_on_error
+            ):
+                return returned_response
 
+            if not policy.is_retryable(
+                method=request.method, response=returned_response
+            ):
+                logger.warning(
+                    f"Attempt #{current_iterator} | The following request {request.name} has failed and is not retryable."
+                )
                 break
 
-        elif await_result_immediate and not self._is_ready:
-            logger.critical(
-                f"This instance is not yet initialized (from: {self.enqueue_request.__name__}). Please execute initialize() first before attempting to enqueue requests that requires to have its data to be returned immediately."
+            if current_iterator >= policy.max_attempts:
+                logger.error(
+                    f"The request attempt ({policy.max_attempts}) has been exceeded. There's something wrong with the request. Please try again later."
+                )
+                break
+
+            if policy.use_host_health and not host_health.withdraw_retry():
+                logger.error(
+                    f"Attempt #{current_iterator} | The retry budget of {urlsplit(request.url).netloc} has been exhausted, the following request {request.name} will not be retried."
+                )
+                break
+
+            retry_delay: float = policy.get_delay(attempt=current_iterator)
+            logger.warning(
+                f"Attempt #{current_iterator} | Seems like the following request {request.name} has failed or contains nothing. Retrying in {retry_delay:.2f} second/s ..."
+            )
+
+            await sleep(retry_delay)
+
+            if policy.use_host_health and not host_health.allows_request():
+                logger.error(
+                    f"Attempt #{current_iterator} | The following request {request.name} will not be retried, as {urlsplit(request.url).netloc} is unhealthy."
+                )
+                break
+
+            current_iterator += 1
+            self.metrics.record_retry(url=request.url)
+            self.__put_request(request)
+
+        return (
+            returned_response
+            if returned_response is not None
+            else HTTPClientLocalResponse(
+                url=URLAddress(request.url),
+                status=HTTPStatus.SERVICE_UNAVAILABLE,
+                reason="The host cannot be reached.",
+            )
+        )
+
+    def __get_wire_media_type(self, *, url: str) -> str:
+        if (
+            export_to_msgpack is not None
+            and urlsplit(url).netloc not in self._json_only_hosts
+        ):
+            return NODE_WIRE_MSGPACK_MEDIA_TYPE
+
+        return NODE_WIRE_JSON_MEDIA_TYPE
+
+    def __get_content_encoding(self, *, url: str) -> str:
+        if (
+            ZstdCompressor is not None
+            and urlsplit(url).netloc not in self._gzip_only_hosts
+        ):
+            return HTTP_CONTENT_ENCODING_ZSTD
+
+        return HTTP_CONTENT_ENCODING_GZIP
+
+    def __downgrade_wire_format(
+        self,
+        *,
+        request: HTTPRequestPayload,
+        response: ClientResponse,
+        content_encoding: str | None,
+    ) -> bool:
+        request_host: str = urlsplit(request.url).netloc
+        is_downgraded: bool = False
+
+        if (
+            request.media_type == NODE_WIRE_MSGPACK_MEDIA_TYPE
+            and NODE_WIRE_MSGPACK_MEDIA_TYPE not in response.headers.get("Accept", "")
+        ):
+            self._json_only_hosts.add(request_host)
+            request.media_type = NODE_WIRE_JSON_MEDIA_TYPE
+            is_downgraded = True
+
+        # ! The encodings were only returned when the host cannot decompress the payload, otherwise the payload was refused for its media type.
+        if (
+            content_encoding == HTTP_CONTENT_ENCODING_ZSTD
+            and "Accept-Encoding" in response.headers
+            and HTTP_CONTENT_ENCODING_ZSTD not in response.headers["Accept-Encoding"]
+        ):
+            self._gzip_only_hosts.add(request_host)
+            is_downgraded = True
+
+        if is_downgraded:
+            logger.warning(
+                f"{request_host} cannot decode the payload of request '{request.name}', this request and the next requests to this host will be sent as {request.media_type} ({self.__get_content_encoding(url=request.url)} when compressed)."
             )
 
+        return is_downgraded
+
+    def __get_host_health(self, *, url: str) -> HTTPHostHealth:
+        return self._host_health.setdefault(urlsplit(url).netloc, HTTPHostHealth())
+
+    def __put_request(self, request: HTTPRequestPayload) -> None:
+        # - Create the future before the request is dispatched, so that the one who awaits it can do so right away.
+        self._response[request.name] = get_running_loop().create_future()  # type: ignore # ! Name was resolved from `enqueue_request`.
+        self._pending[request.name] = request  # type: ignore
+        self._enqueued_at[request.name] = perf_counter()  # type: ignore
+        self._queue.put_nowait(request)
+
+        logger.info(
+            f"The following request '{request.name}' (requesting to {request.url}) has been appended from the queue."
+        )
+
     async def __queue_iterator_runtime(self) -> None:
         if not self._is_ready:
             logger.warning(
@@ -224,44 +1070,226 @@ class HTTPClient:
             )
             return
 
+        # - Suspend until there's a request to dispatch, nothing runs while the queue is empty.
         while True:
-            if self._queue:
-                create_task(
-                    name=f"{HTTPClient.__name__}_{self.__queue_iterator_runtime.__name__}",
-                    coro=self.__run_request(),
-                )
-            await sleep(0)
+            loaded_request: HTTPRequestPayload = await self._queue.get()
+            self._pending.pop(loaded_request.name, None)  # type: ignore
 
-    async def __run_request(self) -> None:
-        if not self._is_ready:
-            logger.warning(
-                f"You cannot initialize this request executor '{self.__run_request.__name__}' unless this instance's initialize() method has been executed."
+            create_task(
+                name=f"{HTTPClient.__name__.lower()}_{loaded_request.name}_processor",
+                coro=self.__run_request(loaded_request),
             )
+            self._queue.task_done()
+
+    async def __run_request(self, loaded_request: HTTPRequestPayload) -> None:
+        response_future: Future[ClientResponse] | None = self._response.get(
+            loaded_request.name, None  # type: ignore
+        )
+        enqueued_at: float = self._enqueued_at.pop(
+            loaded_request.name, perf_counter()  # type: ignore
+        )
+
+        # - The request was discarded before it was dispatched.
+        if response_future is None or response_future.done():
             return
 
-        for loaded_request in self._queue:
-            requested_item = getattr(self._session, loaded_request.method.name.lower())(
-                url=loaded_request.url,
-                headers=loaded_request.headers,
-                json=loaded_request.data,
+        # - Cancel the request when the one who awaits it has given up.
+        request_task: Task | None = current_task()
+        response_future.add_done_callback(
+            lambda future: request_task.cancel()
+            if future.cancelled() and request_task is not None
+            else None
+        )
+
+        request_host: str = urlsplit(loaded_request.url).netloc
+        host_request_slots: Semaphore = self._host_request_slots.setdefault(
+            request_host, Semaphore(self.max_connections_per_host)
+        )
+
+        dispatched_at: float = perf_counter()  # * Resolved once the slots were taken.
+
+        try:
+            # - Wait for a slot from the host first, so that a saturated host doesn't hold the slots of other hosts.
+            slot_wait_started: float = perf_counter()
+
+            if host_request_slots.locked():
+                self._host_saturated_total[request_host] = (
+                    self._host_saturated_total.get(request_host, 0) + 1
+                )
+                logger.debug(
+                    f"Request '{loaded_request.name}' waits for a connection slot of {request_host}."
+                )
+
+            async with host_request_slots:
+                if self._request_slots.locked():
+                    self._saturated_total += 1
+                    logger.debug(
+                        f"Request '{loaded_request.name}' waits for a connection slot."
+                    )
+
+                async with self._request_slots:
+                    dispatched_at = perf_counter()
+                    self._slot_wait_seconds_total += dispatched_at - slot_wait_started
+                    self.metrics.observe_queue_wait(
+                        url=loaded_request.url, seconds=dispatched_at - enqueued_at
+                    )
+                    self._requests_in_flight += 1
+                    self._peak_requests_in_flight = max(
+                        self._peak_requests_in_flight, self._requests_in_flight
+                    )
+
+                    logger.debug(
+                        f"Unwrapped Request '{loaded_request.name}' (Method: {loaded_request.method.name}, with data: {loaded_request.data}, with headers: {loaded_request.headers}) has been dispatched."
+                    )
+
+                    try:
+                        response: ClientResponse
+                        content_encoding: str | None
+                        response, content_encoding = await self.__send_request(
+                            loaded_request
+                        )
+
+                        # - The host cannot decode the payload, send it again with what it accepts and remember it for the next requests.
+                        if (
+                            response.status == HTTPStatus.UNSUPPORTED_MEDIA_TYPE
+                            and self.__downgrade_wire_format(
+                                request=loaded_request,
+                                response=response,
+                                content_encoding=content_encoding,
+                            )
+                        ):
+                            response.release()
+                            response, _ = await self.__send_request(loaded_request)
+
+                    finally:
+                        self._requests_in_flight -= 1
+
+        except CancelledError:
+            return
+
+        # ! This should be caught first, as the timeout of a read is also a connection error from `aiohttp`.
+        except AsyncTimeoutError:
+            self.__trace_request(
+                request=loaded_request,
+                outcome="timeout",
+                enqueued_at=enqueued_at,
+                dispatched_at=dispatched_at,
             )
-            logger.debug(
-                f"Unwrapped Request '{loaded_request.name}' (Method: {loaded_request.method.name}, with data: {loaded_request.data}, with headers: {loaded_request.headers}) has been generated as a wrapper (to the raw request) to enqueue."
+            self.__get_host_health(url=loaded_request.url).record_failure()
+            logger.error(
+                f"The following request '{loaded_request.name}' has timed out and was cancelled. (Timeouts | Connect: {loaded_request.connect_timeout}, Read: {loaded_request.read_timeout}, Total: {loaded_request.total_timeout})"
             )
 
-            self._response[loaded_request.name] = create_task(
-                name=f"{HTTPClient.__name__.lower()}_{loaded_request.name}_processor",
-                coro=requested_item,
-            )  ## Enqueue to self.request as dict.
+            if not response_future.done():
+                response_future.set_result(
+                    HTTPClientTimeoutResponse(  # type: ignore # ! Resolved as a distinct response.
+                        url=URLAddress(loaded_request.url),
+                        reason="The request has timed out.",
+                    )
+                )
+            return
 
-            ## Dequeue that item from self._queue as its response form has been enqueued from the self._response.
-            self._queue.pop(self._queue.index(loaded_request))
-            logger.debug(
-                f"Async-Task-Wrapped Request '{loaded_request.name}' has been enqueued. | Wrapped Object Info: {requested_item}"
+        except Exception as e:
+            self.__trace_request(
+                request=loaded_request,
+                outcome="error",
+                enqueued_at=enqueued_at,
+                dispatched_at=dispatched_at,
             )
+            self.__get_host_health(url=loaded_request.url).record_failure()
+
+            if not response_future.done():
+                response_future.set_exception(e)
+            return
+
+        self.__trace_request(
+            request=loaded_request,
+            outcome=str(response.status),
+            enqueued_at=enqueued_at,
+            dispatched_at=dispatched_at,
+        )
+
+        if response.status >= HTTPStatus.INTERNAL_SERVER_ERROR:
+            self.__get_host_health(url=loaded_request.url).record_failure()
+        else:
+            self.__get_host_health(url=loaded_request.url).record_success()
+
+        if not response_future.done():
+            response_future.set_result(response)
+        else:
+            response.release()  # * Nobody awaits this response.
+
+    async def __send_request(
+        self, request: HTTPRequestPayload
+    ) -> tuple[ClientResponse, str | None]:
+        """
+        Sends the request, and returns its response along with the `Content-Encoding` of which its payload was compressed with.
+        """
+        request_headers: dict[str, Any] = {**(request.headers or {})}
+        request_body: dict[str, Any] = {"json": request.data}
+        content_encoding: str | None = None
+
+        # - Only streamed responses were decompressed by `iterate_response_lines`, the rest were left to `aiohttp` which cannot decompress zstd.
+        if request.category is HTTPRequestCategory.CHAIN_PULL:
+            request_headers["Accept-Encoding"] = ", ".join(
+                get_supported_content_encodings()
+            )
+
+        if request.media_type is not None:
+            encoded_data: bytes = export_to_wire_format(
+                data=request.data, media_type=request.media_type
+            )
+            request_headers["Content-Type"] = request.media_type
+
+            if len(encoded_data) >= self.compression_min_size_bytes:
+                content_encoding = self.__get_content_encoding(url=request.url)
+                encoded_data = compress_payload(
+                    content=encoded_data,
+                    encoding=content_encoding,
+                    level=self.compression_levels[content_encoding],
+                )
+                request_headers["Content-Encoding"] = content_encoding
+
+            request_body = {"data": encoded_data}
+
+        response: ClientResponse = await getattr(
+            self._session, request.method.name.lower()
+        )(
+            url=request.url,
+            headers=request_headers,
+            timeout=ClientTimeout(
+                total=request.total_timeout,
+                sock_connect=request.connect_timeout,
+                sock_read=request.read_timeout,
+            ),
+            **request_body,
+        )
+
+        return response, content_encoding
+
+    def __trace_request(
+        self,
+        *,
+        request: HTTPRequestPayload,
+        outcome: str,
+        enqueued_at: float,
+        dispatched_at: float,
+    ) -> None:
+        resolved_at: float = perf_counter()
+        self.metrics.observe_response(
+            url=request.url, outcome=outcome, seconds=resolved_at - dispatched_at
+        )
 
-    async def get_finished_request(self, *, request_name: str) -> ClientResponse | None:
-        fetched_request: Any = self._response.get(request_name, None)
+        logger.debug(
+            f"Trace | Request '{request.name}' ({request.method.name} {request.url}, as {request.category.name}) resolved as '{outcome}'. (Queue Wait: {dispatched_at - enqueued_at:.4f}s, Latency: {resolved_at - dispatched_at:.4f}s)"
+        )
+
+    async def get_finished_request(
+        self, *, request_name: str
+    ) -> ClientResponse | HTTPClientTimeoutResponse | None:
+        fetched_request: Future[ClientResponse] | None = self._response.get(
+            request_name, None
+        )
 
         if not self._is_ready:
             logger.warning(
@@ -273,7 +1301,7 @@ class HTTPClient:
             logger.info(f"Request '{request_name}' has been fetched.")
             try:
                 if not fetched_request.done():
-                    logger.warning(
+                    logger.debug(
                         f"The following request '{request_name}' is not yet finished! Awaiting ..."
                     )
                     await fetched_request
@@ -305,10 +1333,12 @@ class HTTPClient:
                 return None
 
             finally:
-                self._response.pop(request_name)
-                logger.debug(
-                    f"Request '{request_name}' has been popped from the response queue."
-                )
+                # - Only pop the future that was awaited, as the name may have been re-enqueued while awaiting.
+                if self._response.get(request_name, None) is fetched_request:
+                    self._response.pop(request_name)
+                    logger.debug(
+                        f"Request '{request_name}' has been popped from the response queue."
+                    )
 
             return fetched_request.result()
 
@@ -325,44 +1355,120 @@ class HTTPClient:
             return None
 
     async def close(self, *, should_destroy: bool = False) -> None:
-        while True:
-            if self._response:
-                logger.info(
-                    f"Attempting to %s all ({len(self._response)}) request/s left ..."
-                    % ("finish" if not should_destroy else "destroy")
-                )
-
-                if should_destroy:
-                    _cached = (
-                        self._response.copy()
-                    )  # ! We need to copy the last state to avoid mutation change during iteration.
+        if self._response:
+            logger.info(
+                f"Attempting to %s all ({len(self._response)}) request/s left ..."
+                % ("finish" if not should_destroy else "destroy")
+            )
 
-                    for each_leftout_request in _cached.values():
-                        if self._response.get(each_leftout_request, None) is not None:
+            if should_destroy:
+                for each_leftout_request in self._response.values():
+                    each_leftout_request.cancel()
 
-                            # * Compare the last state with the currently async-mutated dictionary and remove the element if they are still existing, otherwise ignore it.
-                            each_leftout_request.cancel()
-                            self._response.popitem()
-                    break
+                self._response.clear()
+                self._pending.clear()
+                self._enqueued_at.clear()
 
-                continue
+            else:
+                await gather(*self._response.values(), return_exceptions=True)
 
-            break
+        if self._queue_dispatcher is not None:
+            self._queue_dispatcher.cancel()
+            self._queue_dispatcher = None
 
         logger.info("All requests destroyed! HTTP client sessions will close.")
         return await self._session.close()
 
+    async def dump_metrics(self) -> None:
+        """
+        Saves the metrics of this client under the logs folder, so that the instrumentation of this session persists after the node shuts down.
+        """
+        # ! This is a late import as the logs folder was resolved on runtime.
+        from core.constants import NODE_LOGS_FOLDER_NAME
+
+        metrics_file_path: str = f"{NODE_LOGS_FOLDER_NAME}/{datetime.now().strftime(HTTP_METRICS_DUMP_FILENAME_FORMAT)}"
+
+        try:
+            async with aopen(metrics_file_path, "w") as metrics_file_writer:
+                await metrics_file_writer.write(self.get_metrics())
+
+        except OSError as e:
+            logger.error(
+                f"Failed to save the metrics of the HTTP client at '{metrics_file_path}'. | Info: {e}"
+            )
+            return
+
+        logger.info(f"Metrics of the HTTP client were saved at '{metrics_file_path}'.")
+
+    def get_metrics(self) -> str:
+        """
+        Returns the saturation counters of the connection slots, along with the instrumentation of the requests (`HTTPClientMetrics`) under the Prometheus text exposition format.
+        """
+        # ! This is a late import due to `utils.processors` importing this module.
+        from utils.processors import format_prometheus_metric
+
+        return "".join(
+            [
+                format_prometheus_metric(
+                    name="folioblocks_http_requests_in_flight",
+                    kind="gauge",
+                    description="The number of requests that are waiting for their response.",
+                    samples=[({}, self._requests_in_flight)],
+                ),
+                format_prometheus_metric(
+                    name="folioblocks_http_requests_in_flight_peak",
+                    kind="gauge",
+                    description="The highest number of requests that were waiting for their response at once.",
+                    samples=[({}, self._peak_requests_in_flight)],
+                ),
+                format_prometheus_metric(
+                    name="folioblocks_http_requests_queued",
+                    kind="gauge",
+                    description="The number of requests that are not yet dispatched.",
+                    samples=[({}, len(self._pending))],
+                ),
+                format_prometheus_metric(
+                    name="folioblocks_http_connection_limit",
+                    kind="gauge",
+                    description="The number of requests that can be in-flight at once.",
+                    samples=[
+                        ({"scope": "global"}, self.max_connections),
+                        ({"scope": "host"}, self.max_connections_per_host),
+                    ],
+                ),
+                format_prometheus_metric(
+                    name="folioblocks_http_connection_saturated_total",
+                    kind="counter",
+                    description="The number of requests that waited for a connection slot.",
+                    samples=[({"host": "*"}, self._saturated_total)]
+                    + [
+                        ({"host": host}, saturated_total)
+                        for host, saturated_total in self._host_saturated_total.items()
+                    ],
+                ),
+                format_prometheus_metric(
+                    name="folioblocks_http_connection_wait_seconds_total",
+                    kind="counter",
+                    description="The time spent by requests waiting for a connection slot.",
+                    samples=[({}, self._slot_wait_seconds_total)],
+                ),
+                self.metrics.get_metrics(),
+            ]
+        )
+
     def get_current_queue(  # * This is just an extra.
         self, format: HTTPQueueResponseFormat = HTTPQueueResponseFormat.AS_OBJECT
     ) -> HTTPRequestPayload | RequestPayloadContext | bytes | None:
 
-        if self._queue:
+        if self._pending:
+            current_request: HTTPRequestPayload = next(iter(self._pending.values()))
+
             if format is HTTPQueueResponseFormat.AS_DICT:
-                return self._queue[0].dict()
+                return current_request.dict()
             elif format is HTTPQueueResponseFormat.AS_JSON:
-                return self._queue[0].json()
+                return current_request.json()
             else:
-                return self._queue[0]
+                return current_request
         else:
             logger.error("There are no task on queue.")
             return None
@@ -372,12 +1478,50 @@ class HTTPClient:
         return self._is_ready
 
     @property
-    def get_remaining_responses(self) -> RequestPayloadContext:
+    def get_remaining_responses(self) -> dict[str, Future[ClientResponse]]:
         return self._response
 
     @property
-    def get_remaining_enqueued_items(self) -> list[Task]:
-        return self._queue
+    def get_remaining_enqueued_items(self) -> list[HTTPRequestPayload]:
+        return list(self._pending.values())
+
+
+async def iterate_response_lines(response: ClientResponse) -> AsyncIterator[bytes]:
+    """
+    A function that iterates the streamed body of the response per line, without loading the whole body in memory.
+
+    Note:
+    * Chunks were buffered until a line has been completed, since a line (such as a block) may exceed the limit of the `StreamReader.readline()`.
+    * Gzip streams were decompressed by `aiohttp`, while zstd streams were decompressed here.
+    """
+    buffered_line: bytes = b""
+    decompressor: Any = None
+    is_first_chunk: bool = True
+
+    async for each_chunk in response.content.iter_chunked(HTTP_STREAM_CHUNK_SIZE_BYTES):
+        # - Decompress zstd streams, as `aiohttp` passes them as-is. Its frame is checked as well, in case it was decompressed already.
+        if is_first_chunk:
+            is_first_chunk = False
+
+            if response.headers.get(
+                "Content-Encoding", ""
+            ).lower() == HTTP_CONTENT_ENCODING_ZSTD and each_chunk.startswith(
+                HTTP_ZSTD_FRAME_MAGIC_NUMBER
+            ):
+                decompressor = create_decompressor(encoding=HTTP_CONTENT_ENCODING_ZSTD)
+
+        if decompressor is not None:
+            each_chunk = decompressor.decompress(each_chunk)
+
+        buffered_line += each_chunk
+        *completed_lines, buffered_line = buffered_line.split(b"\n")
+
+        for each_line in completed_lines:
+            if each_line:
+                yield each_line
+
+    if buffered_line:
+        yield buffered_line
 
 
 client_session: HTTPClient | None = None
@@ -389,7 +1533,17 @@ def get_http_client_instance() -> HTTPClient:
     logger.debug("Initializing or returning HTTP client instance ...")
 
     if client_session is None:
-        client_session = HTTPClient()
+        # ! This is a late import due to `core.dependencies` importing this module.
+        from core.dependencies import get_args_values
+
+        parsed_args: Namespace = get_args_values()
+        client_session = HTTPClient(
+            max_connections=parsed_args.max_connections,
+            max_connections_per_host=parsed_args.max_connections_per_host,
+            compression_min_size_bytes=parsed_args.compression_threshold,
+            gzip_compression_level=parsed_args.gzip_level,
+            zstd_compression_level=parsed_args.zstd_level,
+        )
         logger.debug(
             "HTTP client instance instantiated! Returning to the requestor ..."
         )
@@ -13,18 +13,20 @@ You should have received a copy of the GNU General Public License along with Fol
 
 import sys
 from argparse import Namespace
-from asyncio import gather, get_event_loop
+from base64 import urlsafe_b64decode
+from asyncio import Event, Lock, Task, create_task, gather, get_event_loop, sleep
 from getpass import getpass
-from hashlib import sha256
+from hashlib import blake2b, sha256
 from http import HTTPStatus
-from json import dump as json_export
 from logging import Logger, getLogger
 from os import _exit
 from os import environ as env
 from os import getpid
 from os import kill as kill_process
+from os import replace as replace_file
 from pathlib import Path
-from secrets import token_hex
+from secrets import token_bytes, token_hex
+from time import monotonic
 
 from aiohttp import ClientResponse
 from blueprint.models import tokens
@@ -62,11 +64,10 @@ else:
 
 from shutil import copyfile as shutil_copyfile
 from shutil import move as shutil_move
-from sqlite3 import Connection, OperationalError, connect
-from typing import Any, Final, Mapping
+from sqlite3 import Connection, DatabaseError, connect
+from typing import Any, BinaryIO, Final, Mapping
 
 from aioconsole import ainput
-from aiofiles import open as aopen
 from blueprint.models import (
     associations,
     consensus_negotiation,
@@ -77,29 +78,56 @@ from blueprint.models import (
 )
 from core.constants import (
     ASYNC_TARGET_LOOP,
+    BLOCKCHAIN_LEGACY_FILE_SIGNATURE,
     BLOCKCHAIN_NAME,
-    BLOCKCHAIN_NODE_JSON_TEMPLATE,
+    BLOCKCHAIN_ROLLING_DIGEST_SEED,
+    CRYPT_FILE_CHUNK_SIZE_BYTES,
+    CRYPT_FILE_KEY_DERIVATION_INFO,
+    CRYPT_FILE_NONCE_PREFIX_LENGTH,
+    CRYPT_FILE_SIGNATURE,
+    CRYPT_FILE_TAG_LENGTH,
+    DATABASE_BUSY_TIMEOUT_MS,
+    DATABASE_CACHE_SIZE_KIB,
+    DATABASE_DELTA_FILENAME_SUFFIX,
+    DATABASE_DELTA_SIGNATURE,
+    DATABASE_MMAP_SIZE_BYTES,
     DATABASE_NAME,
+    DATABASE_PAGE_DIGEST_SIZE,
+    DATABASE_SNAPSHOT_DELTAS_PER_BASE,
     FERNET_KEY_LENGTH,
     SECRET_KEY_LENGTH,
     CredentialContext,
     CryptFileAction,
+    DatabaseProfile,
+    DatabaseSnapshotMode,
     HashedData,
     KeyContext,
     NodeType,
     RawData,
     RuntimeLoopContext,
 )
-from core.dependencies import get_database_instance, store_db_instance
+from core.dependencies import (
+    get_database_instance,
+    get_database_read_instance,
+    store_db_instance,
+    store_db_read_instance,
+)
+from core.persistence import get_persistence_executor_instance
+from cryptography.exceptions import InvalidTag
 from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.hashes import SHA256
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from databases import Database
 from dotenv import find_dotenv, load_dotenv
 from email_validator import EmailNotValidError, EmailSyntaxError, validate_email
+from orjson import dumps as export_to_json
+from orjson import loads as import_raw_json_to_dict
 from passlib.context import CryptContext
 from sqlalchemy import create_engine, func, select
 from sqlalchemy.sql.expression import ClauseElement, Delete, Insert, Select
 
-from utils.http import get_http_client_instance
+from utils.http import HTTPRetryPolicy, get_http_client_instance
 
 logger: Logger = getLogger(ASYNC_TARGET_LOOP)
 
@@ -139,7 +167,8 @@ async def crypt_file(
     ignore_error: bool = False,
 ) -> bytes | str | None:
     """
-    A Non-async function that processes a file with `to` under `filename` that uses `key` for decrypt and encrypt processes. This function exists for providing anti-redundancy over calls for preparing the files that has to be initialized for the session. This function is not compatible during async process, please refer to the acrypt_file for the implementation of async version.
+    A function that processes a file with `to` under `filename` that uses `key` for decrypt and encrypt processes. This function exists for providing anti-redundancy over calls for preparing the files that has to be initialized for the session.
+    The file is streamed by `stream_crypt_file`, wherein `enable_async` runs it from the persistence executor instead of the event loop.
     """
 
     if not isinstance(process, CryptFileAction):
@@ -148,15 +177,6 @@ async def crypt_file(
             early=True,
         )
 
-    processed_content: bytes = b""
-    crypt_context: Fernet | None = None
-    file_content: str | bytes = ""
-
-    # Open the file first.
-    file_content = await process_crpyt_file(
-        is_async=enable_async, filename=filename, mode="rb"
-    )
-
     try:
         logger.debug(
             f"{'Async: ' if enable_async else ''}{'Decrypting' if process == CryptFileAction.TO_DECRYPT else 'Encrypting'} a context ..."
@@ -167,25 +187,25 @@ async def crypt_file(
                     message="Decryption operation cannot continue due to not having a key."
                 )
 
-            crypt_context = Fernet(key.encode("utf-8") if isinstance(key, str) else key)
-
         else:
             if key is None:
                 key = Fernet.generate_key()
 
-            crypt_context = Fernet(key)
+        resolved_key: bytes = key.encode("utf-8") if isinstance(key, str) else key
 
-        processed_content = getattr(
-            crypt_context,
-            "decrypt" if process == CryptFileAction.TO_DECRYPT else "encrypt",
-        )(file_content)
-
-        # Then write to the file for the final effect.
-        await process_crpyt_file(
-            content_to_write=processed_content,
-            filename=filename,
-            is_async=enable_async,
-            mode="wb",
+        # - The file is processed in-place, wherein the file is only replaced when the whole file has been processed.
+        file_hash: str = (
+            await get_persistence_executor_instance().run(
+                "decrypt_file"
+                if process == CryptFileAction.TO_DECRYPT
+                else "encrypt_file",
+                stream_crypt_file,
+                filename=filename,
+                key=resolved_key,
+                process=process,
+            )
+            if enable_async
+            else stream_crypt_file(filename=filename, key=resolved_key, process=process)
         )
 
         logger.info(
@@ -196,19 +216,9 @@ async def crypt_file(
             return key
 
         elif not return_key and return_file_hash:
-            _file_content: bytes | str = (
-                file_content
-                if process == CryptFileAction.TO_DECRYPT
-                else processed_content
-            )
-
-            if isinstance(_file_content, str):
-                _file_content = _file_content.encode("utf-8")
-
-            if isinstance(_file_content, bytes):
-                return sha256(_file_content).hexdigest()
+            return file_hash
 
-    except InvalidToken:
+    except (InvalidTag, InvalidToken):
 
         if not ignore_error:
             logger.critical(
@@ -222,36 +232,175 @@ async def crypt_file(
         return
 
 
-async def process_crpyt_file(
-    *,
-    is_async: bool,
-    filename: str,
-    mode: Any,  # Cannot import Literals for the aiofiles.mode here.
-    content_to_write: Any = None,
-) -> str | bytes:
-
-    # * In the near future, we can do something about this one.
-    resolved_fn_name: str = "read" if mode == "rb" else "write"
-
-    if is_async:
-        # * I cannot deduce this by DRY.
-        async with aopen(filename, mode) as acontent_buffer:
-            if mode == "wb":
-                file_content: str | bytes = await getattr(
-                    acontent_buffer, resolved_fn_name
-                )(content_to_write)
-            else:
-                file_content = await getattr(acontent_buffer, resolved_fn_name)()
-    else:
-        with open(filename, mode) as content_buffer:
-            if mode == "wb":
-                file_content = getattr(content_buffer, resolved_fn_name)(
-                    content_to_write
+def stream_crypt_file(*, filename: str, key: bytes, process: CryptFileAction) -> str:
+    """
+    A function that encrypts or decrypts the file through fixed-size buffers, wherein the memory used is bounded by `CRYPT_FILE_CHUNK_SIZE_BYTES` regardless of the size of the file.
+    - Files were encrypted as segments of AES-GCM, following a header that starts with `CRYPT_FILE_SIGNATURE`.
+    - Files that were encrypted by Fernet (as a whole) can still be decrypted, and were encrypted by segments from then on.
+
+    Returns:
+        str: The sha256 of the file in its encrypted form.
+    """
+    encrypted_file_hash = sha256()
+    processed_filename: str = f"{filename}.crypt"
+
+    try:
+        with open(filename, "rb") as source_buffer, open(
+            processed_filename, "wb"
+        ) as processed_buffer:
+            if process == CryptFileAction.TO_ENCRYPT:
+                encrypt_file_segments(
+                    source=source_buffer,
+                    destination=processed_buffer,
+                    key=key,
+                    encrypted_file_hash=encrypted_file_hash,
                 )
             else:
-                file_content = getattr(content_buffer, resolved_fn_name)()
+                decrypt_file_segments(
+                    source=source_buffer,
+                    destination=processed_buffer,
+                    key=key,
+                    encrypted_file_hash=encrypted_file_hash,
+                )
+
+        replace_file(processed_filename, filename)
+
+    finally:
+        # - Leave the file as-is when it cannot be processed.
+        Path(processed_filename).unlink(missing_ok=True)
+
+    return encrypted_file_hash.hexdigest()
+
+
+def derive_file_encryption_key(*, key: bytes) -> bytes:
+    return HKDF(
+        algorithm=SHA256(), length=32, salt=None, info=CRYPT_FILE_KEY_DERIVATION_INFO
+    ).derive(urlsafe_b64decode(key))
+
+
+def resolve_segment_nonce(
+    *, nonce_prefix: bytes, segment_idx: int, is_last: bool
+) -> bytes:
+    # - The last segment has its own nonce, so that a file that was truncated on the boundary of a segment cannot be decrypted.
+    return (
+        nonce_prefix
+        + segment_idx.to_bytes(4, "big")
+        + (b"\x01" if is_last else b"\x00")
+    )
+
+
+def encrypt_file_segments(
+    *, source: BinaryIO, destination: BinaryIO, key: bytes, encrypted_file_hash: Any
+) -> None:
+    # - Validate the key before anything else.
+    Fernet(key)
+
+    nonce_prefix: bytes = token_bytes(CRYPT_FILE_NONCE_PREFIX_LENGTH)
+    crypt_file_header: bytes = (
+        CRYPT_FILE_SIGNATURE
+        + CRYPT_FILE_CHUNK_SIZE_BYTES.to_bytes(4, "big")
+        + nonce_prefix
+    )
+    crypt_context: AESGCM = AESGCM(derive_file_encryption_key(key=key))
+
+    destination.write(crypt_file_header)
+    encrypted_file_hash.update(crypt_file_header)
+
+    segment_idx: int = 0
+    chunk: bytes = source.read(CRYPT_FILE_CHUNK_SIZE_BYTES)
+
+    while True:
+        # - Read ahead to know if this chunk is the last, wherein an empty file is still encrypted as one segment.
+        next_chunk: bytes = (
+            source.read(CRYPT_FILE_CHUNK_SIZE_BYTES)
+            if len(chunk) == CRYPT_FILE_CHUNK_SIZE_BYTES
+            else b""
+        )
+
+        encrypted_segment: bytes = crypt_context.encrypt(
+            resolve_segment_nonce(
+                nonce_prefix=nonce_prefix,
+                segment_idx=segment_idx,
+                is_last=not next_chunk,
+            ),
+            chunk,
+            crypt_file_header,
+        )
+
+        destination.write(encrypted_segment)
+        encrypted_file_hash.update(encrypted_segment)
+
+        if not next_chunk:
+            break
+
+        chunk = next_chunk
+        segment_idx += 1
+
+
+def decrypt_file_segments(
+    *, source: BinaryIO, destination: BinaryIO, key: bytes, encrypted_file_hash: Any
+) -> None:
+    crypt_file_header: bytes = source.read(len(CRYPT_FILE_SIGNATURE))
+
+    # - Files that were encrypted by Fernet were decrypted as a whole.
+    if crypt_file_header != CRYPT_FILE_SIGNATURE:
+        logger.warning(
+            "This file was encrypted by Fernet as a whole, it will be encrypted by segments on the next encryption."
+        )
+
+        file_content: bytes = crypt_file_header + source.read()
+        encrypted_file_hash.update(file_content)
+        destination.write(Fernet(key).decrypt(file_content))
+        return
+
+    crypt_file_header += source.read(4 + CRYPT_FILE_NONCE_PREFIX_LENGTH)
+
+    if (
+        len(crypt_file_header)
+        != len(CRYPT_FILE_SIGNATURE) + 4 + CRYPT_FILE_NONCE_PREFIX_LENGTH
+    ):
+        raise InvalidTag
 
-    return file_content
+    encrypted_file_hash.update(crypt_file_header)
+
+    chunk_size: int = int.from_bytes(
+        crypt_file_header[len(CRYPT_FILE_SIGNATURE) : len(CRYPT_FILE_SIGNATURE) + 4],
+        "big",
+    )
+    nonce_prefix: bytes = crypt_file_header[len(CRYPT_FILE_SIGNATURE) + 4 :]
+    segment_size: int = chunk_size + CRYPT_FILE_TAG_LENGTH
+    crypt_context: AESGCM = AESGCM(derive_file_encryption_key(key=key))
+
+    segment_idx: int = 0
+    encrypted_segment: bytes = source.read(segment_size)
+
+    while True:
+        # - A file without the last segment has been truncated.
+        if not encrypted_segment:
+            raise InvalidTag
+
+        next_encrypted_segment: bytes = (
+            source.read(segment_size) if len(encrypted_segment) == segment_size else b""
+        )
+
+        destination.write(
+            crypt_context.decrypt(
+                resolve_segment_nonce(
+                    nonce_prefix=nonce_prefix,
+                    segment_idx=segment_idx,
+                    is_last=not next_encrypted_segment,
+                ),
+                encrypted_segment,
+                crypt_file_header,
+            )
+        )
+        encrypted_file_hash.update(encrypted_segment)
+
+        if not next_encrypted_segment:
+            break
+
+        encrypted_segment = next_encrypted_segment
+        segment_idx += 1
 
 
 def resolve_node_folder_path(
@@ -290,6 +439,78 @@ def resolve_node_folder_path(
 
 # # File Handlers, Cryptography — END
 
+# # File Handlers, Blockchain — START
+def compute_chain_rolling_digest(*, previous_digest: str, block_line: bytes) -> str:
+    """
+    A function that computes the digest of the blockchain file after a block (in a form of a line from the file) has been appended.
+
+    The digest is chained from the digest of the previous state of the file, wherein updating it only costs the bytes of the appended block.
+    """
+    return sha256(previous_digest.encode("utf-8") + block_line).hexdigest()
+
+
+def compute_chain_file_digest(*, filename: str) -> str:
+    """
+    A function that computes the rolling digest of the blockchain file by iterating through each line (block) of the file.
+    """
+    resolved_digest: str = BLOCKCHAIN_ROLLING_DIGEST_SEED
+
+    with open(filename, "rb") as chain_reader:
+        for each_line in chain_reader:
+            each_line = each_line.rstrip(b"\n")
+
+            if each_line:
+                resolved_digest = compute_chain_rolling_digest(
+                    previous_digest=resolved_digest, block_line=each_line
+                )
+
+    return resolved_digest
+
+
+def migrate_legacy_blockchain_file(*, filename: str) -> tuple[str, str] | None:
+    """
+    A function that converts the blockchain file that was written in a single JSON document (`{"chain": [...]}`) to the line-delimited JSON document, where each line is a block.
+
+    Returns:
+        tuple[str, str] | None: Returns the sha256 of the legacy file and the rolling digest of the migrated file. Returns `None` when the file does not need to be migrated.
+    """
+
+    with open(filename, "rb") as legacy_chain_reader:
+        if (
+            not legacy_chain_reader.read(len(BLOCKCHAIN_LEGACY_FILE_SIGNATURE) + 1)
+            .replace(b" ", b"")
+            .startswith(BLOCKCHAIN_LEGACY_FILE_SIGNATURE)
+        ):
+            return None
+
+        legacy_chain_reader.seek(0)
+        legacy_chain_content: bytes = legacy_chain_reader.read()
+
+    logger.warning(
+        f"Blockchain file `{filename}` is a single JSON document, migrating it to a line-delimited JSON document ..."
+    )
+
+    legacy_chain_hash: str = sha256(legacy_chain_content).hexdigest()
+    migrated_digest: str = BLOCKCHAIN_ROLLING_DIGEST_SEED
+
+    with open(filename, "wb") as migrated_chain_writer:
+        for each_block in import_raw_json_to_dict(legacy_chain_content)["chain"]:
+            block_line: bytes = export_to_json(each_block)
+
+            migrated_digest = compute_chain_rolling_digest(
+                previous_digest=migrated_digest, block_line=block_line
+            )
+            migrated_chain_writer.write(block_line + b"\n")
+
+    logger.info(
+        f"Blockchain file has been migrated! | Legacy Hash: {legacy_chain_hash}, Digest: {migrated_digest}"
+    )
+
+    return legacy_chain_hash, migrated_digest
+
+
+# # File Handlers, Blockchain — END
+
 # # File Resource Initializers and Validators, Blockchain and Database — START
 def resolve_resources(*, evaluated_args: Namespace) -> None:
     from core import constants
@@ -435,52 +656,538 @@ def resolve_resources(*, evaluated_args: Namespace) -> None:
     return None
 
 
-async def save_database_state_to_volume_storage() -> None:
+def resolve_database_pragmas(*, profile: DatabaseProfile, read_only: bool) -> list[str]:
     """
-    # A method that saves the state of the database in binary form to the volume-mounted storage.
-    ! This was part of the workaround wherein we load the resource files to the instance to avoid getting database resource lock while accessing them.
-    ? Please see the method `resolved_resources` on how resource files was handled and how the database was specially handled when `Namespace (parsed_args).deploy_mode` is `True`.
+    Returns the pragmas that were applied on every connection of the database under the `profile`.
+    - The journal mode is not included, as it persists on the database file, see `apply_database_journal_mode`.
     """
+    resolved_pragmas: list[str] = []
+
+    if profile is DatabaseProfile.WAL:
+        resolved_pragmas.extend(
+            [
+                f"PRAGMA busy_timeout={DATABASE_BUSY_TIMEOUT_MS}",
+                # - A commit may be lost on a power failure (not when the node crashes), but the database remains consistent under the write-ahead log.
+                "PRAGMA synchronous=NORMAL",
+                f"PRAGMA cache_size=-{DATABASE_CACHE_SIZE_KIB}",
+                f"PRAGMA mmap_size={DATABASE_MMAP_SIZE_BYTES}",
+            ]
+        )
 
-    # - [1] Check first if the volume mounted storage exists.
-    parsed_args: Namespace = get_args_values()
-    volume_path_to_database: Path = resolve_node_folder_path(
-        node_port=parsed_args.node_port, node_role=parsed_args.node_role
+    if read_only:
+        resolved_pragmas.append("PRAGMA query_only=ON")
+
+    return resolved_pragmas
+
+
+class DatabaseConnection(Connection):
+    """
+    The connection factory of the database instances, wherein the pragmas were applied on every connection since the connections were opened per query.
+    """
+
+    read_only: bool = False
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+
+        for each_pragma in resolve_database_pragmas(
+            profile=DatabaseProfile[get_args_values().database_profile],
+            read_only=self.read_only,
+        ):
+            self.execute(each_pragma)
+
+
+class DatabaseReadConnection(DatabaseConnection):
+    read_only: bool = True
+
+
+def apply_database_journal_mode(
+    *, connection: Connection, profile: DatabaseProfile
+) -> None:
+    # - Changing the journal mode requires the database to not have other connections, hence this is only done on startup.
+    connection.execute(
+        f"PRAGMA journal_mode={'WAL' if profile is DatabaseProfile.WAL else 'DELETE'}"
     )
 
-    if not parsed_args.deploy_mode:
-        logger.warning(
-            "Accessed database state saver, but node is not in deployed mode, ignoring it."
+
+def checkpoint_database(*, filename: str) -> None:
+    """
+    A function that merges the write-ahead log (if there's any) to the database file, wherein the database file can be encrypted or copied as a whole.
+    """
+    connection: Connection = connect(filename)
+
+    try:
+        connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    finally:
+        connection.close()
+
+
+def backup_database(*, source: str, destination: str) -> None:
+    """
+    A function that copies the database through the online backup API of SQLite, wherein the copy is consistent even when the database is being written.
+    """
+    Path(destination).unlink(missing_ok=True)
+
+    source_connection: Connection = connect(source)
+    destination_connection: Connection = connect(destination)
+
+    try:
+        source_connection.backup(destination_connection)
+
+    finally:
+        destination_connection.close()
+        source_connection.close()
+
+
+def resolve_database_page_size(*, filename: str) -> int:
+    # - The page size is stored from the 16th byte of the database header, wherein `1` refers to 65536.
+    with open(filename, "rb") as database_reader:
+        database_reader.seek(16)
+        page_size: int = int.from_bytes(database_reader.read(2), "big")
+
+    return 65536 if page_size == 1 else page_size
+
+
+def compute_database_page_digests(*, filename: str, page_size: int) -> list[bytes]:
+    resolved_digests: list[bytes] = []
+
+    with open(filename, "rb") as database_reader:
+        while True:
+            database_page: bytes = database_reader.read(page_size)
+
+            if not database_page:
+                break
+
+            resolved_digests.append(
+                blake2b(database_page, digest_size=DATABASE_PAGE_DIGEST_SIZE).digest()
+            )
+
+    return resolved_digests
+
+
+def write_database_delta(
+    *,
+    source: str,
+    destination: str,
+    page_size: int,
+    page_digests: list[bytes],
+    base_hash: str,
+    sequence: int,
+) -> tuple[list[bytes], int]:
+    """
+    A function that writes the pages of the database (`source`) that were changed from the `page_digests` to the `destination`, wherein the delta is applied on top of the base (`base_hash`) and the deltas before the `sequence`.
+
+    Returns:
+        tuple[list[bytes], int]: Returns the digests of every page of the database and the number of pages that were changed.
+    """
+    resolved_digests: list[bytes] = []
+    changed_pages: int = 0
+    page_count: int = Path(source).stat().st_size // page_size
+
+    with open(source, "rb") as database_reader, open(destination, "wb") as delta_writer:
+        delta_writer.write(
+            DATABASE_DELTA_SIGNATURE
+            + base_hash.encode("utf-8")
+            + sequence.to_bytes(4, "big")
+            + page_size.to_bytes(4, "big")
+            + page_count.to_bytes(4, "big")
         )
-        return
 
-    if not volume_path_to_database.is_dir():
-        unconventional_terminate(
-            message="Did the volume mounted storage disappeared? let the administrators notified from this issue."
+        for page_idx in range(page_count):
+            database_page: bytes = database_reader.read(page_size)
+            page_digest: bytes = blake2b(
+                database_page, digest_size=DATABASE_PAGE_DIGEST_SIZE
+            ).digest()
+
+            resolved_digests.append(page_digest)
+
+            if page_idx >= len(page_digests) or page_digests[page_idx] != page_digest:
+                delta_writer.write(page_idx.to_bytes(4, "big") + database_page)
+                changed_pages += 1
+
+    return resolved_digests, changed_pages
+
+
+def apply_database_delta(
+    *, source: str, destination: str, base_hash: str, sequence: int
+) -> bool:
+    """
+    A function that writes the pages from the delta (`source`) to the database (`destination`). Returns `False` when the delta does not follow the base (`base_hash`) and the deltas before the `sequence`.
+    """
+    with open(source, "rb") as delta_reader:
+        delta_header: bytes = delta_reader.read(
+            len(DATABASE_DELTA_SIGNATURE) + len(base_hash) + 12
         )
-    else:
+        delta_properties: bytes = delta_header[
+            len(DATABASE_DELTA_SIGNATURE) + len(base_hash) :
+        ]
+
+        if (
+            delta_header[: len(DATABASE_DELTA_SIGNATURE)] != DATABASE_DELTA_SIGNATURE
+            or delta_header[
+                len(DATABASE_DELTA_SIGNATURE) : len(DATABASE_DELTA_SIGNATURE)
+                + len(base_hash)
+            ]
+            != base_hash.encode("utf-8")
+            or len(delta_properties) != 12
+            or int.from_bytes(delta_properties[:4], "big") != sequence
+        ):
+            return False
+
+        page_size: int = int.from_bytes(delta_properties[4:8], "big")
+        page_count: int = int.from_bytes(delta_properties[8:], "big")
+
+        with open(destination, "r+b") as database_writer:
+            while True:
+                page_idx: bytes = delta_reader.read(4)
+
+                if not page_idx:
+                    break
+
+                database_writer.seek(int.from_bytes(page_idx, "big") * page_size)
+                database_writer.write(delta_reader.read(page_size))
+
+            database_writer.truncate(page_count * page_size)
+
+    return True
+
+
+class DatabaseSnapshotter:
+    """
+    Coalesces the requests of saving the state of the database to the volume-mounted storage, wherein at most one snapshot was taken per `interval_seconds`.
+    - Every request marks the database as dirty, and the snapshot was taken once the interval since the last snapshot has elapsed.
+    - The worst-case window of changes lost on a crash is `interval_seconds`, in addition to the time it takes to take a snapshot.
+    - Under `DatabaseSnapshotMode.INCREMENTAL`, only the pages that were changed since the previous snapshot were saved (as a delta), and the whole database (as a base) was saved on every `DATABASE_SNAPSHOT_DELTAS_PER_BASE` deltas. See `restore_database_deltas` on how the deltas were replayed.
+    """
+
+    def __init__(self, *, interval_seconds: float, mode: DatabaseSnapshotMode) -> None:
+        self.interval_seconds: float = interval_seconds
+        self.mode: DatabaseSnapshotMode = mode
+        self.requests_coalesced: int = (
+            0  # * The number of requests since the last snapshot.
+        )
+        self.snapshots_taken: int = 0
+
+        self._dirty_event: Event = Event()
+        self._snapshot_lock: Lock = (
+            Lock()
+        )  # * Ensures that one snapshot was taken at a time.
+        self._last_snapshot_at: float = 0.0
+        self._task: Task | None = None
+
+        # # Incremental Snapshots
+        self._base_hash: str | None = None  # * The sha256 of the encrypted base from the volume-mounted storage, which the deltas refer to.
+        self._page_digests: list[
+            bytes
+        ] = []  # * The digests of every page of the database from the last snapshot.
+        self._page_size: int = 0
+        self._delta_sequence: int = 0  # * The deltas saved since the base.
+
+    def mark_dirty(self) -> None:
+        self.requests_coalesced += 1
+        self._dirty_event.set()
+
+        # - Start the snapshotter lazily, as it was only needed when the node has been deployed.
+        if self._task is None or self._task.done():
+            self._task = create_task(self._run(), name="database_snapshotter")
+
+    async def _run(self) -> None:
+        while True:
+            await self._dirty_event.wait()
+
+            # - Wait for the rest of the interval, wherein every request within it were saved by the same snapshot.
+            await sleep(
+                max(0.0, self.interval_seconds - (monotonic() - self._last_snapshot_at))
+            )
+            await self.flush()
+
+    async def flush(self) -> None:
+        """
+        Takes the snapshot immediately when there are changes that were not yet saved.
+        """
+        async with self._snapshot_lock:
+            if not self._dirty_event.is_set():
+                return
+
+            # - Clear before taking the snapshot, so that the changes made during the snapshot were saved by the next one.
+            self._dirty_event.clear()
+            requests_coalesced: int = self.requests_coalesced
+            self.requests_coalesced = 0
+
+            try:
+                await self._take_snapshot()
+
+            except Exception as e:
+                # - Retry on the next interval, since the changes were not saved.
+                # @o The next snapshot is a base, as the deltas may no longer follow the volume-mounted storage.
+                self.requests_coalesced += requests_coalesced
+                self._dirty_event.set()
+                self._base_hash = None
+                logger.error(
+                    f"Cannot save the database instance to the volume-mounted storage, retrying after {self.interval_seconds} second/s. | Info: {e}"
+                )
+
+            else:
+                self.snapshots_taken += 1
+                logger.debug(
+                    f"Database snapshot #{self.snapshots_taken} saved {requests_coalesced} request/s."
+                )
+
+            finally:
+                self._last_snapshot_at = monotonic()
+
+    async def close(self) -> None:
+        """
+        Stops the snapshotter and saves the changes that were not yet saved.
+        """
+        # - Wait for the snapshot in progress (if there's any) before stopping.
+        async with self._snapshot_lock:
+            if self._task is not None:
+                self._task.cancel()
+
+        if self._task is not None:
+            await gather(self._task, return_exceptions=True)
+            self._task = None
+
+        await self.flush()
+
+    async def _take_snapshot(self) -> None:
+        # - [1] Check first if the volume mounted storage exists.
+        parsed_args: Namespace = get_args_values()
+        volume_path_to_database: Path = resolve_node_folder_path(
+            node_port=parsed_args.node_port, node_role=parsed_args.node_role
+        )
+
+        if not volume_path_to_database.is_dir():
+            unconventional_terminate(
+                message="Did the volume mounted storage disappeared? let the administrators notified from this issue."
+            )
+            return
+
         # - [2] When valid, then process the current state of the database.
         TEMP_DATABASE_FILE: Final[str] = DATABASE_RAW_PATH + ".bak"
 
-        # - [2.1] Copy the database instance file in a new name by appending 'bak' extension on it.
-        shutil_copyfile(DATABASE_RAW_PATH, TEMP_DATABASE_FILE, follow_symlinks=False)
+        try:
+            # - [2.1] Copy the database instance file in a new name by appending 'bak' extension on it.
+            await get_persistence_executor_instance().run(
+                "backup_database",
+                backup_database,
+                source=DATABASE_RAW_PATH,
+                destination=TEMP_DATABASE_FILE,
+            )
+
+            page_size: int = resolve_database_page_size(filename=TEMP_DATABASE_FILE)
+
+            if (
+                self.mode is DatabaseSnapshotMode.INCREMENTAL
+                and self._base_hash is not None
+                and self._page_size == page_size
+                and self._delta_sequence < DATABASE_SNAPSHOT_DELTAS_PER_BASE
+            ):
+                await self._save_delta(
+                    filename=TEMP_DATABASE_FILE,
+                    page_size=page_size,
+                    volume_path=volume_path_to_database,
+                    key=parsed_args.key_file[0],
+                )
+            else:
+                await self._save_base(
+                    filename=TEMP_DATABASE_FILE,
+                    page_size=page_size,
+                    volume_path=volume_path_to_database,
+                    key=parsed_args.key_file[0],
+                )
+
+        finally:
+            Path(TEMP_DATABASE_FILE).unlink(missing_ok=True)
+
+    async def _save_base(
+        self, *, filename: str, page_size: int, volume_path: Path, key: KeyContext
+    ) -> None:
+        page_digests: list[bytes] = (
+            await get_persistence_executor_instance().run(
+                "digest_database_pages",
+                compute_database_page_digests,
+                filename=filename,
+                page_size=page_size,
+            )
+            if self.mode is DatabaseSnapshotMode.INCREMENTAL
+            else []
+        )
 
         # - [2.2] Encrypt the new file.
-        await crypt_file(
-            filename=TEMP_DATABASE_FILE,
-            key=parsed_args.key_file[0],
+        base_hash: str | bytes | None = await crypt_file(
+            filename=filename,
+            key=key,
             enable_async=True,
             process=CryptFileAction.TO_ENCRYPT,
+            return_file_hash=True,
             ignore_error=False,
         )
 
         # - [2.3] Move the new file to the volume.
         # ? This overrides the file from the volume-mounted storage.
-        shutil_move(TEMP_DATABASE_FILE, f"{volume_path_to_database}/{DATABASE_NAME}")
+        await get_persistence_executor_instance().run(
+            "move_database",
+            shutil_move,
+            filename,
+            f"{volume_path}/{DATABASE_NAME}",
+        )
+
+        # - [2.4] Remove the deltas of the previous base, as the new base already contains them.
+        # @o Deltas that were left from a crash were ignored on restore, as they refer to the previous base.
+        for each_delta in volume_path.glob(
+            f"{DATABASE_NAME}{DATABASE_DELTA_FILENAME_SUFFIX}.*"
+        ):
+            each_delta.unlink(missing_ok=True)
+
+        self._base_hash = base_hash if isinstance(base_hash, str) else None
+        self._page_digests = page_digests
+        self._page_size = page_size
+        self._delta_sequence = 0
 
         logger.info("Database instance has been saved to the volume-mounted storage.")
 
-    return None
+    async def _save_delta(
+        self, *, filename: str, page_size: int, volume_path: Path, key: KeyContext
+    ) -> None:
+        TEMP_DELTA_FILE: Final[str] = filename + DATABASE_DELTA_FILENAME_SUFFIX
+
+        try:
+            page_digests, changed_pages = await get_persistence_executor_instance().run(
+                "write_database_delta",
+                write_database_delta,
+                source=filename,
+                destination=TEMP_DELTA_FILE,
+                page_size=page_size,
+                page_digests=self._page_digests,
+                base_hash=self._base_hash,
+                sequence=self._delta_sequence + 1,
+            )
+
+            if not changed_pages and len(page_digests) == len(self._page_digests):
+                logger.debug(
+                    "Database instance has no changed pages since the last snapshot."
+                )
+                return
+
+            await crypt_file(
+                filename=TEMP_DELTA_FILE,
+                key=key,
+                enable_async=True,
+                process=CryptFileAction.TO_ENCRYPT,
+                ignore_error=False,
+            )
+
+            await get_persistence_executor_instance().run(
+                "move_database_delta",
+                shutil_move,
+                TEMP_DELTA_FILE,
+                f"{volume_path}/{DATABASE_NAME}{DATABASE_DELTA_FILENAME_SUFFIX}.{self._delta_sequence + 1:06d}",
+            )
+
+        finally:
+            Path(TEMP_DELTA_FILE).unlink(missing_ok=True)
+
+        self._page_digests = page_digests
+        self._delta_sequence += 1
+
+        logger.info(
+            f"Database instance has been saved to the volume-mounted storage as delta #{self._delta_sequence}. ({changed_pages} changed page/s)"
+        )
+
+
+async def restore_database_deltas(*, base_hash: str, key: KeyContext) -> None:
+    """
+    Replays the deltas from the volume-mounted storage, in sequence, on the (decrypted) database that was restored from the base (`base_hash`). Deltas that do not follow the base, as well as the deltas after them, were ignored.
+    """
+    parsed_args: Namespace = get_args_values()
+    volume_path_to_database: Path = resolve_node_folder_path(
+        node_port=parsed_args.node_port, node_role=parsed_args.node_role
+    )
+    TEMP_DELTA_FILE: Final[str] = DATABASE_RAW_PATH + DATABASE_DELTA_FILENAME_SUFFIX
+    delta_sequence: int = 1
+
+    try:
+        while True:
+            volume_delta_file: Path = Path(
+                f"{volume_path_to_database}/{DATABASE_NAME}{DATABASE_DELTA_FILENAME_SUFFIX}.{delta_sequence:06d}"
+            )
+
+            if not volume_delta_file.is_file():
+                break
+
+            await get_persistence_executor_instance().run(
+                "copy_database_delta",
+                shutil_copyfile,
+                volume_delta_file,
+                TEMP_DELTA_FILE,
+                follow_symlinks=False,
+            )
+
+            if await crypt_file(
+                filename=TEMP_DELTA_FILE,
+                key=key,
+                enable_async=True,
+                process=CryptFileAction.TO_DECRYPT,
+                return_file_hash=True,
+                ignore_error=True,
+            ) is None or not await get_persistence_executor_instance().run(
+                "apply_database_delta",
+                apply_database_delta,
+                source=TEMP_DELTA_FILE,
+                destination=DATABASE_RAW_PATH,
+                base_hash=base_hash,
+                sequence=delta_sequence,
+            ):
+                logger.warning(
+                    f"Database delta #{delta_sequence} does not follow the database from the volume-mounted storage, ignoring it and the deltas after it."
+                )
+                break
+
+            delta_sequence += 1
+
+    finally:
+        Path(TEMP_DELTA_FILE).unlink(missing_ok=True)
+
+    if delta_sequence > 1:
+        logger.info(
+            f"{delta_sequence - 1} database delta/s has been replayed from the volume-mounted storage."
+        )
+
+
+async def save_database_state_to_volume_storage() -> None:
+    """
+    # A method that saves the state of the database in binary form to the volume-mounted storage.
+    ! This was part of the workaround wherein we load the resource files to the instance to avoid getting database resource lock while accessing them.
+    ? Please see the method `resolved_resources` on how resource files was handled and how the database was specially handled when `Namespace (parsed_args).deploy_mode` is `True`.
+    * The snapshot is not taken immediately, see `DatabaseSnapshotter` on how the requests were coalesced.
+    """
+
+    # - Snapshots were only taken when the node is deployed, wherein the volume mounted storage exists.
+    if not get_args_values().deploy_mode:
+        logger.warning(
+            "Accessed database state saver, but node is not in deployed mode, ignoring it."
+        )
+        return
+
+    get_database_snapshotter_instance().mark_dirty()
+
+
+database_snapshotter: DatabaseSnapshotter | None = None
+
+
+def get_database_snapshotter_instance() -> DatabaseSnapshotter:
+    global database_snapshotter
+
+    if database_snapshotter is None:
+        database_snapshotter = DatabaseSnapshotter(
+            interval_seconds=get_args_values().database_snapshot_interval,
+            mode=DatabaseSnapshotMode[get_args_values().database_snapshot_mode],
+        )
+
+    return database_snapshotter
 
 
 async def process_resources_and_return_db_context(
@@ -506,7 +1213,12 @@ async def process_resources_and_return_db_context(
     from core import constants
 
     logger.info("Initializing a database ...")
-    db_instance: Database = Database(constants.DATABASE_URL_PATH, factory=Connection)
+    db_instance: Database = Database(
+        constants.DATABASE_URL_PATH, factory=DatabaseConnection
+    )
+    db_read_instance: Database = Database(
+        constants.DATABASE_URL_PATH, factory=DatabaseReadConnection
+    )
     sql_engine = create_engine(
         constants.DATABASE_URL_PATH,
         connect_args={"check_same_thread": False, "timeout": 15},
@@ -528,19 +1240,38 @@ async def process_resources_and_return_db_context(
             con: Connection | None = None
 
             logger.info("Decrypting the database ...")
-            await crypt_file(
+            database_file_hash: str | bytes | None = await crypt_file(
                 filename=constants.DATABASE_RAW_PATH,
                 key=auth_key,
                 process=CryptFileAction.TO_DECRYPT,
+                return_file_hash=True,
                 ignore_error=True,
             )
 
+            # - The database was closed (encrypted) as a whole, hence the write-ahead log left beside it belongs to another state of the database and should not be replayed.
+            if isinstance(database_file_hash, str):
+                for each_suffix in ["-wal", "-shm"]:
+                    Path(f"{constants.DATABASE_RAW_PATH}{each_suffix}").unlink(
+                        missing_ok=True
+                    )
+
+            # - The database from the volume-mounted storage is a base, replay the deltas that were saved after it.
+            if get_args_values().deploy_mode and isinstance(database_file_hash, str):
+                await restore_database_deltas(
+                    base_hash=database_file_hash, key=auth_key
+                )
+
             try:
                 con = connect(constants.DATABASE_RAW_PATH)
+                apply_database_journal_mode(
+                    connection=con,
+                    profile=DatabaseProfile[get_args_values().database_profile],
+                )
                 store_db_instance(db_instance)
+                store_db_read_instance(db_read_instance)
                 logger.info("Database instance has been saved in-memory.")
 
-            except OperationalError as e:
+            except DatabaseError as e:
                 logger.error(
                     f"Database is potentially corrupted or missing. | Additional Info: {e}"
                 )
@@ -568,7 +1299,6 @@ async def process_resources_and_return_db_context(
             )
             logger.info("Fetched blockchain file content's signature.")
 
-            await db_instance.disconnect()
             # * We need to decrypt the blockchin file first before we do something to it. If we didn't, we are technically reading the encrypted version instead of the exposed version.
 
             await crypt_file(
@@ -579,8 +1309,39 @@ async def process_resources_and_return_db_context(
             )
             logger.info("Blockchain file decrypted.")
 
-            with open(constants.BLOCKCHAIN_RAW_PATH, "rb") as blockchain_content:
-                blockchain_context_hash = sha256(blockchain_content.read()).hexdigest()
+            # - Migrate the blockchain file when it was written in the single JSON document, this only happens once.
+            legacy_chain_migration: tuple[
+                str, str
+            ] | None = migrate_legacy_blockchain_file(
+                filename=constants.BLOCKCHAIN_RAW_PATH
+            )
+
+            if legacy_chain_migration is not None:
+                # @o Only carry the signature over when the legacy file was valid, otherwise let the mismatch be handled below.
+                if legacy_chain_migration[0] == blockchain_retrieved_hash:
+                    blockchain_retrieved_hash = legacy_chain_migration[1]
+
+                    await gather(
+                        db_instance.execute(
+                            file_signatures.update()
+                            .where(file_signatures.c.filename == BLOCKCHAIN_NAME)
+                            .values(hash_signature=blockchain_retrieved_hash)
+                        ),
+                        save_database_state_to_volume_storage(),
+                    )
+                    logger.info(
+                        "Blockchain file content's signature has been updated from the migrated file."
+                    )
+
+            await db_instance.disconnect()
+
+            blockchain_context_hash: str = (
+                await get_persistence_executor_instance().run(
+                    "digest_chain_file",
+                    compute_chain_file_digest,
+                    filename=constants.BLOCKCHAIN_RAW_PATH,
+                )
+            )
 
             if blockchain_context_hash != blockchain_retrieved_hash:
                 # @o Despite mismatched, we can just fetch a new one from the NodeType.MASTER_NODE.
@@ -636,19 +1397,16 @@ async def process_resources_and_return_db_context(
             )
             logger.warning("Temporarily decrypted database to insert signature data.")
 
-            # - Write the initial blockchain file.
-            with open(constants.BLOCKCHAIN_RAW_PATH, "w") as temp_writer:
-                initial_json_context: dict[
-                    str, list[Any]
-                ] = BLOCKCHAIN_NODE_JSON_TEMPLATE
-
-                json_export(initial_json_context, temp_writer)
+            # - Write the initial blockchain file, which contains no blocks (lines).
+            with open(constants.BLOCKCHAIN_RAW_PATH, "wb"):
+                pass
             logger.info("Initial blockchain file has been written.")
 
             # - Even though we already write from the file, we have to look at its decrypted form
             # - As we value its actual content, not the hashed form.
-            with open(constants.BLOCKCHAIN_RAW_PATH, "rb") as chain_temp_reader:
-                raw_blockchain_hash = sha256(chain_temp_reader.read()).hexdigest()
+            raw_blockchain_hash: str = compute_chain_file_digest(
+                filename=constants.BLOCKCHAIN_RAW_PATH
+            )
 
             # - Insert the resulting hash from the database.
             blockchain_hash_query: Insert = file_signatures.insert().values(
@@ -717,6 +1475,7 @@ async def process_resources_and_return_db_context(
             _exit(0)
 
     store_db_instance(db_instance)
+    store_db_read_instance(db_read_instance)
     return db_instance
 
 
@@ -736,6 +1495,9 @@ async def close_resources(*, key: KeyContext) -> None:
 
     db: Database = get_database_instance()
 
+    # - Save the changes that were not yet saved to the volume-mounted storage, before the database gets encrypted.
+    await get_database_snapshotter_instance().close()
+
     logger.warning(
         f"Ensuring encode process of computed hash-signature for the `{BLOCKCHAIN_NAME}`."
     )
@@ -751,6 +1513,14 @@ async def close_resources(*, key: KeyContext) -> None:
 
     logger.warning("Closing database by encryption ...")
     await db.disconnect()  # * Shutdown the database instance.    db.execute()
+    await get_database_read_instance().disconnect()
+
+    # - Merge the write-ahead log to the database file before encrypting it.
+    await get_persistence_executor_instance().run(
+        "checkpoint_database",
+        checkpoint_database,
+        filename=constants.DATABASE_RAW_PATH,
+    )
     await crypt_file(
         filename=constants.DATABASE_RAW_PATH,
         key=key,
@@ -759,6 +1529,8 @@ async def close_resources(*, key: KeyContext) -> None:
     )
     logger.info("Database and blockchain successfully closed and encrypted.")
 
+    get_persistence_executor_instance().close()
+
     supress_exceptions_and_warnings()
     await get_event_loop().shutdown_default_executor()
 
@@ -1018,7 +1790,7 @@ async def contact_master_node(*, master_host: str, master_port: int) -> None:
             url=URLAddress(f"{master_host}:{master_port}/explorer/chain"),
             method=HTTPQueueMethods.GET,
             await_result_immediate=True,
-            retry_attempts=99,
+            retry_policy=HTTPRetryPolicy(max_attempts=99, use_host_health=False),
             return_on_error=False,
             name="contact_master_node",
         )
@@ -1053,6 +1825,69 @@ def mask(data: bytes | int | str) -> str:
     return "*" * len(_data)
 
 
+def format_prometheus_metric(
+    *,
+    name: str,
+    kind: str,
+    description: str,
+    samples: list[tuple[dict[str, str], float]],
+) -> str:
+    """
+    Formats a metric with its samples under the Prometheus text exposition format, wherein each sample is a pair of labels and its value.
+    """
+    metric_lines: list[str] = [f"# HELP {name} {description}", f"# TYPE {name} {kind}"]
+
+    for labels, value in samples:
+        metric_labels: str = ",".join(
+            f'{label}="{label_value}"' for label, label_value in labels.items()
+        )
+        metric_lines.append(
+            f"{name}{{{metric_labels}}} {value}" if labels else f"{name} {value}"
+        )
+
+    return "\n".join(metric_lines) + "\n"
+
+
+def format_prometheus_histogram(
+    *,
+    name: str,
+    description: str,
+    buckets: tuple[float, ...],
+    histograms: list[tuple[dict[str, str], list[int], float, int]],
+) -> str:
+    """
+    Formats a histogram under the Prometheus text exposition format, wherein each histogram is a set of labels, its cumulative count per bucket (from `buckets`), its sum and its count.
+    """
+    metric_lines: list[str] = [
+        f"# HELP {name} {description}",
+        f"# TYPE {name} histogram",
+    ]
+
+    for labels, bucket_counts, histogram_sum, histogram_count in histograms:
+        metric_labels: str = ",".join(
+            f'{label}="{label_value}"' for label, label_value in labels.items()
+        )
+        bucket_labels: str = f"{metric_labels}," if labels else ""
+
+        for bucket, bucket_count in zip(buckets, bucket_counts):
+            metric_lines.append(
+                f'{name}_bucket{{{bucket_labels}le="{bucket}"}} {bucket_count}'
+            )
+
+        metric_lines.append(
+            f'{name}_bucket{{{bucket_labels}le="+Inf"}} {histogram_count}'
+        )
+
+        for suffix, value in (("sum", histogram_sum), ("count", histogram_count)):
+            metric_lines.append(
+                f"{name}_{suffix}{{{metric_labels}}} {value}"
+                if labels
+                else f"{name}_{suffix} {value}"
+            )
+
+    return "\n".join(metric_lines) + "\n"
+
+
 # # Output Filters — END
 
 # # API DRY Handler — START